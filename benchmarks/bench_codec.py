@@ -0,0 +1,193 @@
+"""Encode/decode throughput and memory benchmarks for the SDK Structs.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_codec
+    python -m benchmarks.bench_codec --sizes 1,1000 --fixtures MapResponse --output baseline.json
+    python -m benchmarks.bench_codec --compare baseline.json --threshold 0.2
+
+Everything runs offline with the standard library; timings use ``timeit`` and memory
+figures come from ``tracemalloc`` in a separate pass so tracing does not skew throughput.
+"""
+
+import argparse
+import gc
+import sys
+import timeit
+import tracemalloc
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+import msgspec
+
+from genjipk_sdk.codec import get_codec
+
+from .fixtures import FIXTURES, Fixture
+
+__all__ = (
+    "BenchResult",
+    "main",
+    "run_fixture",
+)
+
+DEFAULT_SIZES = (1, 1_000, 100_000)
+FORMATS = ("json", "msgpack")
+
+
+class BenchResult(msgspec.Struct):
+    """Single benchmark measurement.
+
+    Attributes:
+        fixture: Fixture name.
+        format: Wire format, ``json`` or ``msgpack``.
+        operation: ``encode`` or ``decode``.
+        size: Number of elements in the payload.
+        payload_bytes: Size of the encoded payload.
+        seconds: Best wall time for a single operation.
+        items_per_second: Elements processed per second.
+        allocated_blocks: Memory blocks still alive after the operation.
+        allocated_bytes: Bytes still alive after the operation.
+        peak_bytes: Peak traced memory during the operation.
+    """
+
+    fixture: str
+    format: str
+    operation: str
+    size: int
+    payload_bytes: int
+    seconds: float
+    items_per_second: float
+    allocated_blocks: int
+    allocated_bytes: int
+    peak_bytes: int
+
+    @property
+    def key(self) -> str:
+        """Return a stable identifier for comparing runs."""
+        return f"{self.fixture}/{self.format}/{self.operation}/{self.size}"
+
+
+def _best_time(fn: Callable[[], object], repeat: int) -> float:
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def _trace_memory(fn: Callable[[], object]) -> tuple[int, int, int]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = fn()
+        current, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+        blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+        del result
+    finally:
+        tracemalloc.stop()
+    return blocks, current - base, peak - base
+
+
+def run_fixture(fixture: Fixture, size: int, fmt: str, *, repeat: int = 5) -> list[BenchResult]:
+    """Benchmark encoding and decoding one fixture at one size and format."""
+    codec = get_codec(fixture.type)
+    payload = fixture.build(size)
+    if fmt == "json":
+        encode, decode = codec.encode_json, codec.decode_json
+    else:
+        encode, decode = codec.encode_msgpack, codec.decode_msgpack
+    buf = encode(payload)
+    codec.warm()
+
+    results = []
+    for operation, fn in (("encode", lambda: encode(payload)), ("decode", lambda: decode(buf))):
+        seconds = _best_time(fn, repeat)
+        blocks, allocated, peak = _trace_memory(fn)
+        results.append(
+            BenchResult(
+                fixture=fixture.name,
+                format=fmt,
+                operation=operation,
+                size=size,
+                payload_bytes=len(buf),
+                seconds=seconds,
+                items_per_second=size / seconds,
+                allocated_blocks=blocks,
+                allocated_bytes=allocated,
+                peak_bytes=peak,
+            )
+        )
+    return results
+
+
+def _format_row(result: BenchResult) -> str:
+    return (
+        f"{result.fixture:<30} {result.format:<8} {result.operation:<7} {result.size:>7} "
+        f"{result.payload_bytes:>12,} {result.seconds * 1e6:>12.1f} {result.items_per_second:>14,.0f} "
+        f"{result.allocated_blocks:>10,} {result.peak_bytes:>14,}"
+    )
+
+
+def _compare(results: Sequence[BenchResult], baseline_path: Path, threshold: float) -> list[str]:
+    baseline = {r.key: r for r in msgspec.json.decode(baseline_path.read_bytes(), type=list[BenchResult])}
+    regressions = []
+    for result in results:
+        previous = baseline.get(result.key)
+        if previous is None:
+            continue
+        change = result.items_per_second / previous.items_per_second - 1
+        if change < -threshold:
+            regressions.append(
+                f"{result.key}: {change:+.1%} throughput ({previous.items_per_second:,.0f} -> "
+                f"{result.items_per_second:,.0f} items/s)"
+            )
+    return regressions
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the benchmark suite from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="comma separated list sizes")
+    parser.add_argument("--formats", default=",".join(FORMATS), help="comma separated formats")
+    parser.add_argument("--fixtures", default="", help="comma separated fixture names (default: all)")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repeats; the best run is reported")
+    parser.add_argument("--output", type=Path, help="write results as JSON to this path")
+    parser.add_argument("--compare", type=Path, help="baseline JSON produced by --output")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed throughput drop before failing")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    formats = [fmt for fmt in args.formats.split(",") if fmt]
+    unknown = set(formats) - set(FORMATS)
+    if unknown:
+        parser.error(f"unknown formats: {', '.join(sorted(unknown))}")
+    selected = {name for name in args.fixtures.split(",") if name}
+    fixtures = [fixture for fixture in FIXTURES if not selected or fixture.name in selected]
+
+    print(
+        f"{'fixture':<30} {'format':<8} {'op':<7} {'size':>7} {'bytes':>12} {'us/op':>12} "
+        f"{'items/s':>14} {'blocks':>10} {'peak bytes':>14}"
+    )
+    results: list[BenchResult] = []
+    for fixture in fixtures:
+        for size in sizes:
+            for fmt in formats:
+                for result in run_fixture(fixture, size, fmt, repeat=args.repeat):
+                    print(_format_row(result), flush=True)
+                    results.append(result)
+
+    if args.output:
+        args.output.write_bytes(msgspec.json.format(msgspec.json.encode(results)))
+    if args.compare:
+        regressions = _compare(results, args.compare, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,102 @@
+"""Retained-memory report for large decoded ``CompletionResponse`` lists.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_memory
+    python -m benchmarks.bench_memory --size 1000000 --codes 2000 --users 50000
+
+Rows draw their workshop code and runner names from bounded pools, like real leaderboard
+pages where the same maps and players repeat. Each strategy decodes the same JSON payload
+and reports the bytes still alive afterwards according to ``tracemalloc``.
+"""
+
+import argparse
+import gc
+import random
+import tracemalloc
+from collections.abc import Callable, Sequence
+
+import msgspec
+
+from genjipk_sdk.codec import get_codec
+from genjipk_sdk.completions import CompletionResponse
+from genjipk_sdk.pooling import StringPool
+
+from .fixtures import make_completion
+
+__all__ = (
+    "MemoryResult",
+    "build_payload",
+    "main",
+)
+
+
+class MemoryResult(msgspec.Struct):
+    """Retained memory for one decoding strategy.
+
+    Attributes:
+        strategy: Strategy name.
+        rows: Number of decoded rows.
+        retained_bytes: Bytes still allocated after decoding.
+        bytes_per_row: ``retained_bytes / rows``.
+    """
+
+    strategy: str
+    rows: int
+    retained_bytes: int
+    bytes_per_row: float
+
+
+def build_payload(size: int, *, codes: int, users: int, seed: int = 0) -> bytes:
+    """Encode ``size`` completions whose codes and names come from bounded pools."""
+    rng = random.Random(seed)
+    code_pool = [f"{i:05X}" for i in range(codes)]
+    name_pool = [f"runner{i}" for i in range(users)]
+    rows = []
+    for index in range(size):
+        row = make_completion(rng, index)
+        row.code = rng.choice(code_pool)
+        row.name = rng.choice(name_pool)
+        rows.append(row)
+    return msgspec.json.encode(rows)
+
+
+def _retained(fn: Callable[[], object]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        base, _ = tracemalloc.get_traced_memory()
+        result = fn()
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+        del result
+    finally:
+        tracemalloc.stop()
+    return current - base
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Print the retained-memory report."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=100_000, help="number of completions")
+    parser.add_argument("--codes", type=int, default=500, help="distinct workshop codes")
+    parser.add_argument("--users", type=int, default=10_000, help="distinct runner names")
+    args = parser.parse_args(argv)
+
+    payload = build_payload(args.size, codes=args.codes, users=args.users)
+    codec = get_codec(list[CompletionResponse])
+    codec.warm()
+    strategies: dict[str, Callable[[], object]] = {
+        "plain": lambda: codec.decode_json(payload),
+        "pooled": lambda: codec.decode_json(payload, pool=StringPool()),
+    }
+    print(f"{'strategy':<10} {'rows':>10} {'retained bytes':>16} {'bytes/row':>10}")
+    for strategy, fn in strategies.items():
+        retained = _retained(fn)
+        result = MemoryResult(strategy, args.size, retained, retained / args.size)
+        print(f"{result.strategy:<10} {result.rows:>10,} {result.retained_bytes:>16,} {result.bytes_per_row:>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
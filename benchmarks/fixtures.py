@@ -0,0 +1,360 @@
+"""Deterministic synthetic fixtures for the codec benchmarks."""
+
+import datetime as dt
+import random
+import string
+from collections.abc import Callable
+from typing import get_args
+
+import msgspec
+
+from genjipk_sdk.completions import CompletionResponse
+from genjipk_sdk.difficulties import DIFFICULTY_TO_RANK_MAP, DifficultyAll, DifficultyTop
+from genjipk_sdk.maps import (
+    MapCategory,
+    MapPlaytestResponse,
+    MapResponse,
+    Mechanics,
+    MedalsResponse,
+    MedalType,
+    OverwatchMap,
+    PlaytestStatus,
+    Restrictions,
+)
+from genjipk_sdk.newsfeed import (
+    NewsfeedAnnouncement,
+    NewsfeedArchive,
+    NewsfeedBulkArchive,
+    NewsfeedBulkUnarchive,
+    NewsfeedEvent,
+    NewsfeedFieldChange,
+    NewsfeedGuide,
+    NewsfeedLegacyRecord,
+    NewsfeedLinkedMap,
+    NewsfeedMapEdit,
+    NewsfeedNewMap,
+    NewsfeedPayload,
+    NewsfeedRecord,
+    NewsfeedRole,
+    NewsfeedUnarchive,
+    NewsfeedUnlinkedMap,
+)
+from genjipk_sdk.rank_card import RankCardBadgeSettings, RankCardDifficultiesData, RankCardResponse
+from genjipk_sdk.tags import (
+    OpAlias,
+    OpClaim,
+    OpCreate,
+    OpEdit,
+    OpIncrementUsage,
+    OpPurge,
+    OpRemove,
+    OpRemoveById,
+    OpTransfer,
+    TagOp,
+    TagsMutateRequest,
+)
+from genjipk_sdk.users import CommunityLeaderboardResponse, CreatorFull
+from genjipk_sdk.xp import XpTierTable
+
+__all__ = (
+    "FIXTURES",
+    "Fixture",
+)
+
+_MAP_NAMES: tuple[OverwatchMap, ...] = get_args(OverwatchMap)
+_DIFFICULTIES: tuple[DifficultyAll, ...] = get_args(DifficultyAll)
+_TOP_DIFFICULTIES: tuple[DifficultyTop, ...] = get_args(DifficultyTop)
+_CATEGORIES: tuple[MapCategory, ...] = get_args(MapCategory)
+_MECHANICS: tuple[Mechanics, ...] = get_args(Mechanics)
+_RESTRICTIONS: tuple[Restrictions, ...] = get_args(Restrictions)
+_PLAYTEST_STATUSES: tuple[PlaytestStatus, ...] = get_args(PlaytestStatus)
+_MEDALS: tuple[MedalType, ...] = get_args(MedalType)
+_EPOCH = dt.datetime(2024, 1, 1, tzinfo=dt.UTC)
+# Synthetic tier configuration; only the shape of the rows matters for the benchmarks.
+_TIER_TABLE = XpTierTable(
+    [
+        (main * 5 + sub, f"Tier {main + 1}", f"Tier {main + 1} {suffix}")
+        for main in range(20)
+        for sub, suffix in enumerate(("I", "II", "III", "IV", "V"))
+    ],
+    xp_per_tier=100,
+    tiers_per_prestige=100,
+)
+
+
+def _chance(rng: random.Random, probability: float) -> bool:
+    return rng.random() < probability
+
+
+def _code(rng: random.Random) -> str:
+    return "".join(rng.choices(string.ascii_uppercase + string.digits, k=rng.randint(4, 6)))
+
+
+def _name(rng: random.Random) -> str:
+    return "".join(rng.choices(string.ascii_letters, k=rng.randint(4, 14)))
+
+
+def _url(rng: random.Random) -> str:
+    return f"https://youtu.be/{''.join(rng.choices(string.ascii_letters + string.digits, k=11))}"
+
+
+def _timestamp(rng: random.Random) -> dt.datetime:
+    return _EPOCH + dt.timedelta(seconds=rng.randint(0, 60 * 60 * 24 * 365))
+
+
+def _medals(rng: random.Random) -> MedalsResponse:
+    gold = round(rng.uniform(10, 300), 2)
+    silver = round(gold + rng.uniform(1, 30), 2)
+    bronze = round(silver + rng.uniform(1, 30), 2)
+    return MedalsResponse(gold=gold, silver=silver, bronze=bronze)
+
+
+def make_map(rng: random.Random, index: int) -> MapResponse:
+    """Build a realistic ``MapResponse``."""
+    creators = [
+        CreatorFull(id=rng.randint(10**17, 10**18), is_primary=i == 0, name=_name(rng))
+        for i in range(rng.randint(1, 3))
+    ]
+    playtest = (
+        MapPlaytestResponse(
+            thread_id=rng.randint(10**17, 10**18),
+            vote_average=round(rng.uniform(0, 10), 2),
+            vote_count=rng.randint(0, 10),
+            voters=[rng.randint(10**17, 10**18) for _ in range(rng.randint(0, 5))],
+            verification_id=rng.randint(1, 10**6),
+            initial_difficulty=round(rng.uniform(0, 10), 2),
+            completed=_chance(rng, 0.5),
+        )
+        if _chance(rng, 0.3)
+        else None
+    )
+    return MapResponse(
+        id=index,
+        code=_code(rng),
+        map_name=rng.choice(_MAP_NAMES),
+        category=rng.choice(_CATEGORIES),
+        creators=creators,
+        checkpoints=rng.randint(1, 60),
+        difficulty=rng.choice(_DIFFICULTIES),
+        official=_chance(rng, 0.8),
+        playtesting=rng.choice(_PLAYTEST_STATUSES),
+        archived=_chance(rng, 0.1),
+        hidden=_chance(rng, 0.1),
+        created_at=_timestamp(rng),
+        updated_at=_timestamp(rng),
+        ratings=round(rng.uniform(1, 6), 2),
+        playtest=playtest,
+        guides=[_url(rng) for _ in range(rng.randint(0, 2))],
+        raw_difficulty=round(rng.uniform(0, 9.99), 2),
+        mechanics=rng.sample(_MECHANICS, rng.randint(0, 4)),
+        restrictions=rng.sample(_RESTRICTIONS, rng.randint(0, 3)),
+        description=_name(rng) * rng.randint(0, 8) or None,
+        medals=_medals(rng),
+        title=_name(rng) if _chance(rng, 0.5) else None,
+        time=round(rng.uniform(10, 500), 2),
+        total_results=None,
+    )
+
+
+def make_completion(rng: random.Random, index: int) -> CompletionResponse:
+    """Build a realistic ``CompletionResponse``."""
+    medal = rng.choice((*_MEDALS, None))
+    return CompletionResponse(
+        code=_code(rng),
+        user_id=rng.randint(10**17, 10**18),
+        name=_name(rng),
+        also_known_as=_name(rng) if _chance(rng, 0.3) else None,
+        time=round(rng.uniform(10, 500), 2),
+        screenshot=_url(rng),
+        video=_url(rng) if _chance(rng, 0.5) else None,
+        completion=_chance(rng, 0.2),
+        verified=_chance(rng, 0.9),
+        rank=index + 1,
+        medal=medal,
+        map_name=rng.choice(_MAP_NAMES),
+        difficulty=rng.choice(_DIFFICULTIES),
+        message_id=rng.randint(10**17, 10**18),
+        legacy=_chance(rng, 0.05),
+        legacy_medal=None,
+        suspicious=_chance(rng, 0.01),
+        total_results=None,
+        upvotes=rng.randint(0, 50),
+    )
+
+
+def _payload_factories() -> tuple[Callable[[random.Random], NewsfeedPayload], ...]:
+    return (
+        lambda rng: NewsfeedRecord(
+            code=_code(rng),
+            map_name=rng.choice(_MAP_NAMES),
+            time=round(rng.uniform(10, 500), 2),
+            video=_url(rng),
+            rank_num=rng.randint(1, 100),
+            name=_name(rng),
+            medal=rng.choice((*_MEDALS, None)),
+            difficulty=rng.choice(_DIFFICULTIES),
+        ),
+        lambda rng: NewsfeedNewMap(
+            code=_code(rng),
+            map_name=rng.choice(_MAP_NAMES),
+            difficulty=rng.choice(_DIFFICULTIES),
+            creators=[_name(rng) for _ in range(rng.randint(1, 3))],
+            title=_name(rng),
+        ),
+        lambda rng: NewsfeedArchive(
+            code=_code(rng),
+            map_name=rng.choice(_MAP_NAMES),
+            creators=[_name(rng)],
+            difficulty=rng.choice(_DIFFICULTIES),
+            reason=_name(rng),
+        ),
+        lambda rng: NewsfeedUnarchive(
+            code=_code(rng),
+            map_name=rng.choice(_MAP_NAMES),
+            creators=[_name(rng)],
+            difficulty=rng.choice(_DIFFICULTIES),
+            reason=_name(rng),
+        ),
+        lambda rng: NewsfeedBulkArchive(codes=[_code(rng) for _ in range(rng.randint(1, 10))], reason=_name(rng)),
+        lambda rng: NewsfeedBulkUnarchive(codes=[_code(rng) for _ in range(rng.randint(1, 10))], reason=_name(rng)),
+        lambda rng: NewsfeedGuide(code=_code(rng), guide_url=_url(rng), name=_name(rng)),
+        lambda rng: NewsfeedLegacyRecord(code=_code(rng), affected_count=rng.randint(1, 500), reason=_name(rng)),
+        lambda rng: NewsfeedMapEdit(
+            code=_code(rng),
+            changes=[
+                NewsfeedFieldChange(field="checkpoints", old=rng.randint(1, 30), new=rng.randint(31, 60)),
+                NewsfeedFieldChange(field="difficulty", old=rng.choice(_DIFFICULTIES), new=rng.choice(_DIFFICULTIES)),
+            ],
+            reason=_name(rng),
+        ),
+        lambda rng: NewsfeedRole(user_id=rng.randint(10**17, 10**18), name=_name(rng), added=[_name(rng)]),
+        lambda rng: NewsfeedAnnouncement(
+            title=_name(rng),
+            content=_name(rng) * 10,
+            url=_url(rng),
+            banner_url=_url(rng),
+            thumbnail_url=None,
+            from_discord=_chance(rng, 0.5),
+        ),
+        lambda rng: NewsfeedLinkedMap(
+            official_code=_code(rng), unofficial_code=_code(rng), playtest_id=rng.randint(1, 10**5)
+        ),
+        lambda rng: NewsfeedUnlinkedMap(official_code=_code(rng), unofficial_code=_code(rng), reason=_name(rng)),
+    )
+
+
+_PAYLOAD_FACTORIES = _payload_factories()
+
+
+def make_newsfeed_event(rng: random.Random, index: int) -> NewsfeedEvent:
+    """Build a ``NewsfeedEvent``, cycling through all 13 payload variants."""
+    payload = _PAYLOAD_FACTORIES[index % len(_PAYLOAD_FACTORIES)](rng)
+    return NewsfeedEvent(id=index, timestamp=_timestamp(rng), payload=payload)
+
+
+def make_tag_op(rng: random.Random, index: int) -> TagOp:
+    """Build a tag operation, weighted toward usage increments and edits like a bulk import."""
+    guild_id = rng.randint(1, 5)
+    name = f"tag{rng.randint(0, 500)}"
+    owner = rng.randint(10**17, 10**18)
+    if _chance(rng, 0.5):
+        return OpIncrementUsage(guild_id=guild_id, name=name)
+    if _chance(rng, 0.5):
+        return OpEdit(guild_id=guild_id, name=name, new_content=_name(rng) * 5, owner_id=owner)
+    return rng.choice(
+        (
+            OpCreate(guild_id=guild_id, name=name, content=_name(rng) * 5, owner_id=owner),
+            OpAlias(guild_id=guild_id, new_name=f"alias{index}", old_name=name, owner_id=owner),
+            OpRemove(guild_id=guild_id, name=name, requester_id=owner),
+            OpRemoveById(guild_id=guild_id, tag_id=rng.randint(1, 10**6), requester_id=owner),
+            OpClaim(guild_id=guild_id, name=name, requester_id=owner),
+            OpTransfer(guild_id=guild_id, name=name, new_owner_id=owner + 1, requester_id=owner),
+            OpPurge(guild_id=guild_id, owner_id=owner, requester_id=owner),
+        )
+    )
+
+
+def make_leaderboard_row(rng: random.Random, index: int) -> CommunityLeaderboardResponse:
+    """Build a ``CommunityLeaderboardResponse`` row."""
+    xp_amount = rng.randint(0, 200_000)
+    tier = _TIER_TABLE.tier(xp_amount)
+    return CommunityLeaderboardResponse(
+        user_id=rng.randint(10**17, 10**18),
+        nickname=_name(rng),
+        xp_amount=xp_amount,
+        raw_tier=tier.raw_tier,
+        normalized_tier=tier.normalized_tier,
+        prestige_level=tier.prestige_level,
+        tier_name=tier.main_tier_name,
+        wr_count=rng.randint(0, 50),
+        map_count=rng.randint(0, 30),
+        playtest_count=rng.randint(0, 200),
+        discord_tag=_name(rng),
+        skill_rank=rng.choice(tuple(DIFFICULTY_TO_RANK_MAP.values())),
+        total_results=index,
+    )
+
+
+def make_rank_card(rng: random.Random, index: int) -> RankCardResponse:
+    """Build a ``RankCardResponse``."""
+    difficulties: dict[DifficultyTop, RankCardDifficultiesData] = {
+        difficulty: RankCardDifficultiesData(
+            completed=rng.randint(0, 50),
+            gold=rng.randint(0, 10),
+            silver=rng.randint(0, 10),
+            bronze=rng.randint(0, 10),
+            total=rng.randint(50, 100),
+        )
+        for difficulty in _TOP_DIFFICULTIES
+    }
+    return RankCardResponse(
+        rank_name=rng.choice(tuple(DIFFICULTY_TO_RANK_MAP.values())),
+        nickname=_name(rng),
+        background=rng.choice(("Placeholder", "Hanamura Night", "Winter Wonderland")),
+        total_maps_created=rng.randint(0, 30),
+        total_playtests=rng.randint(0, 200),
+        world_records=rng.randint(0, 50),
+        difficulties=difficulties,
+        avatar_skin=rng.choice(("Overwatch 1", "Oni", "Nomad")),
+        avatar_pose=rng.choice(("Heroic", "Victory", "Wave")),
+        badges=RankCardBadgeSettings(badge_name1=_name(rng), badge_type1="mastery"),
+        xp=rng.randint(0, 200_000),
+        community_rank=_name(rng),
+        prestige_level=rng.randint(0, 10),
+    )
+
+
+def _list_of(factory: Callable[[random.Random, int], object]) -> Callable[[random.Random, int], object]:
+    return lambda rng, size: [factory(rng, i) for i in range(size)]
+
+
+def _tags_mutate_request(rng: random.Random, size: int) -> TagsMutateRequest:
+    return TagsMutateRequest(ops=[make_tag_op(rng, i) for i in range(size)])
+
+
+class Fixture(msgspec.Struct, frozen=True):
+    """A named benchmark fixture.
+
+    Attributes:
+        name: Display name used in reports.
+        type: Type the encoded payload decodes into.
+        factory: Builds a payload holding ``size`` elements from a seeded RNG.
+    """
+
+    name: str
+    type: object
+    factory: Callable[[random.Random, int], object]
+
+    def build(self, size: int, *, seed: int = 0) -> object:
+        """Build a payload with ``size`` elements deterministically."""
+        return self.factory(random.Random(seed), size)
+
+
+FIXTURES: tuple[Fixture, ...] = (
+    Fixture("MapResponse", list[MapResponse], _list_of(make_map)),
+    Fixture("CompletionResponse", list[CompletionResponse], _list_of(make_completion)),
+    Fixture("NewsfeedEvent", list[NewsfeedEvent], _list_of(make_newsfeed_event)),
+    Fixture("TagsMutateRequest", TagsMutateRequest, _tags_mutate_request),
+    Fixture("CommunityLeaderboardResponse", list[CommunityLeaderboardResponse], _list_of(make_leaderboard_row)),
+    Fixture("RankCardResponse", list[RankCardResponse], _list_of(make_rank_card)),
+)
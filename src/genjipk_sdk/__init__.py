@@ -3,29 +3,55 @@ from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as _pkg_version
 
 from . import (
+    archive,
+    assets,
+    catalog,
     change_requests,
+    codec,
+    compact,
     completions,
     difficulties,
     internal,
+    leaderboard,
     logs,
     lootbox,
+    map_diff,
+    map_flags,
     maps,
     newsfeed,
+    pooling,
     rank_card,
+    schema,
+    stream,
+    tag_index,
+    tag_ops,
     users,
     xp,
 )
 
 __all__ = [
+    "archive",
+    "assets",
+    "catalog",
     "change_requests",
+    "codec",
+    "compact",
     "completions",
     "difficulties",
     "internal",
+    "leaderboard",
     "logs",
     "lootbox",
+    "map_diff",
+    "map_flags",
     "maps",
     "newsfeed",
+    "pooling",
     "rank_card",
+    "schema",
+    "stream",
+    "tag_index",
+    "tag_ops",
     "users",
     "xp",
 ]
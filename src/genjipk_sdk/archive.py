@@ -0,0 +1,178 @@
+import mmap
+import os
+import struct
+from collections.abc import Collection, Iterable, Iterator
+from types import TracebackType
+from typing import IO, Literal, Self
+
+from .assets import resolve_deferred_urls
+from .codec import get_codec
+from .newsfeed import NewsfeedEvent, NewsfeedEventType, peek_payload_type
+from .stream import write_ndjson
+
+__all__ = (
+    "ArchiveFormat",
+    "NewsfeedArchiveReader",
+    "write_newsfeed_archive",
+)
+
+ArchiveFormat = Literal["ndjson", "msgpack"]
+
+# Length prefix for msgpack archives: unsigned 32-bit big-endian record size.
+_LENGTH_PREFIX = struct.Struct(">I")
+
+
+class NewsfeedArchiveReader:
+    """Memory-mapped reader for archived ``NewsfeedEvent`` records.
+
+    Two layouts are supported: ``"ndjson"`` (one JSON event per line) and ``"msgpack"``
+    (each MessagePack event preceded by a 4-byte big-endian length). Records are decoded
+    straight from ``memoryview`` slices of the mapping, and filtering by payload type only
+    peeks at ``payload.type`` so skipped events are never fully decoded.
+
+    Example:
+        with NewsfeedArchiveReader("newsfeed-2025.ndjson") as archive:
+            records = list(archive.iter_events(types={"record"}))
+    """
+
+    def __init__(self, path: str | os.PathLike[str], *, format_: ArchiveFormat = "ndjson") -> None:
+        """Open and map the archive at ``path``."""
+        if format_ not in ("ndjson", "msgpack"):
+            raise ValueError(f"Unknown archive format: {format_}")
+        self.format: ArchiveFormat = format_
+        self._file = open(path, "rb")  # noqa: SIM115
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        except BaseException:
+            self._file.close()
+            raise
+        self._view = memoryview(self._mmap) if self._mmap is not None else memoryview(b"")
+
+    def __enter__(self) -> Self:
+        """Return the reader."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close the reader."""
+        self.close()
+
+    def __iter__(self) -> Iterator[NewsfeedEvent]:
+        """Iterate over every event in the archive."""
+        return self.iter_events()
+
+    def close(self) -> None:
+        """Release the mapping and close the file.
+
+        Raises:
+            BufferError: If slices returned by :meth:`iter_raw` are still referenced.
+        """
+        self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def iter_raw(self) -> Iterator[memoryview]:
+        """Yield each encoded record as a zero-copy slice of the mapping.
+
+        Slices are only valid until :meth:`close` and must be released before it.
+        """
+        view = self._view
+        if self.format == "ndjson":
+            data = self._mmap
+            if data is None:
+                return
+            start, size = 0, len(view)
+            while start < size:
+                end = data.find(b"\n", start)
+                if end == -1:
+                    end = size
+                if end > start and not (end - start == 1 and view[start] == ord("\r")):
+                    yield view[start:end]
+                start = end + 1
+        else:
+            offset, size, prefix_size = 0, len(view), _LENGTH_PREFIX.size
+            while offset < size:
+                if offset + prefix_size > size:
+                    raise ValueError("Truncated newsfeed archive record")
+                (length,) = _LENGTH_PREFIX.unpack_from(view, offset)
+                offset += prefix_size
+                if offset + length > size:
+                    raise ValueError("Truncated newsfeed archive record")
+                yield view[offset : offset + length]
+                offset += length
+
+    def iter_events(
+        self,
+        *,
+        types: Collection[NewsfeedEventType] | None = None,
+        defer_urls: bool = False,
+    ) -> Iterator[NewsfeedEvent]:
+        """Decode events from the archive.
+
+        Args:
+            types: Only decode events whose ``payload.type`` is in this collection.
+            defer_urls: Skip derived URL fields; see :func:`~genjipk_sdk.assets.deferred_urls`.
+        """
+        codec = get_codec(NewsfeedEvent)
+        is_msgpack = self.format == "msgpack"
+        decode = codec.decode_msgpack if is_msgpack else codec.decode_json
+        wanted = frozenset(types) if types is not None else None
+        for raw in self.iter_raw():
+            with raw:
+                if wanted is not None and peek_payload_type(raw, msgpack=is_msgpack) not in wanted:
+                    continue
+                event = decode(raw, defer_urls=defer_urls)
+            yield event
+
+    def count(self, *, types: Collection[NewsfeedEventType] | None = None) -> int:
+        """Count events, optionally by payload type, without fully decoding any of them."""
+        is_msgpack = self.format == "msgpack"
+        wanted = frozenset(types) if types is not None else None
+        total = 0
+        for raw in self.iter_raw():
+            with raw:
+                if wanted is None or peek_payload_type(raw, msgpack=is_msgpack) in wanted:
+                    total += 1
+        return total
+
+
+def write_newsfeed_archive(
+    fp: IO[bytes],
+    events: Iterable[NewsfeedEvent],
+    *,
+    format_: ArchiveFormat = "ndjson",
+    resolve_urls: bool = True,
+) -> int:
+    """Append ``events`` to an archive readable by :class:`NewsfeedArchiveReader`.
+
+    Args:
+        fp: Binary file object to append to.
+        events: Events to write.
+        format_: Archive layout.
+        resolve_urls: Compute URL fields left unset by a ``defer_urls`` decode before encoding
+            each event; see :meth:`~genjipk_sdk.codec.Codec.encode_msgpack`.
+
+    Returns:
+        The number of events written.
+    """
+    if format_ == "ndjson":
+        return write_ndjson(fp, events, resolve_urls=resolve_urls)
+    if format_ != "msgpack":
+        raise ValueError(f"Unknown archive format: {format_}")
+    encoder = get_codec(NewsfeedEvent).msgpack_encoder
+    buffer = bytearray(_LENGTH_PREFIX.size)
+    count = 0
+    for event in events:
+        if resolve_urls:
+            resolve_deferred_urls(event)
+        encoder.encode_into(event, buffer, _LENGTH_PREFIX.size)
+        _LENGTH_PREFIX.pack_into(buffer, 0, len(buffer) - _LENGTH_PREFIX.size)
+        fp.write(buffer)
+        count += 1
+    return count
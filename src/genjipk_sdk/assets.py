@@ -0,0 +1,141 @@
+import contextlib
+import functools
+import sys
+from collections.abc import Iterator
+from contextvars import ContextVar
+from typing import Any, Literal, TypeVar, get_args
+
+from msgspec import Struct, structs
+
+from .helpers import sanitize_string
+
+__all__ = (
+    "ASSET_URL_CACHE_SIZE",
+    "REWARD_ASSET_KINDS",
+    "AssetKind",
+    "asset_url",
+    "deferred_urls",
+    "resolve_deferred_urls",
+    "urls_deferred",
+)
+
+T = TypeVar("T")
+
+ASSET_URL_CACHE_SIZE = 8192
+
+AssetKind = Literal["avatar", "background", "coins", "mastery", "pose", "rank", "skin", "spray"]
+
+_ASSET_TEMPLATES: dict[str, str] = {
+    "avatar": "assets/rank_card/avatar/{name}/{variant}.webp",
+    "background": "assets/rank_card/background/{name}.webp",
+    "coins": "assets/rank_card/coins/{name}.webp",
+    "mastery": "assets/mastery/{name}_{variant}.webp",
+    "pose": "assets/rank_card/avatar/overwatch_1/{name}.webp",
+    "rank": "assets/ranks/{name}.webp",
+    "skin": "assets/rank_card/avatar/{name}/heroic.webp",
+    "spray": "assets/rank_card/spray/{name}.webp",
+}
+
+# Lootbox reward types that have a dedicated asset; any other reward type has no URL.
+REWARD_ASSET_KINDS: dict[str, AssetKind] = {
+    "spray": "spray",
+    "skin": "skin",
+    "pose": "pose",
+    "background": "background",
+    "coins": "coins",
+}
+
+
+@functools.lru_cache(maxsize=ASSET_URL_CACHE_SIZE)
+def asset_url(kind: AssetKind | str, name: str | None, variant: str | None = None) -> str:
+    """Build the relative asset URL for ``kind``.
+
+    ``name`` and ``variant`` are sanitized with :func:`sanitize_string`. Results are cached per
+    ``(kind, name, variant)`` and interned, so every model referencing the same asset shares a
+    single string object. Unknown kinds resolve to an empty string.
+
+    Args:
+        kind: Asset family, e.g. ``"avatar"`` or ``"mastery"``.
+        name: Primary asset name (skin, background, map name, ...).
+        variant: Secondary name for kinds that need one (avatar pose, mastery level/medal).
+    """
+    template = _ASSET_TEMPLATES.get(kind)
+    if template is None:
+        return ""
+    return sys.intern(template.format(name=sanitize_string(name), variant=sanitize_string(variant)))
+
+
+_DEFER_URLS: ContextVar[bool] = ContextVar("genjipk_sdk_defer_urls", default=False)
+
+
+@contextlib.contextmanager
+def deferred_urls() -> Iterator[None]:
+    """Skip derived URL fields while decoding inside this block.
+
+    Models with derived URLs (rank cards, rewards, mastery, map banners, new-map newsfeed
+    entries) leave those fields untouched in ``__post_init__`` while the block is active, so
+    they hold whatever the payload carried (usually ``""`` or ``None``). Reading them does not
+    compute them: call the model's ``resolve_urls()`` method, or :func:`resolve_deferred_urls`
+    on the decoded result, first. The SDK encoders and NDJSON/archive writers resolve them by
+    default, so re-encoding a deferred decode produces the same bytes as an eager one.
+    """
+    token = _DEFER_URLS.set(True)
+    try:
+        yield
+    finally:
+        _DEFER_URLS.reset(token)
+
+
+def urls_deferred() -> bool:
+    """Return whether derived URL fields are currently deferred."""
+    return _DEFER_URLS.get()
+
+
+# Struct type -> (whether it defines ``resolve_urls()``, fields that can hold a model that does).
+_URL_PLANS: dict[type[Struct], tuple[bool, tuple[str, ...]]] = {}
+
+
+def _reaches_urls(type_: Any, seen: set[type[Struct]]) -> bool:  # noqa: ANN401
+    if type_ is Any or type_ is object:
+        return True
+    if isinstance(type_, type) and issubclass(type_, Struct):
+        if hasattr(type_, "resolve_urls"):
+            return True
+        if type_ in seen:
+            return False
+        seen.add(type_)
+        return any(_reaches_urls(field.type, seen) for field in structs.fields(type_))
+    return any(_reaches_urls(arg, seen) for arg in get_args(type_))
+
+
+def _url_plan(cls: type[Struct]) -> tuple[bool, tuple[str, ...]]:
+    plan = _URL_PLANS.get(cls)
+    if plan is None:
+        fields = tuple(field.name for field in structs.fields(cls) if _reaches_urls(field.type, set()))
+        plan = _URL_PLANS[cls] = (hasattr(cls, "resolve_urls"), fields)
+    return plan
+
+
+def resolve_deferred_urls(obj: T) -> T:
+    """Compute deferred URL fields on ``obj`` and everything nested inside it.
+
+    Walks Structs, lists, tuples and dict values, calling ``resolve_urls()`` on every model
+    that defines it. Only the fields of a Struct whose types can hold such a model are
+    visited. Returns ``obj`` for convenience.
+    """
+    if isinstance(obj, Struct):
+        resolve, fields = _url_plan(type(obj))
+        if resolve:
+            obj.resolve_urls()  # pyright: ignore[reportAttributeAccessIssue]
+        for name in fields:
+            resolve_deferred_urls(getattr(obj, name))
+        return obj
+    if isinstance(obj, (list, tuple)):
+        children = obj
+    elif isinstance(obj, dict):
+        children = obj.values()
+    else:
+        return obj
+    for child in children:
+        resolve_deferred_urls(child)
+    return obj
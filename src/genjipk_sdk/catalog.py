@@ -0,0 +1,411 @@
+"""In-memory map catalog with secondary indexes.
+
+:class:`MapCatalog` holds ``MapResponse`` objects and answers filtered, sorted and paginated
+listings locally, e.g. "maps on Hanamura, Hard or harder, with Bhop, not archived", instead of
+calling the API for every bot command.
+
+Each filterable attribute has an inverted index from value to the set of map ids carrying it.
+A query intersects the matching id sets, smallest first, so its cost follows the size of the
+most selective filter rather than the catalog. Mechanics and restrictions are kept as one
+bitmask column (see :mod:`genjipk_sdk.map_flags`), tested per candidate or, for broad
+queries, across the whole column at once. Difficulty ranges compare difficulty ordinals (see
+:data:`~genjipk_sdk.difficulties.DIFFICULTY_ALL_INDEX`) unless the range itself is the most
+selective filter. Small result sets are sorted directly; large
+ones are read off a presorted order of the whole catalog that is built on first use and
+discarded on the next mutation.
+"""
+
+from array import array
+from collections.abc import Callable, Collection, Hashable, Iterable, Iterator
+from itertools import chain, islice
+from typing import Any, Literal, Self
+
+from msgspec import Struct
+
+from .difficulties import DIFFICULTY_ALL_INDEX, DifficultyAll, difficulty_range_all
+from .map_flags import encode_mechanics, encode_restrictions, select_by_masks
+from .maps import MapCategory, MapResponse, Mechanics, OverwatchMap, PlaytestStatus, Restrictions
+
+__all__ = (
+    "MapCatalog",
+    "MapCatalogPage",
+    "MapSortKey",
+)
+
+MapSortKey = Literal[
+    "id",
+    "code",
+    "map_name",
+    "difficulty",
+    "raw_difficulty",
+    "ratings",
+    "checkpoints",
+    "created_at",
+    "updated_at",
+]
+
+_IndexName = Literal[
+    "code",
+    "map_name",
+    "difficulty",
+    "category",
+    "creator_id",
+    "archived",
+    "hidden",
+    "official",
+    "playtesting",
+]
+
+_INDEX_KEYS: dict[_IndexName, Callable[[MapResponse], Iterable[Hashable]]] = {
+    "code": lambda m: (m.code,),
+    "map_name": lambda m: (m.map_name,),
+    "difficulty": lambda m: (m.difficulty,),
+    "category": lambda m: (m.category,),
+    "creator_id": lambda m: {creator.id for creator in m.creators},
+    "archived": lambda m: (m.archived,),
+    "hidden": lambda m: (m.hidden,),
+    "official": lambda m: (m.official,),
+    "playtesting": lambda m: (m.playtesting,),
+}
+
+_SORT_KEYS: dict[MapSortKey, Callable[[MapResponse], Any]] = {
+    "id": lambda m: m.id,
+    "code": lambda m: m.code,
+    "map_name": lambda m: m.map_name,
+    "difficulty": lambda m: DIFFICULTY_ALL_INDEX[m.difficulty],
+    "raw_difficulty": lambda m: m.raw_difficulty,
+    "ratings": lambda m: m.ratings,
+    "checkpoints": lambda m: m.checkpoints,
+    "created_at": lambda m: m.created_at,
+    "updated_at": lambda m: m.updated_at,
+}
+
+_Ids = set[int] | frozenset[int]
+
+_EMPTY: frozenset[int] = frozenset()
+
+# Restriction bits sit above the mechanic bits in the catalog's combined flag column.
+_RESTRICTIONS_SHIFT = 32
+
+
+def _flags(map_: MapResponse) -> int:
+    return encode_mechanics(map_.mechanics) | encode_restrictions(map_.restrictions) << _RESTRICTIONS_SHIFT
+
+
+def _mask(values: Iterable[str] | int, encode: Callable[[Iterable[Any]], int]) -> int:
+    # Plain ints: IntFlag operators run in Python and would dominate the per-map checks.
+    return int(values) if isinstance(values, int) else int(encode(values))
+
+
+class MapCatalogPage(Struct):
+    """One page of a :meth:`MapCatalog.query` result.
+
+    Attributes:
+        maps: Maps on this page, in query order.
+        total_results: Number of maps matching the filters, across all pages.
+    """
+
+    maps: list[MapResponse]
+    total_results: int
+
+
+class MapCatalog:
+    """Indexed, in-memory collection of ``MapResponse`` objects keyed by map id.
+
+    Example:
+        catalog = MapCatalog.from_maps(maps)
+        page = catalog.query(
+            map_name="Hanamura",
+            min_difficulty="Hard",
+            mechanics=["Bhop"],
+            archived=False,
+            sort="difficulty",
+            limit=10,
+        )
+    """
+
+    __slots__ = ("_by_code", "_difficulties", "_flags", "_indexes", "_maps", "_orders", "_slot_ids", "_slots")
+
+    def __init__(self) -> None:
+        """Create an empty catalog."""
+        self._maps: dict[int, MapResponse] = {}
+        self._by_code: dict[str, int] = {}
+        self._indexes: dict[_IndexName, dict[Hashable, set[int]]] = {name: {} for name in _INDEX_KEYS}
+        # Parallel columns of map ids, combined mechanics/restrictions masks and difficulty
+        # ordinals, by slot.
+        self._slots: dict[int, int] = {}
+        self._slot_ids = array("q")
+        self._flags = array("Q")
+        self._difficulties = array("b")
+        # Presorted (ids with a value, ids without one) per sort key; cleared on mutation.
+        self._orders: dict[MapSortKey, tuple[list[int], list[int]]] = {}
+
+    @classmethod
+    def from_maps(cls, maps: Iterable[MapResponse]) -> Self:
+        """Build a catalog from ``maps``."""
+        catalog = cls()
+        catalog.extend(maps)
+        return catalog
+
+    def __len__(self) -> int:
+        """Return the number of maps."""
+        return len(self._maps)
+
+    def __contains__(self, code: object) -> bool:
+        """Return whether a map with workshop code ``code`` is in the catalog."""
+        return code in self._by_code
+
+    def __iter__(self) -> Iterator[MapResponse]:
+        """Iterate over the maps in insertion order."""
+        return iter(self._maps.values())
+
+    def get(self, code: str) -> MapResponse | None:
+        """Return the map with workshop code ``code``, if present."""
+        map_id = self._by_code.get(code)
+        return None if map_id is None else self._maps[map_id]
+
+    def get_by_id(self, map_id: int) -> MapResponse | None:
+        """Return the map with database id ``map_id``, if present."""
+        return self._maps.get(map_id)
+
+    def add(self, map_: MapResponse) -> None:
+        """Insert ``map_``, replacing the entry with the same id or workshop code."""
+        self._discard(map_.id)
+        if (previous := self._by_code.get(map_.code)) is not None:
+            self._discard(previous)
+        self._maps[map_.id] = map_
+        self._by_code[map_.code] = map_.id
+        for name, keys in _INDEX_KEYS.items():
+            index = self._indexes[name]
+            for key in keys(map_):
+                index.setdefault(key, set()).add(map_.id)
+        self._slots[map_.id] = len(self._slot_ids)
+        self._slot_ids.append(map_.id)
+        self._flags.append(_flags(map_))
+        self._difficulties.append(DIFFICULTY_ALL_INDEX[map_.difficulty])
+        self._orders.clear()
+
+    def extend(self, maps: Iterable[MapResponse]) -> None:
+        """Insert every map in ``maps``."""
+        for map_ in maps:
+            self.add(map_)
+
+    def remove(self, code: str) -> MapResponse | None:
+        """Remove and return the map with workshop code ``code``, if present."""
+        map_id = self._by_code.get(code)
+        return None if map_id is None else self._discard(map_id)
+
+    def clear(self) -> None:
+        """Remove every map."""
+        self._maps.clear()
+        self._by_code.clear()
+        for index in self._indexes.values():
+            index.clear()
+        self._slots.clear()
+        self._slot_ids = array("q")
+        self._flags = array("Q")
+        self._difficulties = array("b")
+        self._orders.clear()
+
+    def _discard(self, map_id: int) -> MapResponse | None:
+        map_ = self._maps.pop(map_id, None)
+        if map_ is None:
+            return None
+        del self._by_code[map_.code]
+        for name, keys in _INDEX_KEYS.items():
+            index = self._indexes[name]
+            for key in keys(map_):
+                ids = index[key]
+                ids.discard(map_id)
+                if not ids:
+                    del index[key]
+        # Move the last slot into the freed one to keep the columns dense.
+        slot, last = self._slots.pop(map_id), len(self._slot_ids) - 1
+        if slot != last:
+            moved = self._slot_ids[slot] = self._slot_ids[last]
+            self._flags[slot] = self._flags[last]
+            self._difficulties[slot] = self._difficulties[last]
+            self._slots[moved] = slot
+        del self._slot_ids[last], self._flags[last], self._difficulties[last]
+        self._orders.clear()
+        return map_
+
+    def _ids(self, name: _IndexName, keys: Iterable[Hashable]) -> list[_Ids]:
+        """Return the id sets of maps whose ``name`` index holds each of ``keys``."""
+        index = self._indexes[name]
+        return [ids for key in keys if (ids := index.get(key))]
+
+    def query(  # noqa: PLR0913
+        self,
+        *,
+        code: str | Iterable[str] | None = None,
+        map_name: OverwatchMap | Iterable[OverwatchMap] | None = None,
+        difficulty: DifficultyAll | Iterable[DifficultyAll] | None = None,
+        min_difficulty: DifficultyAll | None = None,
+        max_difficulty: DifficultyAll | None = None,
+        category: MapCategory | Iterable[MapCategory] | None = None,
+        creator_id: int | None = None,
+        mechanics: Iterable[Mechanics] | int = (),
+        restrictions: Iterable[Restrictions] | int = (),
+        exclude_mechanics: Iterable[Mechanics] | int = (),
+        exclude_restrictions: Iterable[Restrictions] | int = (),
+        archived: bool | None = None,
+        hidden: bool | None = None,
+        official: bool | None = None,
+        playtesting: PlaytestStatus | Iterable[PlaytestStatus] | None = None,
+        sort: MapSortKey = "id",
+        descending: bool = False,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> MapCatalogPage:
+        """Return the maps matching every given filter, sorted and paginated.
+
+        Filters that accept several values match any of them; all filters must match. Omitted
+        (``None`` or empty) filters match everything.
+
+        Args:
+            code: Workshop code(s).
+            map_name: Overwatch map name(s).
+            difficulty: Exact difficulty value(s).
+            min_difficulty: Lowest difficulty to include, inclusive.
+            max_difficulty: Highest difficulty to include, inclusive.
+            category: Map category(ies).
+            creator_id: Id of one of the map's creators.
+            mechanics: Mechanics the map must all have, as values or a ``MechanicsFlag`` mask.
+            restrictions: Restrictions the map must all have, as values or a ``RestrictionsFlag``
+                mask.
+            exclude_mechanics: Mechanics the map must not have.
+            exclude_restrictions: Restrictions the map must not have.
+            archived: Required ``archived`` flag.
+            hidden: Required ``hidden`` flag.
+            official: Required ``official`` flag.
+            playtesting: Playtest status(es).
+            sort: Attribute to order by; maps without a value (e.g. unrated) always come last and
+                ties are broken by map id.
+            descending: Reverse the order of maps that have a value.
+            offset: Number of matching maps to skip.
+            limit: Maximum number of maps to return; ``None`` returns the rest.
+        """
+        # Each entry is an any-of group of id sets; a map must be in one set of every group.
+        required: list[list[_Ids]] = []
+
+        def add_filter(name: _IndexName, value: Hashable | Iterable[Hashable] | None) -> None:
+            if value is None:
+                return
+            keys = tuple(value) if isinstance(value, Iterable) and not isinstance(value, str) else (value,)
+            if keys:
+                required.append(self._ids(name, keys))
+
+        add_filter("code", code)
+        add_filter("map_name", map_name)
+        add_filter("difficulty", difficulty)
+        add_filter("category", category)
+        add_filter("creator_id", creator_id)
+        add_filter("archived", archived)
+        add_filter("hidden", hidden)
+        add_filter("official", official)
+        add_filter("playtesting", playtesting)
+        bounds: tuple[int, int] | None = None
+        if min_difficulty is not None or max_difficulty is not None:
+            group = self._ids("difficulty", difficulty_range_all(min_difficulty, max_difficulty))
+            if required and sum(map(len, group)) > min(sum(map(len, other)) for other in required):
+                # Cheaper to compare ordinals of the candidates than to union the range.
+                low = 0 if min_difficulty is None else DIFFICULTY_ALL_INDEX[min_difficulty]
+                high = len(DIFFICULTY_ALL_INDEX) - 1 if max_difficulty is None else DIFFICULTY_ALL_INDEX[max_difficulty]
+                bounds = (low, high)
+            else:
+                required.append(group)
+        all_of = _mask(mechanics, encode_mechanics) | _mask(restrictions, encode_restrictions) << _RESTRICTIONS_SHIFT
+        none_of = (
+            _mask(exclude_mechanics, encode_mechanics)
+            | _mask(exclude_restrictions, encode_restrictions) << _RESTRICTIONS_SHIFT
+        )
+
+        matches = self._match(required, all_of, none_of, bounds)
+        return MapCatalogPage(self._page(matches, sort, descending, offset, limit), len(matches))
+
+    def _match(
+        self,
+        required: list[list[_Ids]],
+        all_of: int,
+        none_of: int,
+        bounds: tuple[int, int] | None,
+    ) -> Collection[int]:
+        masked = bool(all_of or none_of)
+        if not required:
+            if not masked:
+                return self._maps.keys()
+            return set(select_by_masks(self._slot_ids, self._flags, all_of=all_of, none_of=none_of))
+        # Materialize only the most selective group, then narrow it with single-set
+        # intersections and the flag and difficulty columns before the costlier any-of
+        # membership tests.
+        required.sort(key=lambda group: sum(map(len, group)))
+        first, *rest = required
+        matches: _Ids = first[0] if len(first) == 1 else set().union(*first)
+        for group in rest:
+            if len(group) <= 1:
+                matches = group[0].intersection(matches) if group else _EMPTY
+        if masked and matches:
+            matches = self._filter_masks(matches, all_of, none_of)
+        if bounds is not None and matches:
+            low, high = bounds
+            difficulties, slots = self._difficulties, self._slots
+            matches = {map_id for map_id in matches if low <= difficulties[slots[map_id]] <= high}
+        for group in rest:
+            if len(group) > 1 and matches:
+                matches = {map_id for map_id in matches if any(map_id in ids for ids in group)}
+        return matches
+
+    def _filter_masks(self, matches: _Ids, all_of: int, none_of: int) -> _Ids:
+        if len(matches) * 8 >= len(self._maps):
+            return matches.intersection(select_by_masks(self._slot_ids, self._flags, all_of=all_of, none_of=none_of))
+        flags, slots = self._flags, self._slots
+        return {
+            map_id for map_id in matches if (mask := flags[slots[map_id]]) & all_of == all_of and not mask & none_of
+        }
+
+    def _order(self, sort: MapSortKey) -> tuple[list[int], list[int]]:
+        order = self._orders.get(sort)
+        if order is None:
+            order = self._orders[sort] = self._sorted(self._maps.keys(), sort)
+        return order
+
+    def _sorted(self, ids: Iterable[int], sort: MapSortKey) -> tuple[list[int], list[int]]:
+        key, maps = _SORT_KEYS[sort], self._maps
+        valued: list[tuple[Any, int]] = []
+        missing: list[int] = []
+        for map_id in ids:
+            value = key(maps[map_id])
+            if value is None:
+                missing.append(map_id)
+            else:
+                valued.append((value, map_id))
+        valued.sort()
+        missing.sort()
+        return [map_id for _, map_id in valued], missing
+
+    def _page(
+        self,
+        matches: Collection[int],
+        sort: MapSortKey,
+        descending: bool,
+        offset: int,
+        limit: int | None,
+    ) -> list[MapResponse]:
+        total = len(matches)
+        offset = max(offset, 0)
+        stop = total if limit is None else min(offset + max(limit, 0), total)
+        if offset >= stop:
+            return []
+        # Walking the catalog-wide order visits about ``stop * len(catalog) / total`` ids before
+        # the page is full; sorting the matches costs about ``total * log(total)``.
+        if stop * len(self._maps) <= 4 * total * total:
+            valued, missing = self._order(sort)
+            ordered: Iterable[int] = chain(reversed(valued) if descending else valued, missing)
+            if total != len(self._maps):
+                ordered = (map_id for map_id in ordered if map_id in matches)
+        else:
+            valued, missing = self._sorted(matches, sort)
+            ordered = chain(reversed(valued) if descending else valued, missing)
+        maps = self._maps
+        return [maps[map_id] for map_id in islice(ordered, offset, stop)]
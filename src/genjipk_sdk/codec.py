@@ -0,0 +1,268 @@
+import inspect
+from collections.abc import Iterator
+from types import ModuleType
+from typing import Any, Generic, TypeVar, overload
+
+import msgspec
+
+from . import (
+    change_requests,
+    completions,
+    internal,
+    logs,
+    lootbox,
+    maps,
+    newsfeed,
+    rank_card,
+    tags,
+    users,
+    xp,
+)
+from .assets import deferred_urls, resolve_deferred_urls
+from .pooling import StringPool, pool_strings
+
+__all__ = (
+    "Codec",
+    "decode_json",
+    "decode_msgpack",
+    "encode_json",
+    "encode_msgpack",
+    "get_codec",
+    "iter_struct_types",
+    "warm_codecs",
+)
+
+T = TypeVar("T")
+
+_MODEL_MODULES: tuple[ModuleType, ...] = (
+    change_requests,
+    completions,
+    internal,
+    logs,
+    lootbox,
+    maps,
+    newsfeed,
+    rank_card,
+    tags,
+    users,
+    xp,
+)
+
+# Encoders are not bound to a type, so a single instance per format is shared by every codec.
+_JSON_ENCODER = msgspec.json.Encoder()
+_MSGPACK_ENCODER = msgspec.msgpack.Encoder()
+
+
+def _pool_result(result: object, pool: StringPool) -> None:
+    """Pool a decoded Struct or the Structs of a decoded list; anything else is left alone."""
+    if isinstance(result, (msgspec.Struct, list, tuple)):
+        pool_strings(result, pool=pool)
+
+
+class Codec(Generic[T]):
+    """Cached JSON and MessagePack encoder/decoder pair for a single type.
+
+    Decoders are built on first use and reused afterwards, so the type-validation plan
+    is only compiled once per type instead of once per ``msgspec.*.decode`` call.
+
+    Attributes:
+        target: The type this codec decodes into, e.g. ``MapResponse`` or ``list[MapResponse]``.
+    """
+
+    __slots__ = ("_json_decoder", "_msgpack_decoder", "target")
+
+    def __init__(self, type_: type[T] | object) -> None:
+        """Create a codec for ``type_``; decoders are built lazily."""
+        self.target = type_
+        self._json_decoder: msgspec.json.Decoder[T] | None = None
+        self._msgpack_decoder: msgspec.msgpack.Decoder[T] | None = None
+
+    def __repr__(self) -> str:
+        """Return a debug representation of the codec."""
+        return f"Codec({self.target!r})"
+
+    @property
+    def json_decoder(self) -> msgspec.json.Decoder[T]:
+        """Return the cached JSON decoder, building it on first access."""
+        if self._json_decoder is None:
+            self._json_decoder = msgspec.json.Decoder(self.target)
+        return self._json_decoder
+
+    @property
+    def msgpack_decoder(self) -> msgspec.msgpack.Decoder[T]:
+        """Return the cached MessagePack decoder, building it on first access."""
+        if self._msgpack_decoder is None:
+            self._msgpack_decoder = msgspec.msgpack.Decoder(self.target)
+        return self._msgpack_decoder
+
+    @property
+    def json_encoder(self) -> msgspec.json.Encoder:
+        """Return the shared JSON encoder."""
+        return _JSON_ENCODER
+
+    @property
+    def msgpack_encoder(self) -> msgspec.msgpack.Encoder:
+        """Return the shared MessagePack encoder."""
+        return _MSGPACK_ENCODER
+
+    def decode_json(
+        self,
+        buf: bytes | bytearray | memoryview | str,
+        *,
+        defer_urls: bool = False,
+        pool: StringPool | None = None,
+    ) -> T:
+        """Decode a JSON document into this codec's type.
+
+        Args:
+            buf: The JSON document.
+            defer_urls: Skip derived URL fields; see :func:`~genjipk_sdk.assets.deferred_urls`.
+            pool: Share repetitive string fields through this pool; see :mod:`genjipk_sdk.pooling`.
+        """
+        if defer_urls:
+            with deferred_urls():
+                result = self.json_decoder.decode(buf)
+        else:
+            result = self.json_decoder.decode(buf)
+        if pool is not None:
+            _pool_result(result, pool)
+        return result
+
+    def decode_msgpack(
+        self,
+        buf: bytes | bytearray | memoryview,
+        *,
+        defer_urls: bool = False,
+        pool: StringPool | None = None,
+    ) -> T:
+        """Decode a MessagePack document into this codec's type.
+
+        Args:
+            buf: The MessagePack document.
+            defer_urls: Skip derived URL fields; see :func:`~genjipk_sdk.assets.deferred_urls`.
+            pool: Share repetitive string fields through this pool; see :mod:`genjipk_sdk.pooling`.
+        """
+        if defer_urls:
+            with deferred_urls():
+                result = self.msgpack_decoder.decode(buf)
+        else:
+            result = self.msgpack_decoder.decode(buf)
+        if pool is not None:
+            _pool_result(result, pool)
+        return result
+
+    def encode_json(self, obj: T, *, resolve_urls: bool = True) -> bytes:
+        """Encode ``obj`` as JSON.
+
+        Args:
+            obj: The value to encode.
+            resolve_urls: Compute URL fields left unset by a ``defer_urls`` decode first, so the
+                output matches an eager decode; see :func:`~genjipk_sdk.assets.resolve_deferred_urls`.
+                Pass ``False`` to skip the walk for values known to be fully resolved.
+        """
+        if resolve_urls:
+            resolve_deferred_urls(obj)
+        return _JSON_ENCODER.encode(obj)
+
+    def encode_msgpack(self, obj: T, *, resolve_urls: bool = True) -> bytes:
+        """Encode ``obj`` as MessagePack.
+
+        Args:
+            obj: The value to encode.
+            resolve_urls: Compute URL fields left unset by a ``defer_urls`` decode first, so the
+                output matches an eager decode; see :func:`~genjipk_sdk.assets.resolve_deferred_urls`.
+                Pass ``False`` to skip the walk for values known to be fully resolved.
+        """
+        if resolve_urls:
+            resolve_deferred_urls(obj)
+        return _MSGPACK_ENCODER.encode(obj)
+
+    def warm(self) -> None:
+        """Build both decoders eagerly."""
+        _ = self.json_decoder
+        _ = self.msgpack_decoder
+
+
+_CODECS: dict[object, Codec[Any]] = {}
+
+
+@overload
+def get_codec(type_: type[T]) -> Codec[T]: ...
+@overload
+def get_codec(type_: object) -> Codec[Any]: ...
+def get_codec(type_: object) -> Codec[Any]:
+    """Return the cached codec for ``type_``.
+
+    Any hashable type msgspec understands is accepted, including generic aliases such as
+    ``list[CompletionResponse]`` and unions such as ``NewsfeedPayload``.
+    """
+    codec = _CODECS.get(type_)
+    if codec is None:
+        codec = _CODECS.setdefault(type_, Codec(type_))
+    return codec
+
+
+def decode_json(
+    buf: bytes | bytearray | memoryview | str,
+    type_: type[T],
+    *,
+    defer_urls: bool = False,
+    pool: StringPool | None = None,
+) -> T:
+    """Decode JSON into ``type_`` using the cached decoder."""
+    return get_codec(type_).decode_json(buf, defer_urls=defer_urls, pool=pool)
+
+
+def decode_msgpack(
+    buf: bytes | bytearray | memoryview,
+    type_: type[T],
+    *,
+    defer_urls: bool = False,
+    pool: StringPool | None = None,
+) -> T:
+    """Decode MessagePack into ``type_`` using the cached decoder."""
+    return get_codec(type_).decode_msgpack(buf, defer_urls=defer_urls, pool=pool)
+
+
+def encode_json(obj: object, *, resolve_urls: bool = True) -> bytes:
+    """Encode ``obj`` as JSON using the shared encoder; see :meth:`Codec.encode_json`."""
+    if resolve_urls:
+        resolve_deferred_urls(obj)
+    return _JSON_ENCODER.encode(obj)
+
+
+def encode_msgpack(obj: object, *, resolve_urls: bool = True) -> bytes:
+    """Encode ``obj`` as MessagePack using the shared encoder; see :meth:`Codec.encode_msgpack`."""
+    if resolve_urls:
+        resolve_deferred_urls(obj)
+    return _MSGPACK_ENCODER.encode(obj)
+
+
+def iter_struct_types() -> Iterator[type[msgspec.Struct]]:
+    """Yield every public Struct exported by the SDK model modules."""
+    seen: set[type[msgspec.Struct]] = set()
+    for module in _MODEL_MODULES:
+        for name in module.__all__:
+            obj = getattr(module, name)
+            if inspect.isclass(obj) and issubclass(obj, msgspec.Struct) and obj not in seen:
+                seen.add(obj)
+                yield obj
+
+
+def warm_codecs(*, include_lists: bool = True) -> int:
+    """Eagerly build codecs for every exported Struct.
+
+    Args:
+        include_lists: Also build codecs for the ``list[T]`` variant of each Struct.
+
+    Returns:
+        The number of codecs built.
+    """
+    count = 0
+    for struct_type in iter_struct_types():
+        get_codec(struct_type).warm()
+        count += 1
+        if include_lists:
+            get_codec(list[struct_type]).warm()
+            count += 1
+    return count
@@ -0,0 +1,254 @@
+"""Compact, array-like wire format for internal service traffic.
+
+Field names dominate the size of wide models such as ``MapResponse`` and
+``CompletionResponse``. :class:`CompactCodec` encodes the top-level Struct as an array of
+field values instead of a map, inside a small envelope that carries a schema fingerprint::
+
+    [fingerprint, [value, value, ...]]          # compact form
+    ["", {"field": value, ...}]                 # named fallback
+
+The receiver only decodes the compact form when the fingerprint matches its own definition
+of the type, so services deployed with different field orders fail loudly instead of
+silently mis-assigning fields. The named fallback is always accepted.
+
+Compact payloads are decoded straight into a private ``array_like=True`` mirror of the model,
+which has the same fields and memory layout, and every decoded object is then switched to the
+model class itself. Decoded objects are therefore plain model instances in both forms and
+re-encode in the named form with any encoder. Only the top-level Struct is compacted; nested
+Structs keep their named form.
+
+With ``flag_masks=True``, ``mechanics`` and ``restrictions`` are additionally written as the
+integer bitmasks of :mod:`~genjipk_sdk.map_flags` (:data:`~genjipk_sdk.map_flags.MechanicsMask`
+and :data:`~genjipk_sdk.map_flags.RestrictionsMask`) instead of string lists. They are sets, so
+decoding returns their values in ``Mechanics``/``Restrictions`` definition order. Masked
+payloads carry their own fingerprint and are rejected by codecs without the option. The
+masks save a further ~8-9% on typical maps but make decoding ~25% slower, since each list is
+rebuilt in Python; use them when payload size matters more than decode time.
+
+Validation of nested values dominates decode time, so the compact form mainly saves bytes:
+it is roughly 35-55% smaller than the named form, while decoding is only a few percent faster
+(up to about 10% on batches of a few thousand rows).
+"""
+
+import functools
+import hashlib
+import types
+from collections.abc import Callable, Iterable
+from typing import Any, Generic, Literal, TypeVar
+
+import msgspec
+from msgspec import Struct
+
+from .completions import CompletionResponse
+from .map_flags import (
+    MechanicsMask,
+    RestrictionsMask,
+    decode_mechanics,
+    decode_restrictions,
+    encode_mechanics,
+    encode_restrictions,
+)
+from .maps import MapResponse, Mechanics, Restrictions
+from .schema import fingerprint
+
+__all__ = (
+    "COMPACT_MODELS",
+    "NAMED_SCHEMA",
+    "CompactCodec",
+    "CompactFormat",
+    "SchemaMismatchError",
+    "get_compact_codec",
+)
+
+S = TypeVar("S", bound=Struct)
+
+CompactFormat = Literal["json", "msgpack"]
+
+# High-volume models the compact format is intended for.
+COMPACT_MODELS: tuple[type[Struct], ...] = (MapResponse, CompletionResponse)
+
+# Envelope fingerprint marking a payload in the regular, named form.
+NAMED_SCHEMA = ""
+
+# Fields written as bitmasks with ``flag_masks``: name -> (model type, mask type, encode, decode).
+_FLAG_FIELDS: dict[str, tuple[Any, Any, Callable[[Any], int], Callable[[int], list[Any]]]] = {
+    "mechanics": (list[Mechanics], MechanicsMask, encode_mechanics, decode_mechanics),
+    "restrictions": (list[Restrictions], RestrictionsMask, encode_restrictions, decode_restrictions),
+}
+
+
+class SchemaMismatchError(ValueError):
+    """A compact payload was produced from a different definition of the type."""
+
+
+def _flag_fields(cls: type[Struct]) -> tuple[str, ...]:
+    """Return the fields of ``cls`` that ``flag_masks`` encodes as bitmasks.
+
+    Raises:
+        TypeError: If ``cls`` lacks a ``mechanics`` or ``restrictions`` list field.
+    """
+    types_ = {field.name: field.type for field in msgspec.structs.fields(cls)}
+    for name, (model_type, *_) in _FLAG_FIELDS.items():
+        if types_.get(name) != model_type:
+            raise TypeError(f"{cls.__name__} has no {name} list field; flag_masks does not apply")
+    return tuple(_FLAG_FIELDS)
+
+
+@functools.cache
+def _array_mirror(cls: type[S], *, flag_masks: bool = False) -> type[S]:
+    """Return an ``array_like=True`` subclass of ``cls`` with the same instance layout.
+
+    With ``flag_masks`` the mask fields are redeclared as their integer mask types.
+    """
+
+    def body(namespace: dict[str, Any]) -> None:
+        if flag_masks:
+            namespace["__annotations__"] = {name: _FLAG_FIELDS[name][1] for name in _flag_fields(cls)}
+            namespace.update(dict.fromkeys(namespace["__annotations__"], 0))
+
+    mirror = types.new_class(f"_Compact{cls.__name__}", (cls,), {"array_like": True}, body)
+    if (
+        mirror.__basicsize__ != cls.__basicsize__ or mirror.__struct_fields__ != cls.__struct_fields__
+    ):  # pragma: no cover - msgspec layout change
+        raise TypeError(f"Cannot build a compact decoder for {cls.__name__}")
+    return mirror
+
+
+class CompactCodec(Generic[S]):
+    """Encode and decode one Struct type in the compact envelope format.
+
+    Attributes:
+        target: The model type, e.g. ``MapResponse``.
+        format: Wire format of the envelope and its contents.
+        fingerprint: Schema fingerprint of ``target`` (see :func:`~genjipk_sdk.schema.fingerprint`)
+            written into compact envelopes; distinct when ``flag_masks`` is enabled.
+        flag_masks: Whether compact payloads carry ``mechanics`` and ``restrictions`` as bitmasks.
+    """
+
+    __slots__ = (
+        "_compact_decoder",
+        "_compact_many_decoder",
+        "_encoder",
+        "_envelope_decoder",
+        "_masks",
+        "_named_decoder",
+        "_named_many_decoder",
+        "fingerprint",
+        "flag_masks",
+        "format",
+        "target",
+    )
+
+    def __init__(self, type_: type[S], *, format_: CompactFormat = "msgpack", flag_masks: bool = False) -> None:
+        """Build the encoder and decoders for ``type_``.
+
+        Raises:
+            TypeError: If ``flag_masks`` is set and ``type_`` has no ``mechanics`` and
+                ``restrictions`` list fields.
+        """
+        self.target = type_
+        self.format: CompactFormat = format_
+        self.flag_masks = flag_masks
+        self.fingerprint = fingerprint(type_)
+        # (field name, position, encode, decode) of every field written as a bitmask.
+        self._masks: tuple[tuple[str, int, Callable[[Any], int], Callable[[int], list[Any]]], ...] = ()
+        if flag_masks:
+            positions = type_.__struct_fields__
+            self._masks = tuple(
+                (name, positions.index(name), _FLAG_FIELDS[name][2], _FLAG_FIELDS[name][3])
+                for name in _flag_fields(type_)
+            )
+            self.fingerprint = hashlib.sha256(f"{self.fingerprint}+flag_masks".encode()).hexdigest()[:16]
+        module = msgspec.msgpack if format_ == "msgpack" else msgspec.json
+        mirror: type[S] = _array_mirror(type_, flag_masks=flag_masks)
+        self._encoder = module.Encoder()
+        self._envelope_decoder = module.Decoder(tuple[str, msgspec.Raw])
+        self._compact_decoder = module.Decoder(mirror)
+        self._compact_many_decoder = module.Decoder(list[mirror])
+        self._named_decoder = module.Decoder(type_)
+        self._named_many_decoder = module.Decoder(list[type_])
+
+    def __repr__(self) -> str:
+        """Return a debug representation of the codec."""
+        return (
+            f"CompactCodec({self.target.__name__}, format={self.format!r}, "
+            f"flag_masks={self.flag_masks!r}, fingerprint={self.fingerprint!r})"
+        )
+
+    def _row(self, obj: S) -> tuple[Any, ...] | list[Any]:
+        values = msgspec.structs.astuple(obj)
+        if not self._masks:
+            return values
+        row = list(values)
+        for _, position, encode, _ in self._masks:
+            row[position] = int(encode(row[position]))
+        return row
+
+    def _unmask(self, obj: S) -> None:
+        for name, _, _, decode in self._masks:
+            setattr(obj, name, decode(getattr(obj, name)))
+
+    def encode(self, obj: S, *, compact: bool = True) -> bytes:
+        """Encode one object, as an array unless ``compact`` is false."""
+        if compact:
+            return self._encoder.encode((self.fingerprint, self._row(obj)))
+        return self._encoder.encode((NAMED_SCHEMA, obj))
+
+    def encode_many(self, objs: Iterable[S], *, compact: bool = True) -> bytes:
+        """Encode a list of objects in one envelope."""
+        if compact:
+            return self._encoder.encode((self.fingerprint, [self._row(obj) for obj in objs]))
+        return self._encoder.encode((NAMED_SCHEMA, list(objs)))
+
+    def _open(self, buf: bytes | bytearray | memoryview) -> tuple[bool, msgspec.Raw]:
+        schema, data = self._envelope_decoder.decode(buf)
+        if schema == NAMED_SCHEMA:
+            return False, data
+        if schema != self.fingerprint:
+            raise SchemaMismatchError(
+                f"{self.target.__name__} payload has schema {schema!r}, expected {self.fingerprint!r}"
+            )
+        return True, data
+
+    def decode(self, buf: bytes | bytearray | memoryview) -> S:
+        """Decode one object from either envelope form.
+
+        Raises:
+            SchemaMismatchError: If a compact payload was encoded with a different schema.
+        """
+        compact, data = self._open(buf)
+        if compact:
+            obj = self._compact_decoder.decode(data)
+            if self._masks:
+                self._unmask(obj)
+            obj.__class__ = self.target
+            return obj
+        return self._named_decoder.decode(data)
+
+    def decode_many(self, buf: bytes | bytearray | memoryview) -> list[S]:
+        """Decode a list of objects from either envelope form.
+
+        Raises:
+            SchemaMismatchError: If a compact payload was encoded with a different schema.
+        """
+        compact, data = self._open(buf)
+        if compact:
+            objs = self._compact_many_decoder.decode(data)
+            target, unmask = self.target, self._unmask if self._masks else None
+            for obj in objs:
+                if unmask is not None:
+                    unmask(obj)
+                obj.__class__ = target
+            return objs
+        return self._named_many_decoder.decode(data)
+
+
+@functools.cache
+def get_compact_codec(
+    type_: type[S],
+    *,
+    format_: CompactFormat = "msgpack",
+    flag_masks: bool = False,
+) -> CompactCodec[S]:
+    """Return the cached :class:`CompactCodec` for ``type_``, ``format_`` and ``flag_masks``."""
+    return CompactCodec(type_, format_=format_, flag_masks=flag_masks)
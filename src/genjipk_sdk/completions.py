@@ -76,9 +76,11 @@ class CompletionCreateRequest(Struct):
     video: GuideURL | None
 
 
-class CompletionResponse(Struct):
+class CompletionResponse(Struct, gc=False):
     """Represents a completion entry with verification metadata.
 
+    Only holds scalars, so it opts out of garbage-collector tracking.
+
     Attributes:
         code: Workshop code for the map.
         user_id: Identifier for the completing user.
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Sequence
+from typing import Generic, Literal, TypeVar
+
+__all__ = (
+    "DIFFICULTY_ALL_INDEX",
+    "DIFFICULTY_ALL_TO_TOP_INDEX",
+    "DIFFICULTY_COLORS",
+    "DIFFICULTY_MIDPOINTS",
+    "DIFFICULTY_RANGES_ALL",
+    "DIFFICULTY_RANGES_TOP",
+    "DIFFICULTY_TOP_INDEX",
+    "DIFFICULTY_TO_RANK_MAP",
+    "DifficultyAll",
+    "DifficultyTop",
+    "Rank",
+    "convert_extended_difficulty_to_top_level",
+    "convert_raw_difficulties_all",
+    "convert_raw_difficulties_top",
+    "convert_raw_difficulty_to_difficulty_all",
+    "convert_raw_difficulty_to_difficulty_top",
+    "difficulty_range_all",
+    "difficulty_range_top",
+    "expand_top_difficulty",
+)
+Rank = Literal["Ninja", "Jumper", "Skilled", "Pro", "Master", "Grandmaster", "God"]
+
+DifficultyTop = Literal[
+    "Easy",
+    "Medium",
+    "Hard",
+    "Very Hard",
+    "Extreme",
+    "Hell",
+]
+
+DifficultyAll = Literal[
+    "Easy -",
+    "Easy",
+    "Easy +",
+    "Medium -",
+    "Medium",
+    "Medium +",
+    "Hard -",
+    "Hard",
+    "Hard +",
+    "Very Hard -",
+    "Very Hard",
+    "Very Hard +",
+    "Extreme -",
+    "Extreme",
+    "Extreme +",
+    "Hell",
+]
+
+D = TypeVar("D", DifficultyTop, DifficultyAll)
+
+DIFFICULTY_RANGES_ALL: dict[DifficultyAll, tuple[float, float]] = {
+    "Easy -": (0.0, 1.18),  # Beginner has been removed completely, so Easy - has absorbed that range.
+    "Easy": (1.18, 1.76),
+    "Easy +": (1.76, 2.35),
+    "Medium -": (2.35, 2.94),
+    "Medium": (2.94, 3.53),
+    "Medium +": (3.53, 4.12),
+    "Hard -": (4.12, 4.71),
+    "Hard": (4.71, 5.29),
+    "Hard +": (5.29, 5.88),
+    "Very Hard -": (5.88, 6.47),
+    "Very Hard": (6.47, 7.06),
+    "Very Hard +": (7.06, 7.65),
+    "Extreme -": (7.65, 8.24),
+    "Extreme": (8.24, 8.82),
+    "Extreme +": (8.82, 9.41),
+    "Hell": (9.41, 10.0),
+}
+
+DIFFICULTY_RANGES_TOP: dict[DifficultyTop, tuple[float, float]] = {
+    "Easy": (0.0, 2.35),  # Beginner has been removed completely, so Easy has absorbed that range.
+    "Medium": (2.35, 4.12),
+    "Hard": (4.12, 5.88),
+    "Very Hard": (5.88, 7.65),
+    "Extreme": (7.65, 9.41),
+    "Hell": (9.41, 10.0),
+}
+
+DIFFICULTY_MIDPOINTS: dict[DifficultyAll, float] = {
+    "Easy -": 0.89,  # Beginner removed completely, this midpoint ignores the old Beginner range.
+    "Easy": 1.47,
+    "Easy +": 2.06,
+    "Medium -": 2.65,
+    "Medium": 3.23,
+    "Medium +": 3.83,
+    "Hard -": 4.42,
+    "Hard": 5.0,
+    "Hard +": 5.58,
+    "Very Hard -": 6.17,
+    "Very Hard": 6.76,
+    "Very Hard +": 7.36,
+    "Extreme -": 7.95,
+    "Extreme": 8.53,
+    "Extreme +": 9.12,
+    "Hell": 9.71,
+}
+
+DIFFICULTY_COLORS: dict[DifficultyAll, str] = {
+    "Easy -": "#66ff66",
+    "Easy": "#4dcc4d",
+    "Easy +": "#33cc33",
+    "Medium -": "#99ff33",
+    "Medium": "#99e600",
+    "Medium +": "#80cc00",
+    "Hard -": "#ffd633",
+    "Hard": "#ffb300",
+    "Hard +": "#ff9900",
+    "Very Hard -": "#ff8000",
+    "Very Hard": "#e67e00",
+    "Very Hard +": "#cc6600",
+    "Extreme -": "#ff4d00",
+    "Extreme": "#e04300",
+    "Extreme +": "#b92d00",
+    "Hell": "#990000",
+}
+
+DIFFICULTY_TO_RANK_MAP: dict[DifficultyTop, Rank] = {
+    "Easy": "Jumper",
+    "Medium": "Skilled",
+    "Hard": "Pro",
+    "Very Hard": "Master",
+    "Extreme": "Grandmaster",
+    "Hell": "God",
+}
+
+
+class _DifficultyBuckets(Generic[D]):
+    """Sorted lower boundaries of a difficulty range table, resolved with ``bisect``."""
+
+    __slots__ = ("labels", "lower_bounds", "maximum", "minimum")
+
+    def __init__(self, mapping: dict[D, tuple[float, float]]) -> None:
+        ranges = sorted(mapping.items(), key=lambda item: item[1][0])
+        self.labels: tuple[D, ...] = tuple(label for label, _ in ranges)
+        self.lower_bounds: tuple[float, ...] = tuple(low for _, (low, _) in ranges)
+        self.minimum = ranges[0][1][0]
+        self.maximum = ranges[-1][1][1]
+
+    def index(self, raw_difficulty: float) -> int:
+        if not self.minimum <= raw_difficulty < self.maximum:
+            raise ValueError("Unknown difficulty")
+        return bisect_right(self.lower_bounds, raw_difficulty) - 1
+
+    def label(self, raw_difficulty: float) -> D:
+        return self.labels[self.index(raw_difficulty)]
+
+    def labels_for(self, raw_difficulties: Sequence[float]) -> list[D]:
+        labels, lower_bounds, minimum, maximum = self.labels, self.lower_bounds, self.minimum, self.maximum
+        result: list[D] = []
+        append = result.append
+        for raw_difficulty in raw_difficulties:
+            if not minimum <= raw_difficulty < maximum:
+                raise ValueError("Unknown difficulty")
+            append(labels[bisect_right(lower_bounds, raw_difficulty) - 1])
+        return result
+
+
+_BUCKETS_ALL: _DifficultyBuckets[DifficultyAll] = _DifficultyBuckets(DIFFICULTY_RANGES_ALL)
+_BUCKETS_TOP: _DifficultyBuckets[DifficultyTop] = _DifficultyBuckets(DIFFICULTY_RANGES_TOP)
+
+# Ordinal of each label in ascending difficulty order, matching the bucket indices used by
+# ``difficulties.vectorized``. Comparing ordinals orders difficulties without parsing labels.
+DIFFICULTY_ALL_INDEX: dict[DifficultyAll, int] = {label: index for index, label in enumerate(_BUCKETS_ALL.labels)}
+DIFFICULTY_TOP_INDEX: dict[DifficultyTop, int] = {label: index for index, label in enumerate(_BUCKETS_TOP.labels)}
+
+_ALL_TO_TOP: dict[DifficultyAll, DifficultyTop] = {
+    label: top
+    for label in _BUCKETS_ALL.labels
+    for top in _BUCKETS_TOP.labels
+    if label.removesuffix(" +").removesuffix(" -") == top
+}
+
+# Top-level ordinal of each DifficultyAll ordinal.
+DIFFICULTY_ALL_TO_TOP_INDEX: tuple[int, ...] = tuple(
+    DIFFICULTY_TOP_INDEX[_ALL_TO_TOP[label]] for label in _BUCKETS_ALL.labels
+)
+
+_TOP_TO_ALL: dict[DifficultyTop, tuple[DifficultyAll, ...]] = {
+    top: tuple(label for label in _BUCKETS_ALL.labels if _ALL_TO_TOP[label] == top) for top in _BUCKETS_TOP.labels
+}
+
+
+def convert_raw_difficulty_to_difficulty_all(raw_difficulty: float) -> DifficultyAll:
+    """Convert raw difficulty (float) into a DifficultyT string.
+
+    This will match for the extended list of difficulties (-, +).
+    """
+    return _BUCKETS_ALL.label(raw_difficulty)
+
+
+def convert_raw_difficulty_to_difficulty_top(raw_difficulty: float) -> DifficultyTop:
+    """Convert raw difficulty (float) into a DifficultyT string.
+
+    This will match only the top difficulties (excludes - and +).
+    """
+    return _BUCKETS_TOP.label(raw_difficulty)
+
+
+def convert_raw_difficulties_all(values: Sequence[float]) -> list[DifficultyAll]:
+    """Convert a column of raw difficulties into DifficultyAll strings.
+
+    Equivalent to calling :func:`convert_raw_difficulty_to_difficulty_all` per value.
+    """
+    return _BUCKETS_ALL.labels_for(values)
+
+
+def convert_raw_difficulties_top(values: Sequence[float]) -> list[DifficultyTop]:
+    """Convert a column of raw difficulties into DifficultyTop strings.
+
+    Equivalent to calling :func:`convert_raw_difficulty_to_difficulty_top` per value.
+    """
+    return _BUCKETS_TOP.labels_for(values)
+
+
+def convert_extended_difficulty_to_top_level(extended_difficulty: DifficultyAll) -> DifficultyTop:
+    """Convert extended difficulty (+ and -) into a top level DifficultyT string (no - or +)."""
+    return _ALL_TO_TOP[extended_difficulty]
+
+
+def expand_top_difficulty(top_difficulty: DifficultyTop) -> tuple[DifficultyAll, ...]:
+    """Return the extended difficulties that make up ``top_difficulty``, e.g. Hard -, Hard, Hard +."""
+    return _TOP_TO_ALL[top_difficulty]
+
+
+def _labels_between(labels: tuple[D, ...], index: dict[D, int], low: D | None, high: D | None) -> tuple[D, ...]:
+    start = 0 if low is None else index[low]
+    stop = len(labels) if high is None else index[high] + 1
+    return labels[start:stop]
+
+
+def difficulty_range_all(
+    low: DifficultyAll | None = None, high: DifficultyAll | None = None
+) -> tuple[DifficultyAll, ...]:
+    """Return the extended difficulties from ``low`` to ``high`` inclusive, easiest first.
+
+    ``None`` leaves that end open; an empty tuple is returned when ``low`` is above ``high``.
+    """
+    return _labels_between(_BUCKETS_ALL.labels, DIFFICULTY_ALL_INDEX, low, high)
+
+
+def difficulty_range_top(
+    low: DifficultyTop | None = None, high: DifficultyTop | None = None
+) -> tuple[DifficultyTop, ...]:
+    """Return the top level difficulties from ``low`` to ``high`` inclusive, easiest first.
+
+    ``None`` leaves that end open; an empty tuple is returned when ``low`` is above ``high``.
+    """
+    return _labels_between(_BUCKETS_TOP.labels, DIFFICULTY_TOP_INDEX, low, high)
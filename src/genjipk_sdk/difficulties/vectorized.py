@@ -0,0 +1,167 @@
+"""Column-wise difficulty conversion.
+
+Raw difficulties are converted to integer bucket indices with ``numpy.searchsorted`` when
+NumPy is installed (``pip install genjipk-sdk[numpy]``). Without NumPy the same functions
+accept any sequence of floats (typically ``array('d')``) and return ``array('b')``.
+
+Indices refer to positions in :data:`DIFFICULTY_ALL_LABELS` / :data:`DIFFICULTY_TOP_LABELS`
+(the same ordinals as :data:`~genjipk_sdk.difficulties.DIFFICULTY_ALL_INDEX`) and can be turned
+back into labels, colors, midpoints or ranks with the ``gather_*`` helpers, or from the
+extended scale to the top level one with :func:`all_indices_to_top`.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, TypeVar
+
+from . import (
+    _BUCKETS_ALL,
+    _BUCKETS_TOP,
+    DIFFICULTY_ALL_TO_TOP_INDEX,
+    DIFFICULTY_COLORS,
+    DIFFICULTY_MIDPOINTS,
+    DIFFICULTY_TO_RANK_MAP,
+    DifficultyAll,
+    DifficultyTop,
+    Rank,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+    from . import _DifficultyBuckets
+
+    RawColumn = Sequence[float] | NDArray[np.floating]
+    IndexColumn = Sequence[int] | NDArray[np.integer]
+else:
+    try:
+        import numpy as np
+    except ImportError:  # pragma: no cover - optional dependency
+        np = None
+
+__all__ = (
+    "DIFFICULTY_ALL_COLORS",
+    "DIFFICULTY_ALL_LABELS",
+    "DIFFICULTY_ALL_MIDPOINTS",
+    "DIFFICULTY_ALL_RANKS",
+    "DIFFICULTY_TOP_LABELS",
+    "DIFFICULTY_TOP_RANKS",
+    "HAS_NUMPY",
+    "all_indices_to_top",
+    "gather_colors_all",
+    "gather_labels_all",
+    "gather_labels_top",
+    "gather_midpoints_all",
+    "gather_ranks_all",
+    "gather_ranks_top",
+    "raw_difficulties_to_indices_all",
+    "raw_difficulties_to_indices_top",
+)
+
+T = TypeVar("T")
+
+HAS_NUMPY = np is not None
+
+DIFFICULTY_ALL_LABELS: tuple[DifficultyAll, ...] = _BUCKETS_ALL.labels
+DIFFICULTY_TOP_LABELS: tuple[DifficultyTop, ...] = _BUCKETS_TOP.labels
+DIFFICULTY_ALL_COLORS: tuple[str, ...] = tuple(DIFFICULTY_COLORS[label] for label in DIFFICULTY_ALL_LABELS)
+DIFFICULTY_TOP_RANKS: tuple[Rank, ...] = tuple(DIFFICULTY_TO_RANK_MAP[label] for label in DIFFICULTY_TOP_LABELS)
+DIFFICULTY_ALL_MIDPOINTS: tuple[float, ...] = tuple(DIFFICULTY_MIDPOINTS[label] for label in DIFFICULTY_ALL_LABELS)
+DIFFICULTY_ALL_RANKS: tuple[Rank, ...] = tuple(DIFFICULTY_TOP_RANKS[index] for index in DIFFICULTY_ALL_TO_TOP_INDEX)
+
+
+def _to_indices(buckets: _DifficultyBuckets, values: RawColumn) -> NDArray[np.int8] | array[int]:
+    if np is not None:
+        raw = np.asarray(values, dtype=np.float64)
+        if not ((raw >= buckets.minimum) & (raw < buckets.maximum)).all():
+            raise ValueError("Unknown difficulty")
+        bounds = np.asarray(buckets.lower_bounds, dtype=np.float64)
+        return (np.searchsorted(bounds, raw, side="right") - 1).astype(np.int8)
+
+    lower_bounds, minimum, maximum = buckets.lower_bounds, buckets.minimum, buckets.maximum
+    indices = array("b", bytes(len(values)))
+    for i, raw_difficulty in enumerate(values):
+        if not minimum <= raw_difficulty < maximum:
+            raise ValueError("Unknown difficulty")
+        indices[i] = bisect_right(lower_bounds, raw_difficulty) - 1
+    return indices
+
+
+def _gather(table: tuple[T, ...], indices: IndexColumn) -> NDArray[np.object_] | list[T]:
+    if np is not None:
+        return np.asarray(table, dtype=object)[np.asarray(indices, dtype=np.intp)]
+    return [table[i] for i in indices]
+
+
+def raw_difficulties_to_indices_all(values: RawColumn) -> NDArray[np.int8] | array[int]:
+    """Convert raw difficulties into indices into :data:`DIFFICULTY_ALL_LABELS`.
+
+    Args:
+        values: A NumPy array, ``array('d')`` or any sequence of floats.
+
+    Returns:
+        An ``int8`` NumPy array when NumPy is installed, otherwise ``array('b')``.
+
+    Raises:
+        ValueError: If any value falls outside the difficulty ranges.
+    """
+    return _to_indices(_BUCKETS_ALL, values)
+
+
+def raw_difficulties_to_indices_top(values: RawColumn) -> NDArray[np.int8] | array[int]:
+    """Convert raw difficulties into indices into :data:`DIFFICULTY_TOP_LABELS`.
+
+    Args:
+        values: A NumPy array, ``array('d')`` or any sequence of floats.
+
+    Returns:
+        An ``int8`` NumPy array when NumPy is installed, otherwise ``array('b')``.
+
+    Raises:
+        ValueError: If any value falls outside the difficulty ranges.
+    """
+    return _to_indices(_BUCKETS_TOP, values)
+
+
+def gather_labels_all(indices: IndexColumn) -> NDArray[np.object_] | list[DifficultyAll]:
+    """Map DifficultyAll indices to their labels (object array with NumPy, otherwise a list)."""
+    return _gather(DIFFICULTY_ALL_LABELS, indices)
+
+
+def gather_labels_top(indices: IndexColumn) -> NDArray[np.object_] | list[DifficultyTop]:
+    """Map DifficultyTop indices to their labels (object array with NumPy, otherwise a list)."""
+    return _gather(DIFFICULTY_TOP_LABELS, indices)
+
+
+def gather_colors_all(indices: IndexColumn) -> NDArray[np.object_] | list[str]:
+    """Map DifficultyAll indices to their :data:`DIFFICULTY_COLORS` hex colors."""
+    return _gather(DIFFICULTY_ALL_COLORS, indices)
+
+
+def gather_ranks_top(indices: IndexColumn) -> NDArray[np.object_] | list[Rank]:
+    """Map DifficultyTop indices to their :data:`DIFFICULTY_TO_RANK_MAP` ranks."""
+    return _gather(DIFFICULTY_TOP_RANKS, indices)
+
+
+def gather_ranks_all(indices: IndexColumn) -> NDArray[np.object_] | list[Rank]:
+    """Map DifficultyAll indices to the ranks of their top level difficulty."""
+    return _gather(DIFFICULTY_ALL_RANKS, indices)
+
+
+def gather_midpoints_all(indices: IndexColumn) -> NDArray[np.float64] | list[float]:
+    """Map DifficultyAll indices to their :data:`DIFFICULTY_MIDPOINTS` raw values."""
+    if np is not None:
+        return np.asarray(DIFFICULTY_ALL_MIDPOINTS, dtype=np.float64)[np.asarray(indices, dtype=np.intp)]
+    return [DIFFICULTY_ALL_MIDPOINTS[i] for i in indices]
+
+
+def all_indices_to_top(indices: IndexColumn) -> NDArray[np.int8] | array[int]:
+    """Map DifficultyAll indices to the indices of their top level difficulty."""
+    if np is not None:
+        return np.asarray(DIFFICULTY_ALL_TO_TOP_INDEX, dtype=np.int8)[np.asarray(indices, dtype=np.intp)]
+    table = DIFFICULTY_ALL_TO_TOP_INDEX
+    return array("b", [table[i] for i in indices])
@@ -1,12 +1,41 @@
-import re
+import functools
 
-__all__ = ("sanitize_string",)
+__all__ = (
+    "SANITIZE_CACHE_SIZE",
+    "sanitize_string",
+)
 
+SANITIZE_CACHE_SIZE = 4096
 
+
+class _SanitizeTable(dict[int, int | None]):
+    """``str.translate`` table: keeps ASCII alphanumerics and whitespace, lowercases, drops the rest.
+
+    Code points are classified on first sight and remembered, so the table only grows with the
+    characters actually seen.
+    """
+
+    def __missing__(self, codepoint: int) -> int | None:
+        char = chr(codepoint)
+        if char.isascii() and char.isalnum():
+            value = ord(char.lower())
+        elif char.isspace():
+            value = codepoint
+        else:
+            value = None
+        self[codepoint] = value
+        return value
+
+
+_SANITIZE_TABLE = _SanitizeTable()
+
+
+@functools.lru_cache(maxsize=SANITIZE_CACHE_SIZE)
 def sanitize_string(string: str | None) -> str:
-    """Sanitize a string for use in asset paths / URLs."""
+    """Sanitize a string for use in asset paths / URLs.
+
+    Results are memoized in a bounded LRU cache; ``sanitize_string.cache_info()`` reports hits and misses.
+    """
     if not string:
         return ""
-    string = re.sub(r"[^a-zA-Z0-9\s]", "", string)
-    string = string.strip().replace(" ", "_")
-    return string.lower()
+    return string.translate(_SANITIZE_TABLE).strip().replace(" ", "_")
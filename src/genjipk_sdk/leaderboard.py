@@ -0,0 +1,323 @@
+"""Leaderboard helpers built on ``CommunityLeaderboardResponse``.
+
+:class:`LeaderboardTable` stores leaderboard rows column by column: integer fields live in
+``array('q')`` columns, the low-cardinality ``tier_name`` and ``skill_rank`` are dictionary
+encoded against a shared table of interned strings, and ``total_results`` is stored once
+instead of on every row.
+
+:class:`XpLeaderboard` keeps an XP ranking up to date from ``XpGrantEvent`` messages so live
+leaderboards and rank-up notifications do not need a server query per grant.
+"""
+
+import sys
+from array import array
+from bisect import bisect_left, insort
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import Literal, NamedTuple, Self, get_args
+
+from .users import CommunityLeaderboardResponse
+from .xp import TierChangeResponse, XpGrantEvent
+
+__all__ = (
+    "LeaderboardColumn",
+    "LeaderboardEntry",
+    "LeaderboardTable",
+    "TierCalculator",
+    "XpLeaderboard",
+)
+
+LeaderboardColumn = Literal[
+    "user_id",
+    "xp_amount",
+    "raw_tier",
+    "normalized_tier",
+    "prestige_level",
+    "wr_count",
+    "map_count",
+    "playtest_count",
+]
+
+_INT_COLUMNS: tuple[LeaderboardColumn, ...] = get_args(LeaderboardColumn)
+
+
+class _StringColumn:
+    """Dictionary-encoded string column: one ``array('H')`` of codes into interned values."""
+
+    __slots__ = ("codes", "lookup", "values")
+
+    def __init__(self) -> None:
+        self.codes = array("H")
+        self.values: list[str] = []
+        self.lookup: dict[str, int] = {}
+
+    def append(self, value: str) -> None:
+        code = self.lookup.get(value)
+        if code is None:
+            code = self.lookup[value] = len(self.values)
+            self.values.append(sys.intern(value))
+        self.codes.append(code)
+
+    def __getitem__(self, index: int) -> str:
+        return self.values[self.codes[index]]
+
+    def take(self, indices: Sequence[int]) -> "_StringColumn":
+        column = _StringColumn()
+        column.values, column.lookup = self.values, self.lookup
+        codes = self.codes
+        column.codes = array("H", [codes[i] for i in indices])
+        return column
+
+
+class LeaderboardTable:
+    """Columnar, lossless container for ``CommunityLeaderboardResponse`` rows.
+
+    Example:
+        table = LeaderboardTable.from_rows(rows)
+        top = table.sorted_by("xp_amount", descending=True)[:10]
+    """
+
+    __slots__ = ("_ints", "discord_tags", "nicknames", "skill_ranks", "tier_names", "total_results")
+
+    def __init__(self, *, total_results: int = 0) -> None:
+        """Create an empty table.
+
+        Args:
+            total_results: Total results of the query the rows belong to.
+        """
+        self.total_results = total_results
+        self._ints: dict[LeaderboardColumn, array[int]] = {name: array("q") for name in _INT_COLUMNS}
+        self.nicknames: list[str] = []
+        self.discord_tags: list[str] = []
+        self.tier_names = _StringColumn()
+        self.skill_ranks = _StringColumn()
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[CommunityLeaderboardResponse]) -> Self:
+        """Build a table from leaderboard rows.
+
+        Raises:
+            ValueError: If the rows disagree on ``total_results``.
+        """
+        table = cls()
+        table.extend(rows)
+        return table
+
+    def append(self, row: CommunityLeaderboardResponse) -> None:
+        """Append one row.
+
+        Raises:
+            ValueError: If ``row.total_results`` differs from the rows already in the table.
+        """
+        if not self.nicknames:
+            self.total_results = row.total_results
+        elif row.total_results != self.total_results:
+            raise ValueError(f"Mixed total_results in one table: {self.total_results} and {row.total_results}")
+        for name, column in self._ints.items():
+            column.append(getattr(row, name))
+        self.nicknames.append(row.nickname)
+        self.discord_tags.append(row.discord_tag)
+        self.tier_names.append(row.tier_name)
+        self.skill_ranks.append(row.skill_rank)
+
+    def extend(self, rows: Iterable[CommunityLeaderboardResponse]) -> None:
+        """Append every row in ``rows``."""
+        for row in rows:
+            self.append(row)
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.nicknames)
+
+    def __iter__(self) -> Iterator[CommunityLeaderboardResponse]:
+        """Iterate over the rows, materializing each one."""
+        for index in range(len(self)):
+            yield self.row(index)
+
+    def __getitem__(self, key: slice) -> "LeaderboardTable":
+        """Return the rows selected by ``key`` as a new table."""
+        return self.take(range(len(self))[key])
+
+    def column(self, name: LeaderboardColumn) -> array[int]:
+        """Return the integer column ``name`` (not a copy)."""
+        return self._ints[name]
+
+    def row(self, index: int) -> CommunityLeaderboardResponse:
+        """Materialize the row at ``index``."""
+        ints = self._ints
+        return CommunityLeaderboardResponse(
+            user_id=ints["user_id"][index],
+            nickname=self.nicknames[index],
+            xp_amount=ints["xp_amount"][index],
+            raw_tier=ints["raw_tier"][index],
+            normalized_tier=ints["normalized_tier"][index],
+            prestige_level=ints["prestige_level"][index],
+            tier_name=self.tier_names[index],
+            wr_count=ints["wr_count"][index],
+            map_count=ints["map_count"][index],
+            playtest_count=ints["playtest_count"][index],
+            discord_tag=self.discord_tags[index],
+            skill_rank=self.skill_ranks[index],
+            total_results=self.total_results,
+        )
+
+    def to_rows(self) -> list[CommunityLeaderboardResponse]:
+        """Materialize every row, in table order."""
+        return list(self)
+
+    def take(self, indices: Sequence[int]) -> "LeaderboardTable":
+        """Return a new table holding the rows at ``indices``, in that order."""
+        table = LeaderboardTable(total_results=self.total_results)
+        for name, column in self._ints.items():
+            table._ints[name] = array("q", [column[i] for i in indices])
+        table.nicknames = [self.nicknames[i] for i in indices]
+        table.discord_tags = [self.discord_tags[i] for i in indices]
+        table.tier_names = self.tier_names.take(indices)
+        table.skill_ranks = self.skill_ranks.take(indices)
+        return table
+
+    def argsort(self, column: LeaderboardColumn, *, descending: bool = False) -> list[int]:
+        """Return row indices ordered by ``column``; ties keep their current order."""
+        values = self._ints[column]
+        if descending:
+            return sorted(range(len(values)), key=lambda i: -values[i])
+        return sorted(range(len(values)), key=values.__getitem__)
+
+    def sorted_by(self, column: LeaderboardColumn, *, descending: bool = False) -> "LeaderboardTable":
+        """Return a new table ordered by ``column``."""
+        return self.take(self.argsort(column, descending=descending))
+
+
+# Computes the tier delta for an XP change, given the old and new XP amounts.
+TierCalculator = Callable[[int, int], TierChangeResponse]
+
+
+class LeaderboardEntry(NamedTuple):
+    """A ranked leaderboard position; users with equal XP share a rank."""
+
+    rank: int
+    user_id: int
+    xp_amount: int
+
+
+class XpLeaderboard:
+    """Incrementally maintained XP ranking.
+
+    Users are kept in a list sorted by ``(-xp, user_id)``, so rank lookups, top-k and offset
+    pages are binary searches and slices. Updates cost one ``O(log n)`` search plus a
+    ``memmove`` of the list tail, which stays cheap well into millions of users. Ranks use
+    competition ranking (1, 2, 2, 4): a user's rank is one more than the number of users with
+    strictly more XP.
+
+    Example:
+        board = XpLeaderboard.from_rows(rows, tier_calculator=tier_table.change)
+        if change := board.apply(event):
+            await announce_rank_up(event.user_id, change)
+    """
+
+    def __init__(self, *, tier_calculator: TierCalculator | None = None) -> None:
+        """Create an empty leaderboard.
+
+        Args:
+            tier_calculator: Computes tier deltas for :meth:`apply`, e.g. the
+                :meth:`~genjipk_sdk.xp.XpTierTable.change` method of a tier table built from the
+                server's configuration. Without one, tier changes are not tracked.
+        """
+        self.tier_calculator = tier_calculator
+        self._xp: dict[int, int] = {}
+        self._order: list[tuple[int, int]] = []
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[CommunityLeaderboardResponse],
+        *,
+        tier_calculator: TierCalculator | None = None,
+    ) -> Self:
+        """Seed a leaderboard from server rows, e.g. a full leaderboard export."""
+        board = cls(tier_calculator=tier_calculator)
+        board.load((row.user_id, row.xp_amount) for row in rows)
+        return board
+
+    def load(self, amounts: Iterable[tuple[int, int]]) -> None:
+        """Set the XP of many users at once from ``(user_id, xp_amount)`` pairs."""
+        self._xp.update(amounts)
+        self._order = sorted((-xp, user_id) for user_id, xp in self._xp.items())
+
+    def __len__(self) -> int:
+        """Return the number of ranked users."""
+        return len(self._order)
+
+    def __contains__(self, user_id: object) -> bool:
+        """Return whether ``user_id`` is ranked."""
+        return user_id in self._xp
+
+    def xp(self, user_id: int) -> int | None:
+        """Return the XP of ``user_id``, or ``None`` if the user is not ranked."""
+        return self._xp.get(user_id)
+
+    def set_xp(self, user_id: int, xp_amount: int) -> None:
+        """Set the XP of ``user_id``, adding the user if needed."""
+        previous = self._xp.get(user_id)
+        if previous == xp_amount:
+            return
+        if previous is not None:
+            del self._order[bisect_left(self._order, (-previous, user_id))]
+        self._xp[user_id] = xp_amount
+        insort(self._order, (-xp_amount, user_id))
+
+    def remove(self, user_id: int) -> None:
+        """Remove ``user_id`` from the ranking, if present."""
+        previous = self._xp.pop(user_id, None)
+        if previous is not None:
+            del self._order[bisect_left(self._order, (-previous, user_id))]
+
+    def apply(self, event: XpGrantEvent) -> TierChangeResponse | None:
+        """Record a grant and return the resulting tier change, if any.
+
+        ``event.new_amount`` is authoritative, so replaying or reordering events for different
+        users is harmless. A change is returned when the tier calculator reports a rank-up or
+        a prestige change; without a tier calculator this always returns ``None``.
+        """
+        self.set_xp(event.user_id, event.new_amount)
+        if self.tier_calculator is None:
+            return None
+        change = self.tier_calculator(event.previous_amount, event.new_amount)
+        if change.rank_change_type is None and not change.prestige_change:
+            return None
+        return change
+
+    def apply_many(self, events: Iterable[XpGrantEvent]) -> list[TierChangeResponse]:
+        """Apply ``events`` in order and return every tier change they produced."""
+        changes: list[TierChangeResponse] = []
+        for event in events:
+            change = self.apply(event)
+            if change is not None:
+                changes.append(change)
+        return changes
+
+    def rank(self, user_id: int) -> int | None:
+        """Return the 1-based rank of ``user_id``, or ``None`` if the user is not ranked."""
+        xp_amount = self._xp.get(user_id)
+        if xp_amount is None:
+            return None
+        return bisect_left(self._order, (-xp_amount,)) + 1
+
+    def page(self, offset: int = 0, limit: int = 20) -> list[LeaderboardEntry]:
+        """Return ``limit`` entries starting at 0-based position ``offset``."""
+        offset = max(offset, 0)
+        window = self._order[offset : offset + max(limit, 0)]
+        if not window:
+            return []
+        entries: list[LeaderboardEntry] = []
+        first_negated_xp = window[0][0]
+        rank = bisect_left(self._order, (first_negated_xp,)) + 1
+        previous = first_negated_xp
+        for position, (negated_xp, user_id) in enumerate(window, start=offset + 1):
+            if negated_xp != previous:
+                rank, previous = position, negated_xp
+            entries.append(LeaderboardEntry(rank, user_id, -negated_xp))
+        return entries
+
+    def top(self, k: int = 10) -> list[LeaderboardEntry]:
+        """Return the ``k`` highest-ranked entries."""
+        return self.page(0, k)
@@ -10,7 +10,7 @@ from typing import Literal
 
 from msgspec import Struct
 
-from .helpers import sanitize_string
+from .assets import REWARD_ASSET_KINDS, asset_url, urls_deferred
 
 __all__ = (
     "LootboxKeyType",
@@ -33,7 +33,8 @@ class RewardTypeResponse(Struct):
         type: Reward category (e.g., spray, skin).
         duplicate: Whether the reward is a duplicate.
         coin_amount: Coin payout when receiving a duplicate reward.
-        url: Asset URL associated with the reward.
+        url: Asset URL associated with the reward. Stays as decoded after a ``defer_urls`` decode
+            until ``resolve_urls()`` is called.
     """
 
     name: str
@@ -46,6 +47,11 @@ class RewardTypeResponse(Struct):
     url: str | None = None
 
     def __post_init__(self) -> None:
+        """Compute the asset URL for the reward unless URLs are deferred."""
+        if not urls_deferred():
+            self.resolve_urls()
+
+    def resolve_urls(self) -> None:
         """Compute the asset URL for the reward."""
         self.url = _reward_url(self.type, self.name)
 
@@ -70,7 +76,8 @@ class UserRewardResponse(Struct):
         type: Reward category (e.g., mastery, spray).
         rarity: Rarity tier of the reward.
         medal: Medal tier when the reward relates to mastery.
-        url: Asset URL associated with the reward.
+        url: Asset URL associated with the reward. Stays as decoded after a ``defer_urls`` decode
+            until ``resolve_urls()`` is called.
     """
 
     user_id: int
@@ -83,30 +90,21 @@ class UserRewardResponse(Struct):
     url: str | None = None
 
     def __post_init__(self) -> None:
+        """Compute the asset URL for the reward unless URLs are deferred."""
+        if not urls_deferred():
+            self.resolve_urls()
+
+    def resolve_urls(self) -> None:
         """Compute the asset URL for the reward."""
         if self.type == "mastery":
-            name = sanitize_string(self.name)
-            medal = sanitize_string(self.medal)
-            self.url = f"assets/mastery/{name}_{medal}.webp"
+            self.url = asset_url("mastery", self.name, self.medal)
         else:
             self.url = _reward_url(self.type, self.name)
 
 
 def _reward_url(type_: str, name: str) -> str:
-    sanitized_name = sanitize_string(name)
-    if type_ == "spray":
-        url = f"assets/rank_card/spray/{sanitized_name}.webp"
-    elif type_ == "skin":
-        url = f"assets/rank_card/avatar/{sanitized_name}/heroic.webp"
-    elif type_ == "pose":
-        url = f"assets/rank_card/avatar/overwatch_1/{sanitized_name}.webp"
-    elif type_ == "background":
-        url = f"assets/rank_card/background/{sanitized_name}.webp"
-    elif type_ == "coins":
-        url = f"assets/rank_card/coins/{sanitized_name}.webp"
-    else:
-        url = ""
-    return url
+    kind = REWARD_ASSET_KINDS.get(type_)
+    return asset_url(kind, name) if kind else ""
 
 
 class UserLootboxKeyAmountResponse(Struct):
@@ -0,0 +1,171 @@
+"""Field-level diffs between map versions.
+
+:func:`diff_maps` compares two versions of a map (``MapResponse`` or ``MapCreateRequest``) over
+the fields of ``MapPatchRequest`` and returns a minimal patch, with every unchanged field left
+``UNSET``, together with the matching ``NewsfeedFieldChange`` list for a ``map_edit`` newsfeed
+entry. :func:`apply_map_edit` and :func:`apply_map_patch` go the other way and produce the
+updated ``MapResponse`` from an accepted edit or a patch.
+
+Mechanics, restrictions and creators are compared as sets, so reordering them is not a change.
+"""
+
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from msgspec import UNSET, Struct, structs
+
+from .maps import MapCreateRequest, MapEditChangesResponse, MapPatchRequest, MapResponse, MedalsResponse, get_map_banner
+from .newsfeed import NewsfeedFieldChange, NewsfeedScalar
+from .users import Creator, CreatorFull
+
+__all__ = (
+    "PATCH_FIELDS",
+    "MapDiff",
+    "apply_map_edit",
+    "apply_map_patch",
+    "diff_maps",
+    "edit_to_patch",
+)
+
+MapVersion = MapResponse | MapCreateRequest
+
+# Fields a map patch can change, in ``MapPatchRequest`` order.
+PATCH_FIELDS: tuple[str, ...] = tuple(field.name for field in structs.fields(MapPatchRequest))
+
+_SET_FIELDS = frozenset({"mechanics", "restrictions"})
+
+# ``custom_banner`` is resolved into ``map_banner`` by the server and cannot be applied locally.
+_UNAPPLIABLE_FIELDS = frozenset({"custom_banner"})
+
+
+class MapDiff(Struct):
+    """Result of :func:`diff_maps`.
+
+    Attributes:
+        patch: Patch holding only the changed fields.
+        changes: The same changes as newsfeed entries, in ``MapPatchRequest`` field order.
+    """
+
+    patch: MapPatchRequest
+    changes: list[NewsfeedFieldChange]
+
+    def __bool__(self) -> bool:
+        """Return whether anything changed."""
+        return bool(self.changes)
+
+
+def _creators(creators: Iterable[Creator]) -> list[Creator]:
+    # Patches carry plain ``Creator`` entries even when diffing ``CreatorFull`` lists.
+    return [Creator(id=creator.id, is_primary=creator.is_primary) for creator in creators]
+
+
+def _same(name: str, old: Any, new: Any) -> bool:  # noqa: ANN401
+    if name == "creators":
+        return {(c.id, c.is_primary) for c in old} == {(c.id, c.is_primary) for c in new}
+    if name in _SET_FIELDS and old is not None and new is not None:
+        return set(old) == set(new)
+    return old == new
+
+
+def _scalar(value: Any) -> NewsfeedScalar:  # noqa: ANN401
+    """Render a field value as a newsfeed scalar."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, MedalsResponse):
+        return f"{value.gold} / {value.silver} / {value.bronze}"
+    if isinstance(value, list):
+        return ", ".join(
+            (item.name if isinstance(item, CreatorFull) else str(item.id)) if isinstance(item, Creator) else str(item)
+            for item in value
+        )
+    return str(value)
+
+
+def diff_maps(old: MapVersion, new: MapVersion) -> MapDiff:
+    """Return the minimal patch turning ``old`` into ``new`` and its newsfeed changes.
+
+    Only fields present on both versions are compared; for example ``custom_banner`` is
+    ignored when either side is a ``MapResponse``.
+    """
+    values: dict[str, Any] = {}
+    changes: list[NewsfeedFieldChange] = []
+    for name in PATCH_FIELDS:
+        before, after = getattr(old, name, UNSET), getattr(new, name, UNSET)
+        if before is UNSET or after is UNSET or _same(name, before, after):
+            continue
+        values[name] = _creators(after) if name == "creators" else after
+        changes.append(NewsfeedFieldChange(field=name, old=_scalar(before), new=_scalar(after)))
+    return MapDiff(MapPatchRequest(**values), changes)
+
+
+def edit_to_patch(edit: MapEditChangesResponse) -> MapPatchRequest:
+    """Convert the proposed fields of a map edit into a patch; ``None`` fields stay ``UNSET``."""
+    values = {name: value for name in PATCH_FIELDS if (value := getattr(edit, name, None)) is not None}
+    return MapPatchRequest(**values)
+
+
+def _apply(map_: MapResponse, values: dict[str, Any], creator_names: Mapping[int, str] | None) -> MapResponse:
+    for name in _UNAPPLIABLE_FIELDS:
+        values.pop(name, None)
+    creators = values.get("creators")
+    if creators is not None:
+        names = {creator.id: creator.name for creator in map_.creators}
+        if creator_names:
+            names.update(creator_names)
+        missing = [creator.id for creator in creators if creator.id not in names]
+        if missing:
+            raise ValueError(f"No creator name for user ids {missing}")
+        values["creators"] = [
+            CreatorFull(id=creator.id, is_primary=creator.is_primary, name=names[creator.id]) for creator in creators
+        ]
+    for name in _SET_FIELDS:
+        if name in values and values[name] is None:
+            values[name] = []
+    new_name = values.get("map_name", map_.map_name)
+    if new_name != map_.map_name and map_.map_banner == get_map_banner(map_.map_name):
+        # Let ``__post_init__`` pick the default banner of the new map.
+        values["map_banner"] = ""
+    return structs.replace(map_, **values)
+
+
+def apply_map_patch(
+    map_: MapResponse,
+    patch: MapPatchRequest,
+    *,
+    creator_names: Mapping[int, str] | None = None,
+) -> MapResponse:
+    """Return a copy of ``map_`` with the set fields of ``patch`` applied.
+
+    Args:
+        map_: Current version of the map; it is not modified.
+        patch: Patch to apply; ``UNSET`` fields are left unchanged.
+        creator_names: Display names for creators not already on ``map_``.
+
+    Raises:
+        ValueError: If a creator has no known display name.
+    """
+    values = {name: value for name in PATCH_FIELDS if (value := getattr(patch, name)) is not UNSET}
+    return _apply(map_, values, creator_names)
+
+
+def apply_map_edit(
+    map_: MapResponse,
+    edit: MapEditChangesResponse,
+    *,
+    creator_names: Mapping[int, str] | None = None,
+) -> MapResponse:
+    """Return a copy of ``map_`` with the proposed fields of an accepted map edit applied.
+
+    ``None`` fields of ``edit`` are unchanged. ``custom_banner`` is skipped because the banner
+    URL is resolved by the server.
+
+    Args:
+        map_: Current version of the map; it is not modified.
+        edit: The ``fields`` of a ``MapEditResponse``.
+        creator_names: Display names for creators not already on ``map_``.
+
+    Raises:
+        ValueError: If a creator has no known display name.
+    """
+    values = {name: value for name in PATCH_FIELDS if (value := getattr(edit, name, None)) is not None}
+    return _apply(map_, values, creator_names)
@@ -0,0 +1,168 @@
+"""Bitmask encodings of map mechanics and restrictions.
+
+:class:`MechanicsFlag` and :class:`RestrictionsFlag` are ``IntFlag`` types generated from the
+:data:`~genjipk_sdk.maps.Mechanics` and :data:`~genjipk_sdk.maps.Restrictions` Literals: each
+value gets the bit of its position in the Literal and a member named after the value itself,
+so ``MechanicsFlag["Bhop"]`` is the flag for ``"Bhop"``. Bits follow definition order, so new
+values must be appended to the Literals to keep existing masks valid.
+
+"Has all of these and none of those" then becomes ``mask & required == required and not
+mask & excluded`` instead of scanning the string lists. The ``masks_*`` helpers apply these
+tests to a whole column of masks with NumPy when it is installed
+(``pip install genjipk-sdk[numpy]``) and fall back to plain Python otherwise.
+
+:data:`MechanicsMask` and :data:`RestrictionsMask` are the validated wire types of these
+masks in compact payloads; ``CompactCodec(MapResponse, flag_masks=True)`` in
+:mod:`~genjipk_sdk.compact` writes them in place of the string lists and decodes them back.
+"""
+
+from __future__ import annotations
+
+import enum
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Annotated, TypeVar, get_args
+
+from msgspec import Meta
+
+from .maps import Mechanics, Restrictions
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+    MaskColumn = Sequence[int] | NDArray[np.integer]
+
+    class MechanicsFlag(enum.IntFlag):
+        """Bit set of :data:`~genjipk_sdk.maps.Mechanics` values."""
+
+    class RestrictionsFlag(enum.IntFlag):
+        """Bit set of :data:`~genjipk_sdk.maps.Restrictions` values."""
+
+else:
+    try:
+        import numpy as np
+    except ImportError:  # pragma: no cover - optional dependency
+        np = None
+
+    def _flag_type(name: str, values: tuple[str, ...], doc: str) -> type[enum.IntFlag]:
+        flag = enum.IntFlag(name, [(value, 1 << bit) for bit, value in enumerate(values)], module=__name__)
+        flag.__doc__ = doc
+        return flag
+
+    MechanicsFlag = _flag_type("MechanicsFlag", get_args(Mechanics), "Bit set of ``Mechanics`` values.")
+    RestrictionsFlag = _flag_type("RestrictionsFlag", get_args(Restrictions), "Bit set of ``Restrictions`` values.")
+
+__all__ = (
+    "HAS_NUMPY",
+    "MechanicsFlag",
+    "MechanicsMask",
+    "RestrictionsFlag",
+    "RestrictionsMask",
+    "decode_mechanics",
+    "decode_restrictions",
+    "encode_mechanics",
+    "encode_restrictions",
+    "masks_have_all",
+    "masks_have_none",
+    "select_by_masks",
+)
+
+T = TypeVar("T")
+
+HAS_NUMPY = np is not None
+
+_MECHANICS: tuple[Mechanics, ...] = get_args(Mechanics)
+_RESTRICTIONS: tuple[Restrictions, ...] = get_args(Restrictions)
+
+MechanicsMask = Annotated[int, Meta(ge=0, lt=1 << len(_MECHANICS))]
+RestrictionsMask = Annotated[int, Meta(ge=0, lt=1 << len(_RESTRICTIONS))]
+
+_MECHANICS_BITS: dict[Mechanics, int] = {value: 1 << bit for bit, value in enumerate(_MECHANICS)}
+_RESTRICTIONS_BITS: dict[Restrictions, int] = {value: 1 << bit for bit, value in enumerate(_RESTRICTIONS)}
+
+
+def _encode(bits: dict[T, int], values: Iterable[T]) -> int:
+    mask = 0
+    try:
+        for value in values:
+            mask |= bits[value]
+    except KeyError as exc:
+        raise ValueError(f"Unknown value {exc.args[0]!r}") from None
+    return mask
+
+
+def _decode(names: tuple[T, ...], mask: int) -> list[T]:
+    if mask >> len(names):
+        raise ValueError(f"Mask {mask:#x} has bits outside the {len(names)} known values")
+    return [name for bit, name in enumerate(names) if mask >> bit & 1]
+
+
+def encode_mechanics(values: Iterable[Mechanics]) -> MechanicsFlag:
+    """Return the flag set of ``values``, e.g. ``MapResponse.mechanics``.
+
+    Raises:
+        ValueError: If a value is not a known mechanic.
+    """
+    return MechanicsFlag(_encode(_MECHANICS_BITS, values))
+
+
+def encode_restrictions(values: Iterable[Restrictions]) -> RestrictionsFlag:
+    """Return the flag set of ``values``, e.g. ``MapResponse.restrictions``.
+
+    Raises:
+        ValueError: If a value is not a known restriction.
+    """
+    return RestrictionsFlag(_encode(_RESTRICTIONS_BITS, values))
+
+
+def decode_mechanics(mask: int) -> list[Mechanics]:
+    """Return the mechanics set in ``mask``, in ``Mechanics`` definition order.
+
+    Raises:
+        ValueError: If ``mask`` has bits beyond the known mechanics.
+    """
+    return _decode(_MECHANICS, mask)
+
+
+def decode_restrictions(mask: int) -> list[Restrictions]:
+    """Return the restrictions set in ``mask``, in ``Restrictions`` definition order.
+
+    Raises:
+        ValueError: If ``mask`` has bits beyond the known restrictions.
+    """
+    return _decode(_RESTRICTIONS, mask)
+
+
+def masks_have_all(masks: MaskColumn, flags: int) -> NDArray[np.bool_] | list[bool]:
+    """Return, per mask, whether ``flags`` is a subset of it.
+
+    Returns:
+        A boolean NumPy array when NumPy is installed, otherwise a list.
+    """
+    if np is not None:
+        flags = int(flags)  # IntFlag members would make NumPy fall back to object arithmetic
+        return (np.asarray(masks) & flags) == flags
+    return [mask & flags == flags for mask in masks]
+
+
+def masks_have_none(masks: MaskColumn, flags: int) -> NDArray[np.bool_] | list[bool]:
+    """Return, per mask, whether it is disjoint from ``flags``.
+
+    Returns:
+        A boolean NumPy array when NumPy is installed, otherwise a list.
+    """
+    if np is not None:
+        return (np.asarray(masks) & int(flags)) == 0
+    return [not mask & flags for mask in masks]
+
+
+def select_by_masks(values: Sequence[T], masks: MaskColumn, *, all_of: int = 0, none_of: int = 0) -> list[T]:
+    """Return the ``values`` whose mask at the same position has all of ``all_of`` and none of ``none_of``.
+
+    ``values`` and ``masks`` are parallel columns, e.g. map ids and their flag masks.
+    """
+    if np is not None:
+        column, all_of, none_of = np.asarray(masks), int(all_of), int(none_of)
+        keep = ((column & all_of) == all_of) & ((column & none_of) == 0)
+        return np.asarray(values)[keep].tolist()
+    return [value for value, mask in zip(values, masks, strict=True) if mask & all_of == all_of and not mask & none_of]
@@ -2,16 +2,21 @@ from __future__ import annotations
 
 import datetime as dt
 import re
-from typing import Annotated, Literal
+import sys
+from collections import Counter
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Annotated, Literal, NamedTuple, get_args
 
 from msgspec import UNSET, Meta, Struct, UnsetType, ValidationError
 
+from .assets import asset_url, urls_deferred
 from .difficulties import DifficultyAll, DifficultyTop
-from .helpers import sanitize_string
 from .internal import JobStatusResponse
 from .users import Creator, CreatorFull
 
 __all__ = (
+    "MAP_BANNERS",
     "MAX_CREATORS",
     "PLAYTEST_VOTE_THRESHOLD",
     "URL_PATTERN",
@@ -21,6 +26,7 @@ __all__ = (
     "GuideResponse",
     "GuideURL",
     "LinkMapsCreateRequest",
+    "MapBannerCacheInfo",
     "MapCategory",
     "MapCompletionStatisticsResponse",
     "MapCountsResponse",
@@ -70,6 +76,7 @@ __all__ = (
     "UnlinkMapsCreateRequest",
     "XPMultiplierRequest",
     "get_map_banner",
+    "get_map_banner_cache_info",
 )
 
 MAX_CREATORS = 3
@@ -440,7 +447,8 @@ class MapResponse(Struct):
         description: Optional map description.
         medals: Medal thresholds for the map.
         title: Optional display title for the map.
-        map_banner: Banner asset URL.
+        map_banner: Banner asset URL; the default banner of ``map_name`` when none is set.
+            Stays as decoded after a ``defer_urls`` decode until ``resolve_urls()`` is called.
         time: Best recorded time for the map.
         total_results: Total results when returned in paginated queries.
         linked_code: Workshop code linked to this map.
@@ -476,6 +484,11 @@ class MapResponse(Struct):
     def __post_init__(self) -> None:
         """Post init."""
         self.creators.sort(key=lambda c: not c.is_primary)
+        if not urls_deferred():
+            self.resolve_urls()
+
+    def resolve_urls(self) -> None:
+        """Fill in the default map banner when none was provided."""
         if not self.map_banner:
             self.map_banner = get_map_banner(self.map_name)
 
@@ -689,7 +702,8 @@ class MapMasteryResponse(Struct):
         map_name: Name of the Overwatch map.
         amount: Number of mastery completions.
         level: Computed mastery level name.
-        icon_url: Asset URL for the mastery icon.
+        icon_url: Asset URL for the mastery icon. Stays as decoded after a ``defer_urls`` decode
+            until ``resolve_urls()`` is called.
     """
 
     map_name: OverwatchMap
@@ -700,6 +714,11 @@ class MapMasteryResponse(Struct):
     def __post_init__(self) -> None:
         """Post init."""
         self.level = self._level()
+        if not urls_deferred():
+            self.resolve_urls()
+
+    def resolve_urls(self) -> None:
+        """Compute the mastery icon URL."""
         self.icon_url = self._icon_url()
 
     def _level(self) -> str:
@@ -720,10 +739,8 @@ class MapMasteryResponse(Struct):
         return icon_name
 
     def _icon_url(self) -> str:
-        _sanitized_map_name = sanitize_string(self.map_name)
         assert self.level
-        _lowered_level = self.level.lower()
-        return f"assets/mastery/{_sanitized_map_name}_{_lowered_level}.webp"
+        return asset_url("mastery", self.map_name, self.level)
 
 
 class PlaytestApproveRequest(Struct):
@@ -1027,8 +1044,47 @@ PLAYTEST_VOTE_THRESHOLD: dict[DifficultyTop, int] = {
 }
 
 
+_MAP_BANNER_URL = "https://bkan0n.com/assets/images/map_banners/{}.png"
+_MAP_BANNER_STRIP = re.compile(r"[^a-zA-Z0-9]")
+
+
+def _build_map_banner(map_name: str) -> str:
+    sanitized_name = _MAP_BANNER_STRIP.sub("", map_name).lower()
+    return sys.intern(_MAP_BANNER_URL.format(sanitized_name))
+
+
+MAP_BANNERS: Mapping[str, str] = MappingProxyType({name: _build_map_banner(name) for name in get_args(OverwatchMap)})
+
+_map_banner_stats: Counter[str] = Counter()
+
+
+class MapBannerCacheInfo(NamedTuple):
+    """Lookup statistics for :func:`get_map_banner`.
+
+    Attributes:
+        hits: Lookups answered from :data:`MAP_BANNERS`.
+        misses: Lookups for unknown map names that fell back to the regex.
+        size: Number of precomputed banners.
+    """
+
+    hits: int
+    misses: int
+    size: int
+
+
 def get_map_banner(map_name: str) -> str:
-    """Get the applicable map banner."""
-    _map = re.sub(r"[^a-zA-Z0-9]", "", map_name)
-    sanitized_name = _map.lower().strip().replace(" ", "")
-    return f"https://bkan0n.com/assets/images/map_banners/{sanitized_name}.png"
+    """Get the applicable map banner.
+
+    Known :data:`OverwatchMap` names are served from the precomputed :data:`MAP_BANNERS` table.
+    """
+    banner = MAP_BANNERS.get(map_name)
+    if banner is not None:
+        _map_banner_stats["hits"] += 1
+        return banner
+    _map_banner_stats["misses"] += 1
+    return _build_map_banner(map_name)
+
+
+def get_map_banner_cache_info() -> MapBannerCacheInfo:
+    """Return hit/miss counters for :func:`get_map_banner`."""
+    return MapBannerCacheInfo(_map_banner_stats["hits"], _map_banner_stats["misses"], len(MAP_BANNERS))
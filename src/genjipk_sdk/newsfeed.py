@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 import datetime as dt
-from typing import Literal
+from collections.abc import Callable
+from typing import Generic, Literal, TypeVar, get_args
 
+import msgspec
 from msgspec import Struct
 
+from .assets import urls_deferred
 from .difficulties import DifficultyAll
 from .internal import JobStatusResponse
 from .maps import GuideURL, MedalType, OverwatchCode, OverwatchMap, get_map_banner
 
 __all__ = (
+    "NEWSFEED_PAYLOAD_TYPES",
     "NewsfeedAnnouncement",
     "NewsfeedArchive",
     "NewsfeedBulkArchive",
@@ -19,6 +23,7 @@ __all__ = (
     "NewsfeedEventType",
     "NewsfeedFieldChange",
     "NewsfeedGuide",
+    "NewsfeedHandler",
     "NewsfeedLegacyRecord",
     "NewsfeedLinkedMap",
     "NewsfeedMapEdit",
@@ -26,10 +31,13 @@ __all__ = (
     "NewsfeedPayload",
     "NewsfeedRecord",
     "NewsfeedRole",
+    "NewsfeedRouter",
     "NewsfeedScalar",
     "NewsfeedUnarchive",
     "NewsfeedUnlinkedMap",
     "PublishNewsfeedJobResponse",
+    "RawNewsfeedEvent",
+    "peek_payload_type",
 )
 
 
@@ -95,7 +103,8 @@ class NewsfeedNewMap(_TaggedPayload, tag="new_map", kw_only=True):
         difficulty: Difficulty rating for the map.
         creators: List of creator names.
         title: Optional display title for the map.
-        banner_url: URL for the map banner.
+        banner_url: URL for the map banner. Stays as decoded after a ``defer_urls`` decode
+            until ``resolve_urls()`` is called.
         official: Whether the map is official.
     """
 
@@ -108,7 +117,12 @@ class NewsfeedNewMap(_TaggedPayload, tag="new_map", kw_only=True):
     official: bool = True
 
     def __post_init__(self) -> None:
-        """Set the map banner dynamically."""
+        """Set the map banner dynamically unless URLs are deferred."""
+        if not urls_deferred():
+            self.resolve_urls()
+
+    def resolve_urls(self) -> None:
+        """Set the map banner when none was provided."""
         if not self.banner_url:
             self.banner_url = get_map_banner(self.map_name)
 
@@ -346,3 +360,160 @@ class PublishNewsfeedJobResponse(Struct):
 
     job_status: JobStatusResponse
     newsfeed_id: int
+
+
+class _PayloadTagPeek(Struct):
+    type: str
+
+
+class _NewsfeedEventPeek(Struct):
+    """Partial view of a ``NewsfeedEvent``; msgspec skips every other field without validating it."""
+
+    payload: _PayloadTagPeek
+
+
+_PEEK_JSON_DECODER = msgspec.json.Decoder(_NewsfeedEventPeek)
+_PEEK_MSGPACK_DECODER = msgspec.msgpack.Decoder(_NewsfeedEventPeek)
+
+
+def peek_payload_type(buf: bytes | bytearray | memoryview, *, msgpack: bool = False) -> str:
+    """Return ``payload.type`` of an encoded ``NewsfeedEvent`` without decoding the payload.
+
+    Args:
+        buf: A JSON (or MessagePack, when ``msgpack`` is set) encoded ``NewsfeedEvent``.
+        msgpack: Whether ``buf`` is MessagePack instead of JSON.
+    """
+    decoder = _PEEK_MSGPACK_DECODER if msgpack else _PEEK_JSON_DECODER
+    return decoder.decode(buf).payload.type
+
+
+P = TypeVar("P", bound=_TaggedPayload)
+R = TypeVar("R")
+
+NEWSFEED_PAYLOAD_TYPES: dict[str, type[_TaggedPayload]] = {
+    cls.__struct_config__.tag: cls  # pyright: ignore[reportAttributeAccessIssue]
+    for cls in get_args(NewsfeedPayload)
+}
+
+
+class _PayloadOnly(Struct, Generic[P]):
+    """``NewsfeedEvent`` with the payload narrowed to a single variant and everything else skipped."""
+
+    payload: P
+
+
+_EVENT_JSON_DECODER = msgspec.json.Decoder(NewsfeedEvent)
+_EVENT_MSGPACK_DECODER = msgspec.msgpack.Decoder(NewsfeedEvent)
+_PAYLOAD_DECODERS: dict[tuple[str, bool], msgspec.json.Decoder | msgspec.msgpack.Decoder] = {}
+
+
+def _payload_decoder(type_: str, msgpack: bool) -> msgspec.json.Decoder | msgspec.msgpack.Decoder:
+    decoder = _PAYLOAD_DECODERS.get((type_, msgpack))
+    if decoder is None:
+        target = _PayloadOnly[NEWSFEED_PAYLOAD_TYPES[type_]]
+        decoder = msgspec.msgpack.Decoder(target) if msgpack else msgspec.json.Decoder(target)
+        _PAYLOAD_DECODERS[type_, msgpack] = decoder
+    return decoder
+
+
+class RawNewsfeedEvent:
+    """An encoded ``NewsfeedEvent`` whose payload type is known but which has not been decoded.
+
+    Handlers registered on a :class:`NewsfeedRouter` receive one of these and decide how much
+    of it to decode.
+
+    Attributes:
+        type: The payload type (``payload.type``).
+        raw: The encoded event, exactly as passed to :meth:`NewsfeedRouter.dispatch`.
+        msgpack: Whether ``raw`` is MessagePack instead of JSON.
+    """
+
+    __slots__ = ("msgpack", "raw", "type")
+
+    def __init__(self, type_: str, raw: bytes | bytearray | memoryview, *, msgpack: bool = False) -> None:
+        """Wrap ``raw``, already known to carry a ``type_`` payload."""
+        self.type = type_
+        self.raw = raw
+        self.msgpack = msgpack
+
+    def __repr__(self) -> str:
+        """Return a short description of the event."""
+        return f"RawNewsfeedEvent(type={self.type!r}, size={len(self.raw)})"
+
+    def payload(self) -> _TaggedPayload:
+        """Decode and validate only the concrete payload variant, e.g. ``NewsfeedRecord``."""
+        return _payload_decoder(self.type, self.msgpack).decode(self.raw).payload
+
+    def event(self) -> NewsfeedEvent:
+        """Decode the complete ``NewsfeedEvent``."""
+        decoder = _EVENT_MSGPACK_DECODER if self.msgpack else _EVENT_JSON_DECODER
+        return decoder.decode(self.raw)
+
+
+NewsfeedHandler = Callable[[RawNewsfeedEvent], R]
+
+
+class NewsfeedRouter(Generic[R]):
+    """Route encoded newsfeed events to per-type handlers without decoding them up front.
+
+    :meth:`dispatch` only peeks at ``payload.type`` (see :func:`peek_payload_type`). Events
+    without a handler are dropped, or passed to ``default`` when one is given, so workers that
+    only care about a few event types never pay for validating the rest.
+
+    Example:
+        router = NewsfeedRouter()
+
+        @router.register("record", "legacy_record")
+        def on_record(event: RawNewsfeedEvent) -> None:
+            payload = event.payload()
+            ...
+
+        router.dispatch(message_body)
+    """
+
+    def __init__(self, *, msgpack: bool = False, default: NewsfeedHandler[R] | None = None) -> None:
+        """Create an empty router.
+
+        Args:
+            msgpack: Whether dispatched events are MessagePack instead of JSON.
+            default: Handler for payload types without a registered handler.
+        """
+        self.msgpack = msgpack
+        self.default = default
+        self._handlers: dict[str, NewsfeedHandler[R]] = {}
+
+    def add_handler(self, type_: NewsfeedEventType, handler: NewsfeedHandler[R]) -> None:
+        """Register ``handler`` for payloads of ``type_``, replacing any previous handler.
+
+        Raises:
+            ValueError: If ``type_`` is not a known payload type.
+        """
+        if type_ not in NEWSFEED_PAYLOAD_TYPES:
+            raise ValueError(f"Unknown newsfeed payload type: {type_}")
+        self._handlers[type_] = handler
+
+    def register(self, *types: NewsfeedEventType) -> Callable[[NewsfeedHandler[R]], NewsfeedHandler[R]]:
+        """Decorator form of :meth:`add_handler` for one or more payload types."""
+
+        def decorator(handler: NewsfeedHandler[R]) -> NewsfeedHandler[R]:
+            for type_ in types:
+                self.add_handler(type_, handler)
+            return handler
+
+        return decorator
+
+    def handles(self, type_: str) -> bool:
+        """Return whether events of ``type_`` would reach a handler."""
+        return type_ in self._handlers or self.default is not None
+
+    def dispatch(self, buf: bytes | bytearray | memoryview) -> R | None:
+        """Route one encoded event to its handler.
+
+        Returns:
+            The handler's result, or ``None`` when no handler (and no default) matched.
+        """
+        type_ = peek_payload_type(buf, msgpack=self.msgpack)
+        handler = self._handlers.get(type_, self.default)
+        if handler is None:
+            return None
+        return handler(RawNewsfeedEvent(type_, buf, msgpack=self.msgpack))
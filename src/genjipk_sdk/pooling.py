@@ -0,0 +1,88 @@
+"""String pooling for high-volume decodes.
+
+msgspec already returns shared objects for ``Literal`` fields such as ``map_name``,
+``difficulty`` and ``medal``, but plain ``str`` fields get a fresh object per row even when
+the same workshop code or runner name repeats across a whole page. A :class:`StringPool`
+maps every distinct value to one shared instance; pass it to the decode functions in
+:mod:`genjipk_sdk.codec` to pool the fields listed in :data:`POOLED_FIELDS`.
+"""
+
+from collections.abc import Iterable, Mapping, Sequence
+
+from msgspec import Struct
+
+from .completions import CompletionResponse
+from .users import CommunityLeaderboardResponse
+
+__all__ = (
+    "POOLED_FIELDS",
+    "StringPool",
+    "pool_strings",
+)
+
+# Repetitive, non-Literal string fields worth pooling, per Struct type.
+POOLED_FIELDS: Mapping[type[Struct], tuple[str, ...]] = {
+    CompletionResponse: ("code", "name", "also_known_as"),
+    CommunityLeaderboardResponse: ("tier_name", "skill_rank"),
+}
+
+
+class StringPool:
+    """Maps equal strings to a single shared instance.
+
+    Unlike ``sys.intern`` the pool is owned by the caller, so dropping it releases every
+    string it holds once the decoded objects are gone.
+    """
+
+    __slots__ = ("_strings",)
+
+    def __init__(self) -> None:
+        """Create an empty pool."""
+        self._strings: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        """Return the number of distinct strings in the pool."""
+        return len(self._strings)
+
+    def __contains__(self, value: object) -> bool:
+        """Return whether ``value`` is pooled."""
+        return value in self._strings
+
+    def intern(self, value: str) -> str:
+        """Return the pooled instance equal to ``value``, adding it if needed."""
+        return self._strings.setdefault(value, value)
+
+    def clear(self) -> None:
+        """Forget every pooled string."""
+        self._strings.clear()
+
+
+def pool_strings(
+    objs: Struct | Iterable[Struct],
+    fields: Sequence[str] | None = None,
+    *,
+    pool: StringPool | None = None,
+) -> StringPool:
+    """Replace string fields of ``objs`` with pooled instances, in place.
+
+    Args:
+        objs: A Struct or an iterable of Structs, e.g. a decoded page of completions.
+        fields: Fields to pool. Defaults to :data:`POOLED_FIELDS` for each object's type;
+            objects of other types are left untouched.
+        pool: Pool to share across calls; a new one is created when omitted.
+
+    Returns:
+        The pool used.
+    """
+    if pool is None:
+        pool = StringPool()
+    intern = pool.intern
+    for obj in (objs,) if isinstance(objs, Struct) else objs:
+        if not isinstance(obj, Struct):
+            continue
+        names = fields if fields is not None else POOLED_FIELDS.get(type(obj), ())
+        for name in names:
+            value = getattr(obj, name)
+            if isinstance(value, str):
+                setattr(obj, name, intern(value))
+    return pool
@@ -2,8 +2,8 @@ from __future__ import annotations
 
 from msgspec import Struct
 
+from .assets import asset_url, urls_deferred
 from .difficulties import DifficultyTop
-from .helpers import sanitize_string
 
 __all__ = (
     "AvatarResponse",
@@ -16,24 +16,30 @@ __all__ = (
 
 class BackgroundResponse(Struct):
     name: str | None
+    # Derived in ``__post_init__``; left empty by a ``defer_urls`` decode until ``resolve_urls()``.
     url: str = ""
 
     def __post_init__(self) -> None:
         """Normalize fields and build the background asset URL.
 
         - Ensures ``name`` is set (defaults to ``"placeholder"`` if falsy).
-        - Sanitizes ``name`` via :func:`sanitize_string`.
-        - Populates ``url`` as ``assets/rank_card/background/{sanitized}.webp``.
+        - Populates ``url`` via :meth:`resolve_urls` unless URLs are deferred.
         """
         if not self.name:
             self.name = "placeholder"
-        self.url = f"assets/rank_card/background/{sanitize_string(self.name)}.webp"
+        if not urls_deferred():
+            self.resolve_urls()
+
+    def resolve_urls(self) -> None:
+        """Populate ``url`` as ``assets/rank_card/background/{sanitized}.webp``."""
+        self.url = asset_url("background", self.name)
 
 
 class AvatarResponse(Struct):
     skin: str | None = "Overwatch 1"
     pose: str | None = "Heroic"
 
+    # Derived in ``__post_init__``; left empty by a ``defer_urls`` decode until ``resolve_urls()``.
     url: str = ""
 
     def __post_init__(self) -> None:
@@ -41,15 +47,18 @@ class AvatarResponse(Struct):
 
         - Sets default ``skin`` (``"Overwatch 1"``) and ``pose`` (``"Heroic"``)
           when falsy.
-        - Sanitizes ``skin`` and ``pose`` via :func:`sanitize_string`.
-        - Populates ``url`` as
-          ``assets/rank_card/avatar/{skin}/{pose}.webp``.
+        - Populates ``url`` via :meth:`resolve_urls` unless URLs are deferred.
         """
         if not self.skin:
             self.skin = "Overwatch 1"
         if not self.pose:
             self.pose = "Heroic"
-        self.url = f"assets/rank_card/avatar/{sanitize_string(self.skin)}/{sanitize_string(self.pose)}.webp"
+        if not urls_deferred():
+            self.resolve_urls()
+
+    def resolve_urls(self) -> None:
+        """Populate ``url`` as ``assets/rank_card/avatar/{skin}/{pose}.webp``."""
+        self.url = asset_url("avatar", self.skin, self.pose)
 
 
 class RankCardBadgeSettings(Struct):
@@ -98,14 +107,20 @@ class RankCardResponse(Struct):
     community_rank: str
     prestige_level: int
 
+    # Derived in ``__post_init__``; left empty by a ``defer_urls`` decode until ``resolve_urls()``.
     background_url: str = ""
     rank_url: str = ""
     avatar_url: str = ""
 
     def __post_init__(self) -> None:
+        """Compute asset URLs unless URLs are deferred."""
+        if not urls_deferred():
+            self.resolve_urls()
+
+    def resolve_urls(self) -> None:
         """Compute and populate asset URLs for background, rank, and avatar.
 
-        Uses :func:`sanitize_string` to normalize:
+        Uses :func:`~genjipk_sdk.assets.asset_url` to resolve:
         - ``background`` → ``background_url`` as
           ``assets/rank_card/background/{sanitized}.webp``
         - ``rank_name`` → ``rank_url`` as
@@ -113,8 +128,6 @@ class RankCardResponse(Struct):
         - ``avatar_skin`` and ``avatar_pose`` → ``avatar_url`` as
           ``assets/rank_card/avatar/{skin}/{pose}.webp``
         """
-        self.background_url = f"assets/rank_card/background/{sanitize_string(self.background)}.webp"
-        self.rank_url = f"assets/ranks/{sanitize_string(self.rank_name)}.webp"
-        self.avatar_url = (
-            f"assets/rank_card/avatar/{sanitize_string(self.avatar_skin)}/{sanitize_string(self.avatar_pose)}.webp"
-        )
+        self.background_url = asset_url("background", self.background)
+        self.rank_url = asset_url("rank", self.rank_name)
+        self.avatar_url = asset_url("avatar", self.avatar_skin, self.avatar_pose)
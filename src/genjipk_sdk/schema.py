@@ -0,0 +1,369 @@
+"""Schema fingerprints and wire-compatibility checks for the SDK Structs.
+
+The API, the bot and the workers are deployed independently, so two processes can hold
+different definitions of the same model. :func:`snapshot` walks every exported Struct with
+``msgspec.inspect`` and records its fields, wire names, types and defaults together with a
+stable fingerprint per type and one for the whole package. :func:`diff_schemas` compares two
+snapshots and classifies each change:
+
+* ``breaking`` - a payload written by one side may fail to decode, or decode wrongly, on the
+  other side in the regular named (map) form.
+* ``array_breaking`` - the same, for the positional ``array_like`` form used by
+  :mod:`genjipk_sdk.compact`. Reordering fields, or adding them anywhere but the end, breaks
+  only this form.
+
+Snapshots are plain Structs, so a release can store ``msgspec.json.encode(snapshot())`` and CI
+can diff the next build against it.
+
+Example:
+    old = msgspec.json.decode(path.read_bytes(), type=SchemaSnapshot)
+    diff = diff_schemas(old, snapshot())
+    for change in diff.changes:
+        print(change)
+    if diff.breaking:
+        raise SystemExit(1)
+"""
+
+import enum
+import functools
+import hashlib
+from collections.abc import Iterable, Iterator
+from typing import Literal
+
+import msgspec
+import msgspec.inspect as mi
+from msgspec import Struct
+
+from .codec import iter_struct_types
+
+__all__ = (
+    "FieldSchema",
+    "SchemaChange",
+    "SchemaChangeKind",
+    "SchemaDiff",
+    "SchemaSnapshot",
+    "TypeSchema",
+    "diff_schemas",
+    "fingerprint",
+    "package_fingerprint",
+    "snapshot",
+    "type_schema",
+)
+
+SchemaChangeKind = Literal[
+    "type_added",
+    "type_removed",
+    "config_changed",
+    "field_added",
+    "field_removed",
+    "field_type_changed",
+    "field_required_changed",
+    "field_default_changed",
+    "field_moved",
+]
+
+
+class FieldSchema(Struct, frozen=True):
+    """Wire-relevant description of one Struct field.
+
+    Attributes:
+        name: Python attribute name.
+        encode_name: Name used on the wire.
+        type: Canonical text form of the field type; nested Structs appear by name.
+        required: Whether the field has no default.
+        default: ``repr`` of the default value or factory, or ``None`` if required.
+    """
+
+    name: str
+    encode_name: str
+    type: str
+    required: bool
+    default: str | None = None
+
+
+class TypeSchema(Struct, frozen=True):
+    """Wire-relevant description of one Struct type.
+
+    Attributes:
+        name: Module-qualified type name, e.g. ``maps.MapResponse``.
+        fingerprint: Digest of this type and every Struct reachable from its fields.
+        fields: Fields in definition order.
+        array_like: Whether the type encodes as an array.
+        tag_field: Tag field name of a tagged union member, if any.
+        tag: Tag value of a tagged union member, if any.
+        forbid_unknown_fields: Whether unknown fields are rejected on decode.
+    """
+
+    name: str
+    fingerprint: str
+    fields: tuple[FieldSchema, ...]
+    array_like: bool = False
+    tag_field: str | None = None
+    tag: str | int | None = None
+    forbid_unknown_fields: bool = False
+
+
+class SchemaSnapshot(Struct, frozen=True):
+    """Schemas of a set of Structs, keyed by type name.
+
+    Attributes:
+        fingerprint: Digest over every type fingerprint; equal snapshots have equal values.
+        types: Type schemas keyed by :attr:`TypeSchema.name`.
+    """
+
+    fingerprint: str
+    types: dict[str, TypeSchema]
+
+
+class SchemaChange(Struct, frozen=True):
+    """One difference between two schemas.
+
+    Attributes:
+        type_name: Affected type.
+        field: Affected field's wire name, or ``None`` for type-level changes.
+        kind: What changed.
+        detail: Human-readable description.
+        breaking: Whether the change breaks the named wire form.
+        array_breaking: Whether the change breaks the positional ``array_like`` form.
+    """
+
+    type_name: str
+    field: str | None
+    kind: SchemaChangeKind
+    detail: str
+    breaking: bool
+    array_breaking: bool
+
+    def __str__(self) -> str:
+        """Return a one-line summary of the change."""
+        where = self.type_name if self.field is None else f"{self.type_name}.{self.field}"
+        level = "breaking" if self.breaking else "array-breaking" if self.array_breaking else "compatible"
+        return f"[{level}] {where}: {self.detail}"
+
+
+class SchemaDiff(Struct, frozen=True):
+    """Result of :func:`diff_schemas`.
+
+    Attributes:
+        changes: Every detected change, ordered by type name.
+    """
+
+    changes: tuple[SchemaChange, ...] = ()
+
+    @property
+    def breaking(self) -> bool:
+        """Whether any change breaks the named wire form."""
+        return any(change.breaking for change in self.changes)
+
+    @property
+    def array_breaking(self) -> bool:
+        """Whether any change breaks the positional ``array_like`` form."""
+        return any(change.breaking or change.array_breaking for change in self.changes)
+
+    @property
+    def compatible(self) -> bool:
+        """Whether both wire forms are unaffected."""
+        return not self.array_breaking
+
+
+def _type_name(cls: type) -> str:
+    module = cls.__module__.removeprefix("genjipk_sdk.")
+    return f"{module}.{cls.__qualname__}"
+
+
+def _children(t: mi.Type) -> Iterator[mi.Type]:
+    for name in t.__struct_fields__:
+        value = getattr(t, name)
+        if isinstance(value, mi.Type):
+            yield value
+        elif isinstance(value, tuple):
+            yield from (item for item in value if isinstance(item, mi.Type))
+
+
+def _type_text(t: mi.Type) -> str:
+    """Return a canonical, order-insensitive text form of ``t``."""
+    while isinstance(t, mi.Metadata):
+        t = t.type
+    if isinstance(t, mi.StructType):
+        return _type_name(t.cls)
+    if isinstance(t, mi.UnionType):
+        return "|".join(sorted(_type_text(member) for member in t.types))
+    if isinstance(t, mi.LiteralType):
+        return f"literal[{','.join(sorted(msgspec.json.encode(value).decode() for value in t.values))}]"
+    if isinstance(t, mi.EnumType):
+        values = sorted(repr(member.value) for member in t.cls)
+        return f"enum:{_type_name(t.cls)}[{','.join(values)}]"
+    if isinstance(t, (mi.CustomType, mi.DataclassType, mi.NamedTupleType, mi.TypedDictType)):
+        return f"{type(t).__name__.removesuffix('Type').lower()}:{_type_name(t.cls)}"
+    args = [_type_text(child) for child in _children(t)]
+    constraints = [
+        f"{name}={value!r}"
+        for name in t.__struct_fields__
+        if (value := getattr(t, name)) is not None and not isinstance(value, (mi.Type, tuple))
+    ]
+    text = type(t).__name__.removesuffix("Type").lower()
+    if args:
+        text += f"[{','.join(args)}]"
+    if constraints:
+        text += f"({','.join(constraints)})"
+    return text
+
+
+def _default_text(field: mi.Field) -> str | None:
+    if field.default is not msgspec.NODEFAULT:
+        default = field.default
+        return default.name if isinstance(default, enum.Enum) else repr(default)
+    if field.default_factory is not msgspec.NODEFAULT:
+        factory = field.default_factory
+        return f"{getattr(factory, '__qualname__', repr(factory))}()"
+    return None
+
+
+def _struct_info(cls: type[Struct]) -> mi.StructType:
+    info = mi.type_info(cls)
+    assert isinstance(info, mi.StructType)
+    return info
+
+
+def _referenced(info: mi.StructType) -> set[type[Struct]]:
+    """Return the Struct types reachable from ``info``'s fields, excluding ``info`` itself."""
+    found: set[type[Struct]] = set()
+    stack: list[mi.Type] = [field.type for field in info.fields]
+    while stack:
+        t = stack.pop()
+        if isinstance(t, mi.StructType):
+            if t.cls in found or t.cls is info.cls:
+                continue
+            found.add(t.cls)
+            stack.extend(field.type for field in t.fields)
+        else:
+            stack.extend(_children(t))
+    return found
+
+
+@functools.cache
+def _own_schema(cls: type[Struct]) -> tuple[mi.StructType, bytes]:
+    info = _struct_info(cls)
+    fields = tuple(
+        FieldSchema(
+            name=field.name,
+            encode_name=field.encode_name,
+            type=_type_text(field.type),
+            required=field.required,
+            default=_default_text(field),
+        )
+        for field in info.fields
+    )
+    encoded = msgspec.json.encode(
+        TypeSchema(
+            name=_type_name(cls),
+            fingerprint="",
+            fields=fields,
+            array_like=info.array_like,
+            tag_field=info.tag_field,
+            tag=info.tag,
+            forbid_unknown_fields=info.forbid_unknown_fields,
+        )
+    )
+    return info, encoded
+
+
+def _digest(parts: Iterable[bytes]) -> str:
+    hasher = hashlib.sha256()
+    for part in parts:
+        hasher.update(part)
+        hasher.update(b"\n")
+    return hasher.hexdigest()[:16]
+
+
+@functools.cache
+def fingerprint(cls: type[Struct]) -> str:
+    """Return a stable 16-character fingerprint of ``cls``.
+
+    The fingerprint covers the wire name, type, default and position of every field, the
+    Struct options that affect encoding, and the schemas of every Struct reachable from the
+    fields, so a change to a nested model also changes the fingerprint of its containers.
+    It depends only on the definitions, not on the process or Python hash seed.
+    """
+    info, own = _own_schema(cls)
+    nested = sorted(_own_schema(other)[1] for other in _referenced(info))
+    return _digest([own, *nested])
+
+
+def type_schema(cls: type[Struct]) -> TypeSchema:
+    """Return the :class:`TypeSchema` of ``cls``."""
+    _, own = _own_schema(cls)
+    schema = msgspec.json.decode(own, type=TypeSchema)
+    return msgspec.structs.replace(schema, fingerprint=fingerprint(cls))
+
+
+def package_fingerprint(types: Iterable[type[Struct]] | None = None) -> str:
+    """Return one fingerprint over ``types``; defaults to every exported SDK Struct."""
+    return snapshot(types).fingerprint
+
+
+def snapshot(types: Iterable[type[Struct]] | None = None) -> SchemaSnapshot:
+    """Capture the schemas of ``types``; defaults to every exported SDK Struct."""
+    schemas = {schema.name: schema for schema in map(type_schema, iter_struct_types() if types is None else types)}
+    ordered = dict(sorted(schemas.items()))
+    package = _digest(f"{name}={schema.fingerprint}".encode() for name, schema in ordered.items())
+    return SchemaSnapshot(fingerprint=package, types=ordered)
+
+
+def _diff_config(old: TypeSchema, new: TypeSchema) -> Iterator[SchemaChange]:
+    for option in ("array_like", "tag_field", "tag", "forbid_unknown_fields"):
+        before, after = getattr(old, option), getattr(new, option)
+        if before != after:
+            yield SchemaChange(old.name, None, "config_changed", f"{option} {before!r} -> {after!r}", True, True)
+
+
+def _diff_fields(old: TypeSchema, new: TypeSchema) -> Iterator[SchemaChange]:
+    name = old.name
+    old_fields = {field.encode_name: (index, field) for index, field in enumerate(old.fields)}
+    new_fields = {field.encode_name: (index, field) for index, field in enumerate(new.fields)}
+    for key, (index, before) in old_fields.items():
+        if key not in new_fields:
+            # Readers on the new side ignore the extra key; old readers fall back to the default.
+            yield SchemaChange(name, key, "field_removed", "field removed", before.required, True)
+            continue
+        new_index, after = new_fields[key]
+        if before.type != after.type:
+            yield SchemaChange(name, key, "field_type_changed", f"type {before.type} -> {after.type}", True, True)
+        if before.required != after.required:
+            detail = "field became required" if after.required else "field became optional"
+            yield SchemaChange(name, key, "field_required_changed", detail, after.required, after.required)
+        elif before.default != after.default:
+            detail = f"default {before.default} -> {after.default}"
+            yield SchemaChange(name, key, "field_default_changed", detail, False, False)
+        if index != new_index:
+            yield SchemaChange(name, key, "field_moved", f"position {index} -> {new_index}", False, True)
+    for key, (index, after) in new_fields.items():
+        if key not in old_fields:
+            # Appending an optional field keeps existing array positions valid.
+            array_breaking = after.required or index < len(old.fields)
+            detail = "required field added" if after.required else "optional field added"
+            yield SchemaChange(name, key, "field_added", detail, after.required, array_breaking)
+
+
+def diff_schemas(old: SchemaSnapshot, new: SchemaSnapshot) -> SchemaDiff:
+    """Compare two snapshots and classify every change.
+
+    A change is compatible when payloads written by either side still decode on the other.
+    Adding an optional field, dropping an optional field or changing a default is compatible;
+    adding a required field, removing a required field, changing a field type or changing the
+    Struct options is breaking. Field order only matters to the ``array_like`` form.
+
+    Changes are reported against the type that defines them; a container whose nested model
+    changed has a new fingerprint but no changes of its own.
+    """
+    changes: list[SchemaChange] = []
+    for name in sorted(old.types.keys() | new.types.keys()):
+        before, after = old.types.get(name), new.types.get(name)
+        if after is None:
+            changes.append(SchemaChange(name, None, "type_removed", "type removed", True, True))
+        elif before is None:
+            changes.append(SchemaChange(name, None, "type_added", "type added", False, False))
+        elif before.fingerprint != after.fingerprint:
+            changes.extend(_diff_config(before, after))
+            changes.extend(_diff_fields(before, after))
+    return SchemaDiff(tuple(changes))
@@ -0,0 +1,109 @@
+import functools
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator
+from typing import IO, TypeVar
+
+from .assets import resolve_deferred_urls
+from .codec import Codec, get_codec
+
+__all__ = (
+    "DEFAULT_CHUNK_SIZE",
+    "aiter_ndjson",
+    "iter_ndjson",
+    "write_ndjson",
+)
+
+T = TypeVar("T")
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def _iter_chunks(source: IO[bytes] | Iterable[bytes], chunk_size: int) -> Iterator[bytes]:
+    read = getattr(source, "read", None)
+    if read is None:
+        yield from source  # pyright: ignore[reportReturnType]
+        return
+    while chunk := read(chunk_size):
+        yield chunk
+
+
+def _decode_lines(buffer: bytearray, decode: Callable[[memoryview], T]) -> Iterator[T]:
+    """Decode every complete, non-blank line in ``buffer`` and drop them from it afterwards."""
+    start = 0
+    with memoryview(buffer) as view:
+        while (end := buffer.find(b"\n", start)) != -1:
+            if end > start and not (end - start == 1 and buffer[start] == ord("\r")):
+                yield decode(view[start:end])
+            start = end + 1
+    del buffer[:start]
+
+
+def iter_ndjson(
+    source: IO[bytes] | Iterable[bytes],
+    type_: type[T],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    defer_urls: bool = False,
+) -> Iterator[T]:
+    """Decode newline-delimited JSON into ``type_`` one record at a time.
+
+    The source is consumed in chunks and every line is decoded straight from a ``memoryview``
+    over the read buffer with the cached decoder from :func:`~genjipk_sdk.codec.get_codec`, so
+    memory use is bounded by one chunk plus the longest line rather than the whole export.
+
+    Args:
+        source: A binary file object or any iterable of ``bytes`` chunks (e.g. an HTTP body iterator).
+        type_: The type of each record, e.g. ``CompletionResponse``.
+        chunk_size: Bytes to read per call when ``source`` is a file object.
+        defer_urls: Skip derived URL fields; see :func:`~genjipk_sdk.assets.deferred_urls`.
+
+    Yields:
+        One decoded record per non-blank line.
+    """
+    codec: Codec[T] = get_codec(type_)
+    decode = functools.partial(codec.decode_json, defer_urls=defer_urls)
+    buffer = bytearray()
+    for chunk in _iter_chunks(source, chunk_size):
+        buffer += chunk
+        yield from _decode_lines(buffer, decode)
+    if buffer.strip():
+        yield decode(buffer)
+
+
+async def aiter_ndjson(source: AsyncIterable[bytes], type_: type[T], *, defer_urls: bool = False) -> AsyncIterator[T]:
+    """Asynchronous counterpart of :func:`iter_ndjson` for async byte streams."""
+    codec: Codec[T] = get_codec(type_)
+    decode = functools.partial(codec.decode_json, defer_urls=defer_urls)
+    buffer = bytearray()
+    async for chunk in source:
+        buffer += chunk
+        for record in _decode_lines(buffer, decode):
+            yield record
+    if buffer.strip():
+        yield decode(buffer)
+
+
+def write_ndjson(fp: IO[bytes], items: Iterable[object], *, resolve_urls: bool = True) -> int:
+    """Encode ``items`` as newline-delimited JSON into ``fp``.
+
+    A single output buffer is reused for every record.
+
+    Args:
+        fp: Binary file object to write to.
+        items: Records to encode.
+        resolve_urls: Compute URL fields left unset by a ``defer_urls`` decode before encoding
+            each record; see :meth:`~genjipk_sdk.codec.Codec.encode_json`.
+
+    Returns:
+        The number of records written.
+    """
+    encoder = get_codec(object).json_encoder
+    buffer = bytearray()
+    count = 0
+    for item in items:
+        if resolve_urls:
+            resolve_deferred_urls(item)
+        encoder.encode_into(item, buffer)
+        buffer.append(ord("\n"))
+        fp.write(buffer)
+        count += 1
+    return count
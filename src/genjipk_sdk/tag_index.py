@@ -0,0 +1,377 @@
+"""In-process autocomplete index over ``TagRowDTO`` rows.
+
+:class:`TagIndex` answers ``TagsAutocompleteRequest`` locally so bots only need to hit the API
+when the index is cold or invalidated. It stays fresh by replaying executed mutations with
+:meth:`TagIndex.apply_batch` instead of re-querying search pages. Each guild keeps a sorted list of lowercased names for
+prefix search and an inverted trigram index for fuzzy search that mirrors ``pg_trgm``
+similarity (word trigrams padded with two leading spaces and one trailing space, compared with
+the Jaccard index).
+"""
+
+import re
+from bisect import bisect_left, insort
+from collections.abc import Iterable
+from typing import Literal
+
+from msgspec.structs import replace
+
+from .tags import (
+    OpAlias,
+    OpClaim,
+    OpCreate,
+    OpEdit,
+    OpIncrementUsage,
+    OpPurge,
+    OpRemove,
+    OpRemoveById,
+    OpTransfer,
+    TagOp,
+    TagRowDTO,
+    TagsAutocompleteRequest,
+    TagsAutocompleteResponse,
+    TagsMutateRequest,
+    TagsMutateResponse,
+    TagsMutateResult,
+)
+
+__all__ = (
+    "DEFAULT_SIMILARITY_THRESHOLD",
+    "AutocompleteMode",
+    "TagIndex",
+    "trigram_similarity",
+    "trigrams",
+)
+
+AutocompleteMode = Literal["aliased", "non_aliased", "owned_aliased", "owned_non_aliased"]
+
+# Same default as ``pg_trgm.similarity_threshold``.
+DEFAULT_SIMILARITY_THRESHOLD = 0.3
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def trigrams(text: str) -> frozenset[str]:
+    """Return the ``pg_trgm`` trigram set of ``text``."""
+    grams: set[str] = set()
+    for word in _WORD.findall(text.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+def trigram_similarity(a: str, b: str) -> float:
+    """Return the ``pg_trgm`` ``similarity()`` of two strings."""
+    grams_a, grams_b = trigrams(a), trigrams(b)
+    if not grams_a or not grams_b:
+        return 0.0
+    shared = len(grams_a & grams_b)
+    return shared / (len(grams_a) + len(grams_b) - shared)
+
+
+class _GuildTags:
+    """Rows and search structures for a single guild."""
+
+    __slots__ = ("aliases", "by_id", "grams", "postings", "rows", "sorted_keys")
+
+    def __init__(self) -> None:
+        self.rows: dict[str, TagRowDTO] = {}
+        # (lowercased name, name) pairs kept sorted for prefix search.
+        self.sorted_keys: list[tuple[str, str]] = []
+        self.grams: dict[str, frozenset[str]] = {}
+        self.postings: dict[str, set[str]] = {}
+        self.by_id: dict[int, str] = {}
+        # Canonical name -> names of its aliases.
+        self.aliases: dict[str, set[str]] = {}
+
+    def add(self, row: TagRowDTO) -> None:
+        name = row.name
+        previous = self.rows.get(name)
+        self.rows[name] = row
+        if previous is not None:
+            self._unlink(previous)
+        else:
+            insort(self.sorted_keys, (name.lower(), name))
+            grams = self.grams[name] = trigrams(name)
+            for gram in grams:
+                self.postings.setdefault(gram, set()).add(name)
+        self.by_id[row.id] = name
+        if row.is_alias and row.canonical_name is not None:
+            self.aliases.setdefault(row.canonical_name, set()).add(name)
+
+    def remove(self, name: str) -> TagRowDTO | None:
+        row = self.rows.pop(name, None)
+        if row is None:
+            return None
+        self._unlink(row)
+        key = (name.lower(), name)
+        del self.sorted_keys[bisect_left(self.sorted_keys, key)]
+        for gram in self.grams.pop(name):
+            names = self.postings[gram]
+            names.discard(name)
+            if not names:
+                del self.postings[gram]
+        return row
+
+    def _unlink(self, row: TagRowDTO) -> None:
+        """Drop ``row`` from the id and alias indexes."""
+        if self.by_id.get(row.id) == row.name:
+            del self.by_id[row.id]
+        if row.is_alias and row.canonical_name is not None:
+            names = self.aliases.get(row.canonical_name)
+            if names is not None:
+                names.discard(row.name)
+                if not names:
+                    del self.aliases[row.canonical_name]
+
+    def canonical(self, name: str) -> TagRowDTO | None:
+        """Return the row ``name`` refers to, following an alias to its target."""
+        row = self.rows.get(name)
+        if row is not None and row.is_alias and row.canonical_name is not None:
+            return self.rows.get(row.canonical_name, row)
+        return row
+
+    def apply(self, op: TagOp) -> None:
+        """Apply a successful mutation of existing rows (everything except create and alias)."""
+        if isinstance(op, OpEdit):
+            target = self.canonical(op.name)
+            if target is not None:
+                self.add(replace(target, content=op.new_content))
+        elif isinstance(op, OpIncrementUsage):
+            target = self.canonical(op.name)
+            if target is not None:
+                self.add(replace(target, uses=(target.uses or 0) + op.count))
+        elif isinstance(op, (OpClaim, OpTransfer)):
+            target = self.rows.get(op.name)
+            if target is not None:
+                owner_id = op.requester_id if isinstance(op, OpClaim) else op.new_owner_id
+                self.add(replace(target, owner_id=owner_id))
+        elif isinstance(op, OpRemove):
+            self.remove_with_aliases(op.name)
+        elif isinstance(op, OpRemoveById):
+            name = self.by_id.get(op.tag_id)
+            if name is not None:
+                self.remove_with_aliases(name)
+        elif isinstance(op, OpPurge):
+            for name in [name for name, row in self.rows.items() if row.owner_id == op.owner_id]:
+                self.remove_with_aliases(name)
+
+    def remove_with_aliases(self, name: str) -> int:
+        """Remove ``name`` and, when it is a canonical tag, every alias pointing at it."""
+        row = self.remove(name)
+        if row is None:
+            return 0
+        removed = 1
+        if not row.is_alias:
+            for alias in tuple(self.aliases.get(name, ())):
+                removed += self.remove(alias) is not None
+        return removed
+
+
+def _matches(row: TagRowDTO, mode: AutocompleteMode, owner_id: int | None) -> bool:
+    if row.is_alias and mode in ("non_aliased", "owned_non_aliased"):
+        return False
+    if mode in ("owned_aliased", "owned_non_aliased"):
+        return row.owner_id == owner_id
+    return True
+
+
+class TagIndex:
+    """Per-guild prefix and trigram index for tag autocomplete.
+
+    Example:
+        index = TagIndex.from_rows(search_response.items)
+        response = index.autocomplete(TagsAutocompleteRequest(guild_id=guild_id, q="gen"))
+    """
+
+    def __init__(self, *, similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD) -> None:
+        """Create an empty index.
+
+        Args:
+            similarity_threshold: Minimum trigram similarity for fuzzy matches.
+        """
+        self.similarity_threshold = similarity_threshold
+        self._guilds: dict[int, _GuildTags] = {}
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[TagRowDTO],
+        *,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    ) -> "TagIndex":
+        """Build an index from tag rows, e.g. ``TagsSearchResponse.items``."""
+        index = cls(similarity_threshold=similarity_threshold)
+        index.load(rows)
+        return index
+
+    def __len__(self) -> int:
+        """Return the number of indexed rows across all guilds."""
+        return sum(len(guild.rows) for guild in self._guilds.values())
+
+    def load(self, rows: Iterable[TagRowDTO]) -> None:
+        """Add or replace ``rows``."""
+        for row in rows:
+            self.add(row)
+
+    def add(self, row: TagRowDTO) -> None:
+        """Add ``row``, replacing any row with the same guild and name."""
+        guild = self._guilds.get(row.guild_id)
+        if guild is None:
+            guild = self._guilds[row.guild_id] = _GuildTags()
+        guild.add(row)
+
+    def remove(self, guild_id: int, name: str) -> TagRowDTO | None:
+        """Remove and return the row named ``name``, or ``None`` if it is not indexed."""
+        guild = self._guilds.get(guild_id)
+        return guild.remove(name) if guild is not None else None
+
+    def get(self, guild_id: int, name: str) -> TagRowDTO | None:
+        """Return the row named ``name`` in ``guild_id``, if indexed."""
+        guild = self._guilds.get(guild_id)
+        return guild.rows.get(name) if guild is not None else None
+
+    def get_by_id(self, guild_id: int, tag_id: int) -> TagRowDTO | None:
+        """Return the row with id ``tag_id`` in ``guild_id``, if indexed."""
+        guild = self._guilds.get(guild_id)
+        if guild is None:
+            return None
+        name = guild.by_id.get(tag_id)
+        return guild.rows.get(name) if name is not None else None
+
+    def apply(self, op: TagOp, result: TagsMutateResult) -> None:
+        """Apply one executed mutation to the index.
+
+        Failed ops (``result.ok`` is false) are ignored. Removing a canonical tag, by name, id
+        or purge, also removes its aliases. Edits and usage increments on an alias update the
+        tag it points at. Rows created by ``OpCreate``/``OpAlias`` take their id from
+        ``result.tag_id`` (``0`` when the server did not return one) and start with zero uses.
+        """
+        if not result.ok:
+            return
+        if isinstance(op, (OpCreate, OpAlias)):
+            self.add(self._created_row(op, result.tag_id or 0))
+            return
+        guild = self._guilds.get(op.guild_id)
+        if guild is not None:
+            guild.apply(op)
+
+    def _created_row(self, op: OpCreate | OpAlias, tag_id: int) -> TagRowDTO:
+        if isinstance(op, OpCreate):
+            return TagRowDTO(
+                id=tag_id,
+                guild_id=op.guild_id,
+                name=op.name,
+                owner_id=op.owner_id,
+                uses=0,
+                content=op.content,
+            )
+        guild = self._guilds.get(op.guild_id)
+        target = guild.canonical(op.old_name) if guild is not None else None
+        return TagRowDTO(
+            id=tag_id,
+            guild_id=op.guild_id,
+            name=op.new_name,
+            owner_id=op.owner_id,
+            is_alias=True,
+            canonical_name=target.name if target is not None else op.old_name,
+            uses=0,
+        )
+
+    def apply_batch(self, request: TagsMutateRequest, response: TagsMutateResponse) -> None:
+        """Apply every op of an executed batch in order, paired with its result.
+
+        Raises:
+            ValueError: If the response does not hold one result per op.
+        """
+        if len(request.ops) != len(response.results):
+            raise ValueError(f"Expected {len(request.ops)} results, got {len(response.results)}")
+        for op, result in zip(request.ops, response.results, strict=True):
+            self.apply(op, result)
+
+    def clear(self, guild_id: int | None = None) -> None:
+        """Drop every row, or only those of ``guild_id``."""
+        if guild_id is None:
+            self._guilds.clear()
+        else:
+            self._guilds.pop(guild_id, None)
+
+    def search_prefix(
+        self,
+        guild_id: int,
+        prefix: str,
+        *,
+        mode: AutocompleteMode = "aliased",
+        owner_id: int | None = None,
+        limit: int = 12,
+    ) -> list[str]:
+        """Return up to ``limit`` names starting with ``prefix`` (case-insensitive), alphabetically."""
+        guild = self._guilds.get(guild_id)
+        if guild is None or limit <= 0:
+            return []
+        prefix = prefix.lower()
+        keys, rows = guild.sorted_keys, guild.rows
+        names: list[str] = []
+        for i in range(bisect_left(keys, (prefix, "")), len(keys)):
+            key, name = keys[i]
+            if not key.startswith(prefix):
+                break
+            if _matches(rows[name], mode, owner_id):
+                names.append(name)
+                if len(names) == limit:
+                    break
+        return names
+
+    def search_fuzzy(
+        self,
+        guild_id: int,
+        query: str,
+        *,
+        mode: AutocompleteMode = "aliased",
+        owner_id: int | None = None,
+        limit: int = 12,
+    ) -> list[str]:
+        """Return up to ``limit`` names whose trigram similarity to ``query`` meets the threshold.
+
+        Results are ordered by similarity, then by uses (descending), then by name.
+        """
+        guild = self._guilds.get(guild_id)
+        query_grams = trigrams(query)
+        if guild is None or not query_grams or limit <= 0:
+            return []
+        shared: dict[str, int] = {}
+        for gram in query_grams:
+            for name in guild.postings.get(gram, ()):
+                shared[name] = shared.get(name, 0) + 1
+
+        scored: list[tuple[float, int, str]] = []
+        for name, count in shared.items():
+            similarity = count / (len(query_grams) + len(guild.grams[name]) - count)
+            if similarity < self.similarity_threshold:
+                continue
+            row = guild.rows[name]
+            if _matches(row, mode, owner_id):
+                scored.append((-similarity, -(row.uses or 0), name))
+        scored.sort()
+        return [name for _, _, name in scored[:limit]]
+
+    def autocomplete(self, request: TagsAutocompleteRequest) -> TagsAutocompleteResponse:
+        """Answer an autocomplete request locally.
+
+        Prefix matches come first, alphabetically; remaining slots up to ``request.limit`` are
+        filled with fuzzy matches. The ``owned_*`` modes only return tags owned by
+        ``request.owner_id`` and therefore return nothing without one.
+        """
+        guild_id, query, mode, owner_id, limit = (
+            request.guild_id,
+            request.q,
+            request.mode,
+            request.owner_id,
+            request.limit,
+        )
+        names = self.search_prefix(guild_id, query, mode=mode, owner_id=owner_id, limit=limit)
+        if len(names) < limit and query:
+            seen = set(names)
+            # Prefix matches often score high too, so over-fetch by the number already taken.
+            fuzzy = self.search_fuzzy(guild_id, query, mode=mode, owner_id=owner_id, limit=limit + len(names))
+            names.extend([name for name in fuzzy if name not in seen][: limit - len(names)])
+        return TagsAutocompleteResponse(items=names)
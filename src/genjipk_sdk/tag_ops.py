@@ -0,0 +1,366 @@
+"""Client-side compiler for ``TagsMutateRequest`` batches.
+
+The server executes ``TagsMutateRequest.ops`` one at a time, so bulk imports that send
+thousands of usage increments and edits against a handful of tags pay for every one of them.
+:func:`compile_tag_ops` rewrites such a batch into an equivalent, much shorter one:
+
+* Ops in different guilds never interact, so the result is grouped per ``guild_id``.
+* Structural ops (create, alias, remove, remove_by_id, claim, transfer, purge) change which
+  tags exist or who owns them. They are kept verbatim and in order, and act as barriers:
+  nothing is moved across them.
+* Between two barriers, ``OpEdit`` ops with the same ``(name, owner_id)`` collapse into the
+  last one. Surviving edits keep the order of their last occurrence, so the final content of
+  every tag is unchanged.
+* Optionally, all ``OpIncrementUsage`` ops on the same tag between two barriers are merged
+  into one op whose ``count`` is their sum; see ``merge_increments``.
+* Optionally, a create immediately undone by its owner removing the same name (with no other
+  op touching that name in between) is dropped entirely; see ``elide_create_remove``.
+
+Merged increments rely on the server honouring ``OpIncrementUsage.count``, which is why
+merging is opt-in.
+"""
+
+from collections.abc import Iterable
+
+import msgspec
+from msgspec import Struct
+
+from .tags import (
+    OpAlias,
+    OpClaim,
+    OpCreate,
+    OpEdit,
+    OpIncrementUsage,
+    OpPurge,
+    OpRemove,
+    OpRemoveById,
+    OpTransfer,
+    TagOp,
+    TagsMutateRequest,
+    TagsMutateResponse,
+    TagsMutateResult,
+)
+
+__all__ = (
+    "STRUCTURAL_OPS",
+    "CompiledTagOps",
+    "compile_tag_ops",
+    "effect_signature",
+    "ops_equivalent",
+)
+
+# Ops that change which tags exist or who owns them; never reordered or merged.
+STRUCTURAL_OPS: tuple[type[TagOp], ...] = (OpCreate, OpAlias, OpRemove, OpRemoveById, OpClaim, OpTransfer, OpPurge)
+
+
+def _referenced_names(op: TagOp) -> tuple[str, ...] | None:
+    """Return the tag names ``op`` touches, or ``None`` if it may touch any tag in the guild."""
+    if isinstance(op, OpAlias):
+        return (op.new_name, op.old_name)
+    if isinstance(op, (OpRemoveById, OpPurge)):
+        return None
+    return (op.name,)
+
+
+def _cancels(create: TagOp | None, remove: OpRemove) -> bool:
+    """Return whether ``remove`` undoes ``create``: only the owner of a new tag can delete it."""
+    return isinstance(create, OpCreate) and create.owner_id == remove.requester_id
+
+
+def _as_ops(ops: TagsMutateRequest | Iterable[TagOp]) -> list[TagOp]:
+    return list(ops.ops) if isinstance(ops, TagsMutateRequest) else list(ops)
+
+
+class CompiledTagOps(Struct, kw_only=True):
+    """Result of :func:`compile_tag_ops`.
+
+    Attributes:
+        ops: Compiled ops, grouped by guild in order of first appearance.
+        sources: For each compiled op, the indices of the original ops it stands for.
+        elided: Indices of original ops dropped by create/remove elision.
+        original_count: Number of ops before compilation.
+        elide_create_remove: Whether create/remove elision was enabled.
+    """
+
+    ops: list[TagOp]
+    sources: list[list[int]]
+    elided: list[int]
+    original_count: int
+    elide_create_remove: bool = False
+
+    def to_request(self) -> TagsMutateRequest:
+        """Return the compiled ops as a single request."""
+        return TagsMutateRequest(ops=list(self.ops))
+
+    def by_guild(self) -> dict[int, TagsMutateRequest]:
+        """Return one request per guild.
+
+        Requests are in the same order as :attr:`ops`, so concatenating their results yields
+        results aligned with :attr:`ops` (see :meth:`expand_results`).
+        """
+        requests: dict[int, TagsMutateRequest] = {}
+        for op in self.ops:
+            request = requests.get(op.guild_id)
+            if request is None:
+                request = requests[op.guild_id] = TagsMutateRequest(ops=[])
+            request.ops.append(op)
+        return requests
+
+    def expand_results(self, response: TagsMutateResponse) -> TagsMutateResponse:
+        """Map results of the compiled batch back onto the original ops.
+
+        Every original op receives the result of the compiled op it was merged into. Elided
+        ops are reported as successful with no affected rows.
+
+        Raises:
+            ValueError: If ``response`` does not hold one result per compiled op.
+        """
+        if len(response.results) != len(self.ops):
+            raise ValueError(f"Expected {len(self.ops)} results, got {len(response.results)}")
+        elided = TagsMutateResult(ok=True, affected=0)
+        results = [elided] * self.original_count
+        for result, sources in zip(response.results, self.sources, strict=True):
+            for index in sources:
+                results[index] = result
+        return TagsMutateResponse(results=results)
+
+    def verify(self, original: TagsMutateRequest | Iterable[TagOp]) -> bool:
+        """Return whether the compiled ops have the same effects as ``original``."""
+        return ops_equivalent(original, self.ops, elide_create_remove=self.elide_create_remove)
+
+
+class _GuildCompiler:
+    """Compiles the ops of a single guild; see the module docstring for the rules."""
+
+    __slots__ = (
+        "_edits",
+        "_elide",
+        "_elided",
+        "_emitted",
+        "_guild_id",
+        "_increments",
+        "_merge",
+        "_pending_creates",
+        "_seen",
+    )
+
+    def __init__(self, guild_id: int, *, elide_create_remove: bool, merge_increments: bool) -> None:
+        self._guild_id = guild_id
+        self._elide = elide_create_remove
+        self._merge = merge_increments
+        self._emitted: list[tuple[TagOp, list[int]] | None] = []
+        self._elided: list[int] = []
+        # Current segment: name -> (total count, sources); (name, owner) -> (last edit, sources).
+        self._increments: dict[str, tuple[int, list[int]]] = {}
+        self._edits: dict[tuple[str, int], tuple[OpEdit, list[int]]] = {}
+        # Creates that can still be elided: name -> position in ``_emitted``.
+        self._pending_creates: dict[str, int] = {}
+        self._seen: set[str] = set()
+
+    def _reference(self, names: tuple[str, ...] | None) -> None:
+        if names is None:
+            self._pending_creates.clear()
+            return
+        for name in names:
+            self._pending_creates.pop(name, None)
+            self._seen.add(name)
+
+    def _flush(self) -> None:
+        for name, (count, sources) in self._increments.items():
+            self._emitted.append((OpIncrementUsage(guild_id=self._guild_id, name=name, count=count), sources))
+        for edit, sources in self._edits.values():
+            self._emitted.append((edit, sources))
+        self._increments.clear()
+        self._edits.clear()
+
+    def add(self, index: int, op: TagOp) -> None:
+        if isinstance(op, OpIncrementUsage):
+            self._reference((op.name,))
+            if not self._merge:
+                # Increments commute with the edits of their segment, so emitting them early is safe.
+                self._emitted.append((op, [index]))
+                return
+            count, sources = self._increments.get(op.name, (0, []))
+            sources.append(index)
+            self._increments[op.name] = (count + op.count, sources)
+            return
+        if isinstance(op, OpEdit):
+            self._reference((op.name,))
+            key = (op.name, op.owner_id)
+            previous = self._edits.pop(key, None)
+            sources = previous[1] if previous is not None else []
+            sources.append(index)
+            self._edits[key] = (op, sources)
+            return
+
+        self._flush()
+        if isinstance(op, OpRemove) and (position := self._pending_creates.get(op.name)) is not None:
+            created = self._emitted[position]
+            assert created is not None
+            if _cancels(created[0], op):
+                del self._pending_creates[op.name]
+                self._emitted[position] = None
+                self._elided.extend((*created[1], index))
+                # Nothing else touched the name since the create, so it is fresh again.
+                self._seen.discard(op.name)
+                return
+        fresh = op.name if isinstance(op, OpCreate) and op.name not in self._seen else None
+        self._reference(_referenced_names(op))
+        self._emitted.append((op, [index]))
+        if fresh is not None and self._elide:
+            self._pending_creates[fresh] = len(self._emitted) - 1
+
+    def finish(self) -> tuple[list[tuple[TagOp, list[int]]], list[int]]:
+        self._flush()
+        return [entry for entry in self._emitted if entry is not None], self._elided
+
+
+def _compile_pass(
+    ops: list[TagOp],
+    *,
+    elide_create_remove: bool,
+    merge_increments: bool,
+) -> tuple[list[TagOp], list[list[int]], list[int]]:
+    compilers: dict[int, _GuildCompiler] = {}
+    for index, op in enumerate(ops):
+        compiler = compilers.get(op.guild_id)
+        if compiler is None:
+            compiler = compilers[op.guild_id] = _GuildCompiler(
+                op.guild_id, elide_create_remove=elide_create_remove, merge_increments=merge_increments
+            )
+        compiler.add(index, op)
+
+    compiled_ops: list[TagOp] = []
+    sources: list[list[int]] = []
+    elided: list[int] = []
+    for compiler in compilers.values():
+        emitted, dropped = compiler.finish()
+        for op, op_sources in emitted:
+            compiled_ops.append(op)
+            sources.append(op_sources)
+        elided.extend(dropped)
+    return compiled_ops, sources, elided
+
+
+def compile_tag_ops(
+    ops: TagsMutateRequest | Iterable[TagOp],
+    *,
+    elide_create_remove: bool = False,
+    merge_increments: bool = False,
+) -> CompiledTagOps:
+    """Coalesce a batch of tag ops into an equivalent, shorter batch.
+
+    Args:
+        ops: The batch to compile, as a request or a sequence of ops.
+        elide_create_remove: Drop an ``OpCreate`` together with a later ``OpRemove`` of the
+            same name by the tag's owner when no op in between touches that name. This assumes
+            every name created in the batch does not exist beforehand: if it did, the original
+            batch would fail the create and then delete the existing tag, while the compiled
+            batch keeps it.
+        merge_increments: Merge the ``OpIncrementUsage`` ops on each tag between two barriers
+            into one op with the summed ``count``. Only enable this when the server applies
+            ``count``; otherwise increments are passed through unchanged.
+
+    Returns:
+        The compiled ops with a mapping back to the original indices. Use
+        :meth:`CompiledTagOps.verify` to check equivalence.
+    """
+    original = _as_ops(ops)
+    compiled_ops, sources, elided = _compile_pass(
+        original, elide_create_remove=elide_create_remove, merge_increments=merge_increments
+    )
+    # An elided pair removes a barrier, so the segments on either side can merge in another pass.
+    while elided:
+        next_ops, next_sources, dropped = _compile_pass(
+            compiled_ops, elide_create_remove=True, merge_increments=merge_increments
+        )
+        if next_ops == compiled_ops:
+            break
+        elided.extend(index for position in dropped for index in sources[position])
+        sources = [[index for position in merged for index in sources[position]] for merged in next_sources]
+        compiled_ops = next_ops
+    elided.sort()
+    return CompiledTagOps(
+        ops=compiled_ops,
+        sources=sources,
+        elided=elided,
+        original_count=len(original),
+        elide_create_remove=elide_create_remove,
+    )
+
+
+def effect_signature(
+    ops: TagsMutateRequest | Iterable[TagOp],
+    *,
+    elide_create_remove: bool = False,
+) -> dict[int, list[object]]:
+    """Summarize the effects of a batch per guild, independent of how it is spelled.
+
+    Each guild maps to its structural ops in order. Runs of increments and edits between them
+    are reduced to the total increment per name and the final content per ``(name, owner_id)``
+    in order of last occurrence. Guilds left without effects are omitted. Two batches with equal
+    signatures leave the server in the same state. With ``elide_create_remove``, create/remove
+    pairs are cancelled first under the same assumption as :func:`compile_tag_ops`.
+    """
+    per_guild: dict[int, list[TagOp]] = {}
+    for op in _as_ops(ops):
+        per_guild.setdefault(op.guild_id, []).append(op)
+
+    signature: dict[int, list[object]] = {}
+    for guild_id, guild_ops in per_guild.items():
+        effects: list[object] = []
+        increments: dict[str, int] = {}
+        edits: dict[tuple[str, int], str] = {}
+        for op in _cancel_create_remove(guild_ops) if elide_create_remove else guild_ops:
+            if isinstance(op, OpIncrementUsage):
+                increments[op.name] = increments.get(op.name, 0) + op.count
+            elif isinstance(op, OpEdit):
+                edits.pop((op.name, op.owner_id), None)
+                edits[op.name, op.owner_id] = op.new_content
+            else:
+                if increments or edits:
+                    effects.append(("segment", dict(sorted(increments.items())), list(edits.items())))
+                    increments, edits = {}, {}
+                effects.append(msgspec.to_builtins(op))
+        if increments or edits:
+            effects.append(("segment", dict(sorted(increments.items())), list(edits.items())))
+        if effects:
+            signature[guild_id] = effects
+    return signature
+
+
+def _cancel_create_remove(ops: list[TagOp]) -> list[TagOp]:
+    """Drop create/remove-by-owner pairs of a fresh name with no reference to it in between (one guild)."""
+    kept: list[TagOp | None] = []
+    pending: dict[str, int] = {}
+    seen: set[str] = set()
+    for op in ops:
+        if isinstance(op, OpRemove) and (position := pending.get(op.name)) is not None and _cancels(kept[position], op):
+            del pending[op.name]
+            kept[position] = None
+            seen.discard(op.name)
+            continue
+        fresh = op.name if isinstance(op, OpCreate) and op.name not in seen else None
+        names = _referenced_names(op)
+        if names is None:
+            pending.clear()
+        else:
+            for name in names:
+                pending.pop(name, None)
+                seen.add(name)
+        kept.append(op)
+        if fresh is not None:
+            pending[fresh] = len(kept) - 1
+    return [op for op in kept if op is not None]
+
+
+def ops_equivalent(
+    a: TagsMutateRequest | Iterable[TagOp],
+    b: TagsMutateRequest | Iterable[TagOp],
+    *,
+    elide_create_remove: bool = False,
+) -> bool:
+    """Return whether two batches have equal :func:`effect_signature` values."""
+    return effect_signature(a, elide_create_remove=elide_create_remove) == effect_signature(
+        b, elide_create_remove=elide_create_remove
+    )
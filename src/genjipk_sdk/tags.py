@@ -1,7 +1,7 @@
-from typing import Literal
+from typing import Annotated, Literal
 
 import msgspec
-from msgspec import Struct
+from msgspec import Meta, Struct
 
 __all__ = (
     "OpAlias",
@@ -236,16 +236,18 @@ class OpPurge(OpBase, tag="purge"):
     requester_id: int
 
 
-class OpIncrementUsage(OpBase, tag="increment_usage"):
+class OpIncrementUsage(OpBase, tag="increment_usage", omit_defaults=True):
     """Increment the usage count for a tag.
 
     Attributes:
         guild_id: Discord guild identifier that owns the tag.
         name: Name of the tag to increment.
+        count: Number of uses to add, at least 1; omitted from the payload when 1.
     """
 
     guild_id: int
     name: str
+    count: Annotated[int, Meta(ge=1)] = 1
 
 
 TagOp = OpCreate | OpAlias | OpEdit | OpRemove | OpRemoveById | OpClaim | OpTransfer | OpPurge | OpIncrementUsage
@@ -211,9 +211,11 @@ class RankDetailResponse(Struct):
     bronze_rank_met: bool
 
 
-class CommunityLeaderboardResponse(Struct):
+class CommunityLeaderboardResponse(Struct, gc=False):
     """Entry in the community leaderboard.
 
+    Only holds scalars, so it opts out of garbage-collector tracking.
+
     Attributes:
         user_id: Identifier of the user.
         nickname: Display nickname for the leaderboard.
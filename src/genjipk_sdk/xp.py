@@ -1,16 +1,30 @@
-from typing import Literal
+import time
+from bisect import bisect_right
+from collections.abc import Callable, Iterable
+from itertools import pairwise
+from typing import Annotated, Literal, NamedTuple
 
-from msgspec import Struct
+from msgspec import Meta, Struct
 
 __all__ = (
     "XP_AMOUNTS",
     "XP_TYPES",
     "PlayersPerSkillTierResponse",
     "PlayersPerXPTierResponse",
+    "RankChangeType",
     "TierChangeResponse",
+    "XpGrantAccumulator",
+    "XpGrantBatchItem",
+    "XpGrantBatchRequest",
+    "XpGrantBatchResponse",
+    "XpGrantBatchResult",
     "XpGrantEvent",
     "XpGrantRequest",
     "XpGrantResponse",
+    "XpTier",
+    "XpTierRow",
+    "XpTierTable",
+    "expand_batch_events",
 )
 
 XP_TYPES = Literal["Map Submission", "Playtest", "Guide", "Completion", "Record", "World Record", "Other"]
@@ -118,3 +132,347 @@ class XpGrantEvent(Struct):
     type: XP_TYPES
     previous_amount: int
     new_amount: int
+
+
+class XpGrantBatchItem(Struct):
+    """Aggregated XP grants of one type for one user.
+
+    Attributes:
+        user_id: Identifier of the user receiving XP.
+        type: Category describing why XP is granted.
+        amount: Total XP granted across all aggregated grants.
+        count: Number of individual grants aggregated into this item, at least 1.
+    """
+
+    user_id: int
+    type: XP_TYPES
+    amount: int
+    count: Annotated[int, Meta(ge=1)] = 1
+
+
+class XpGrantBatchRequest(Struct):
+    """Request payload for granting XP to many users at once.
+
+    Attributes:
+        grants: Aggregated grants; each ``(user_id, type)`` pair appears at most once.
+    """
+
+    grants: list[XpGrantBatchItem]
+
+
+class XpGrantBatchResult(Struct):
+    """XP totals for one user after a batch grant.
+
+    Attributes:
+        user_id: Identifier of the user.
+        previous_amount: XP amount before the batch.
+        new_amount: XP amount after the batch.
+    """
+
+    user_id: int
+    previous_amount: int
+    new_amount: int
+
+
+class XpGrantBatchResponse(Struct):
+    """Return payload for a batch XP grant.
+
+    Attributes:
+        results: One result per user in the request.
+    """
+
+    results: list[XpGrantBatchResult]
+
+
+def expand_batch_events(request: XpGrantBatchRequest, response: XpGrantBatchResponse) -> list[XpGrantEvent]:
+    """Turn a batch grant and its response into per-user, per-type ``XpGrantEvent`` objects.
+
+    Each user's items are chained in request order starting from ``previous_amount``, so the
+    last event of every user ends at the ``new_amount`` the server reported.
+
+    Raises:
+        ValueError: If a user is missing from the response or the amounts do not add up.
+    """
+    totals = {result.user_id: result for result in response.results}
+    running: dict[int, int] = {}
+    events: list[XpGrantEvent] = []
+    for item in request.grants:
+        result = totals.get(item.user_id)
+        if result is None:
+            raise ValueError(f"No batch result for user {item.user_id}")
+        previous = running.get(item.user_id, result.previous_amount)
+        running[item.user_id] = previous + item.amount
+        events.append(XpGrantEvent(item.user_id, item.amount, item.type, previous, previous + item.amount))
+    for user_id, amount in running.items():
+        if amount != totals[user_id].new_amount:
+            raise ValueError(f"Batch result for user {user_id} ends at {totals[user_id].new_amount}, expected {amount}")
+    return events
+
+
+class XpGrantAccumulator:
+    """Aggregate individual XP grants into :class:`XpGrantBatchRequest` batches.
+
+    Grants are summed per ``(user_id, type)``. A batch is due once it holds ``max_items``
+    distinct items or its oldest grant is ``max_age`` seconds old. :meth:`add` returns the
+    batch when the size limit is hit; call :meth:`flush_if_due` periodically for the age limit
+    and :meth:`flush` on shutdown.
+
+    Example:
+        accumulator = XpGrantAccumulator(max_items=500, max_age=2.0)
+        for completion in completions:
+            if batch := accumulator.add(completion.user_id, "Completion"):
+                send(batch)
+        if batch := accumulator.flush():
+            send(batch)
+    """
+
+    def __init__(
+        self,
+        *,
+        max_items: int = 1000,
+        max_age: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create an empty accumulator.
+
+        Args:
+            max_items: Distinct ``(user_id, type)`` items that make a batch due.
+            max_age: Seconds after the first pending grant that make a batch due.
+            clock: Monotonic time source, injectable for tests.
+        """
+        self.max_items = max_items
+        self.max_age = max_age
+        self._clock = clock
+        self._items: dict[tuple[int, XP_TYPES], XpGrantBatchItem] = {}
+        self._started: float | None = None
+
+    def __len__(self) -> int:
+        """Return the number of pending aggregated items."""
+        return len(self._items)
+
+    def add(
+        self,
+        user_id: int,
+        type_: XP_TYPES,
+        *,
+        amount: int | None = None,
+        count: int = 1,
+    ) -> XpGrantBatchRequest | None:
+        """Record ``count`` grants of ``type_`` to ``user_id``.
+
+        Args:
+            user_id: Identifier of the user receiving XP.
+            type_: Category of the grant.
+            amount: Total XP for these grants. Defaults to ``XP_AMOUNTS[type_] * count`` and
+                is required for types without a fixed amount (``"Other"``).
+            count: Number of grants being recorded, at least 1.
+
+        Returns:
+            The flushed batch when this grant filled it, otherwise ``None``.
+
+        Raises:
+            ValueError: If ``count`` is less than 1, or ``amount`` is negative, missing or
+                disagrees with ``XP_AMOUNTS``.
+        """
+        if count < 1:
+            raise ValueError(f"count must be at least 1, got {count}")
+        if amount is not None and amount < 0:
+            raise ValueError(f"amount must not be negative, got {amount}")
+        fixed = XP_AMOUNTS.get(type_)
+        if amount is None:
+            if fixed is None:
+                raise ValueError(f"An amount is required for {type_!r} grants")
+            amount = fixed * count
+        elif fixed is not None and amount != fixed * count:
+            raise ValueError(f"{type_!r} grants are worth {fixed} XP each, got {amount} for {count}")
+
+        if self._started is None:
+            self._started = self._clock()
+        key = (user_id, type_)
+        item = self._items.get(key)
+        if item is None:
+            self._items[key] = XpGrantBatchItem(user_id, type_, amount, count)
+        else:
+            item.amount += amount
+            item.count += count
+        return self.flush() if len(self._items) >= self.max_items else None
+
+    def due(self) -> bool:
+        """Return whether the pending batch has reached a size or age limit."""
+        if self._started is None:
+            return False
+        return len(self._items) >= self.max_items or self._clock() - self._started >= self.max_age
+
+    def flush_if_due(self) -> XpGrantBatchRequest | None:
+        """Flush and return the pending batch if :meth:`due`, otherwise return ``None``."""
+        return self.flush() if self.due() else None
+
+    def flush(self) -> XpGrantBatchRequest | None:
+        """Return every pending item as a batch and reset, or ``None`` if nothing is pending."""
+        if not self._items:
+            return None
+        batch = XpGrantBatchRequest(grants=list(self._items.values()))
+        self._items = {}
+        self._started = None
+        return batch
+
+
+RankChangeType = Literal["Main Tier Rank Up", "Sub-Tier Rank Up"]
+
+
+class XpTier(NamedTuple):
+    """Tier position for an XP amount.
+
+    Attributes:
+        raw_tier: ``xp // xp_per_tier``.
+        normalized_tier: Tier within the current prestige (``raw_tier % tiers_per_prestige``).
+        prestige_level: Completed prestiges (``raw_tier // tiers_per_prestige``).
+        main_tier_name: Label of the main tier.
+        sub_tier_name: Label of the sub-tier, as given in the tier table.
+    """
+
+    raw_tier: int
+    normalized_tier: int
+    prestige_level: int
+    main_tier_name: str
+    sub_tier_name: str
+
+
+class XpTierRow(NamedTuple):
+    """One row of an :class:`XpTierTable`.
+
+    Attributes:
+        first_tier: First normalized tier covered by the row; the row ends where the next begins.
+        main_tier_name: Label of the main tier the row belongs to.
+        sub_tier_name: Label of the sub-tier, exactly as the server reports it.
+    """
+
+    first_tier: int
+    main_tier_name: str
+    sub_tier_name: str
+
+
+class XpTierTable:
+    """Table-driven XP tier lookup.
+
+    The table is a list of :class:`XpTierRow` sorted by ``first_tier``. Consecutive rows with
+    the same main tier name form one main tier, so main tiers may have any number of sub-tiers
+    of any size, and labels are used exactly as given. :meth:`tier` is one division and a
+    binary search over the row boundaries.
+
+    The SDK does not ship a tier table: build it from the server's tier configuration so its
+    results match the server's ``TierChangeResponse``.
+
+    Example:
+        table = XpTierTable(
+            [(0, "Newcomer", "Newcomer I"), (3, "Newcomer", "Newcomer II"), (5, "Rookie", "Rookie")],
+            xp_per_tier=100,
+            tiers_per_prestige=10,
+        )
+    """
+
+    __slots__ = ("_bounds", "_main_index", "rows", "tiers_per_prestige", "xp_per_tier")
+
+    def __init__(
+        self,
+        rows: Iterable[tuple[int, str, str]],
+        *,
+        xp_per_tier: int,
+        tiers_per_prestige: int,
+    ) -> None:
+        """Build the lookup table.
+
+        Args:
+            rows: ``(first_tier, main_tier_name, sub_tier_name)`` rows in ascending
+                ``first_tier`` order, the first starting at tier 0.
+            xp_per_tier: XP per raw tier.
+            tiers_per_prestige: Normalized tiers per prestige level.
+
+        Raises:
+            ValueError: If a size is not positive or the rows do not cover the tiers of a
+                prestige in ascending order.
+        """
+        if xp_per_tier < 1 or tiers_per_prestige < 1:
+            raise ValueError("xp_per_tier and tiers_per_prestige must be positive")
+        self.rows: tuple[XpTierRow, ...] = tuple(XpTierRow(*row) for row in rows)
+        bounds = tuple(row.first_tier for row in self.rows)
+        if not bounds or bounds[0] != 0:
+            raise ValueError("The first tier row must start at tier 0")
+        if any(later <= earlier for earlier, later in pairwise(bounds)):
+            raise ValueError("Tier rows must be in strictly ascending first_tier order")
+        if bounds[-1] >= tiers_per_prestige:
+            raise ValueError(f"Tier row starts at {bounds[-1]}, beyond tiers_per_prestige ({tiers_per_prestige})")
+        self.xp_per_tier = xp_per_tier
+        self.tiers_per_prestige = tiers_per_prestige
+        self._bounds = bounds
+
+        main_index: list[int] = []
+        for position, row in enumerate(self.rows):
+            if position == 0:
+                main_index.append(0)
+            elif row.main_tier_name == self.rows[position - 1].main_tier_name:
+                main_index.append(main_index[-1])
+            else:
+                main_index.append(main_index[-1] + 1)
+        self._main_index: tuple[int, ...] = tuple(main_index)
+
+    def _locate(self, xp: int) -> tuple[int, int, int]:
+        """Return ``(raw_tier, prestige_level, row index)`` for ``xp``."""
+        raw_tier = max(xp, 0) // self.xp_per_tier
+        prestige_level, normalized_tier = divmod(raw_tier, self.tiers_per_prestige)
+        return raw_tier, prestige_level, bisect_right(self._bounds, normalized_tier) - 1
+
+    def tier(self, xp: int) -> XpTier:
+        """Return the tier position for ``xp`` (negative amounts count as 0)."""
+        raw_tier, prestige_level, index = self._locate(xp)
+        row = self.rows[index]
+        return XpTier(
+            raw_tier,
+            raw_tier - prestige_level * self.tiers_per_prestige,
+            prestige_level,
+            row.main_tier_name,
+            row.sub_tier_name,
+        )
+
+    def change(self, old_xp: int, new_xp: int) -> TierChangeResponse:
+        """Compute the tier delta between ``old_xp`` and ``new_xp``.
+
+        ``rank_change_type`` is ``"Main Tier Rank Up"`` when the (prestige, main tier) pair goes
+        up, ``"Sub-Tier Rank Up"`` when only the row within the main tier goes up, and ``None``
+        otherwise.
+        """
+        _, old_prestige, old_index = self._locate(old_xp)
+        _, new_prestige, new_index = self._locate(new_xp)
+        old_main = (old_prestige, self._main_index[old_index])
+        new_main = (new_prestige, self._main_index[new_index])
+        rank_change_type: RankChangeType | None = None
+        if new_main > old_main:
+            rank_change_type = "Main Tier Rank Up"
+        elif new_main == old_main and new_index > old_index:
+            rank_change_type = "Sub-Tier Rank Up"
+        old_row, new_row = self.rows[old_index], self.rows[new_index]
+        return TierChangeResponse(
+            old_xp=old_xp,
+            new_xp=new_xp,
+            old_main_tier_name=old_row.main_tier_name,
+            new_main_tier_name=new_row.main_tier_name,
+            old_sub_tier_name=old_row.sub_tier_name,
+            new_sub_tier_name=new_row.sub_tier_name,
+            old_prestige_level=old_prestige,
+            new_prestige_level=new_prestige,
+            rank_change_type=rank_change_type,
+            prestige_change=old_prestige != new_prestige,
+        )
+
+    def changes(self, pairs: Iterable[tuple[int, int]], *, only_rank_ups: bool = False) -> list[TierChangeResponse]:
+        """Compute :meth:`change` for many ``(old_xp, new_xp)`` pairs.
+
+        Args:
+            pairs: XP transitions, e.g. from a backfill.
+            only_rank_ups: Drop results without a rank-up or prestige change.
+        """
+        change = self.change
+        results = [change(old_xp, new_xp) for old_xp, new_xp in pairs]
+        if only_rank_ups:
+            return [result for result in results if result.rank_change_type is not None or result.prestige_change]
+        return results